@@ -18,6 +18,12 @@ from apex.integration.simple_bridge import IntegratedOrchestrator
 from apex.tui.integrated_app import IntegratedTUIApp
 from apex.types import ProjectConfig
 
+try:
+    import uvloop
+except ImportError:
+    # Optional: commands run on the stdlib asyncio event loop without it
+    uvloop = None
+
 app = typer.Typer(
     name="apex",
     help="APEX v2.0 - Adversarial Pair EXecution for AI-powered development",
@@ -30,7 +36,10 @@ console = Console()
 def _run_async(coro):
     """Run async functions in CLI commands."""
     try:
-        return asyncio.run(coro)
+        # Use uvloop's event loop when it is installed
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled by user[/yellow]")
         raise typer.Exit(1) from None
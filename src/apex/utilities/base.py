@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import re
+import shlex
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
@@ -11,6 +15,27 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+# Per event loop, since asyncio primitives bind to the loop they first wait on
+_subprocess_slots: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+# Characters that need a shell to interpret a command line
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`\\\"'*?\[\]#~\n]")
+
+
+def subprocess_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent utility subprocesses.
+
+    The limit is read from ``APEX_MAX_SUBPROCS`` and defaults to the CPU count.
+    """
+    loop = asyncio.get_running_loop()
+    slots = _subprocess_slots.get(loop)
+    if slots is None:
+        limit = int(os.getenv("APEX_MAX_SUBPROCS", os.cpu_count() or 4))
+        slots = _subprocess_slots[loop] = asyncio.Semaphore(limit)
+    return slots
+
 
 class UtilityCategory(Enum):
     """Categories of utilities in the framework."""
@@ -205,9 +230,15 @@ class BaseUtility(ABC):
 
 
 class CommandUtility(BaseUtility):
-    """Utility that executes shell commands."""
+    """Utility that executes shell commands.
+
+    With ``shell=None`` the formatted command runs through the shell only if
+    it uses shell syntax, and is exec'd directly otherwise.
+    """
 
-    def __init__(self, config: UtilityConfig, command: str, shell: bool = False):
+    def __init__(
+        self, config: UtilityConfig, command: str, shell: Optional[bool] = False
+    ):
         super().__init__(config)
         self.command = command
         self.shell = shell
@@ -222,24 +253,30 @@ class CommandUtility(BaseUtility):
 
             self.logger.info(f"Executing command: {formatted_command}")
 
-            # Execute command
-            if self.shell:
-                process = await asyncio.create_subprocess_shell(
-                    formatted_command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env={**context.get("env", {}), **self.config.environment_variables},
-                )
-            else:
-                args = formatted_command.split()
-                process = await asyncio.create_subprocess_exec(
-                    *args,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env={**context.get("env", {}), **self.config.environment_variables},
-                )
+            shell = self.shell
+            if shell is None:
+                shell = bool(_SHELL_SYNTAX.search(formatted_command))
 
-            stdout, stderr = await process.communicate()
+            # Execute command
+            env = self._command_env(context)
+            async with subprocess_slots():
+                if shell:
+                    process = await asyncio.create_subprocess_shell(
+                        formatted_command,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=env,
+                    )
+                else:
+                    args = shlex.split(formatted_command)
+                    process = await asyncio.create_subprocess_exec(
+                        *args,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=env,
+                    )
+
+                stdout, stderr = await process.communicate()
 
             result.output = {
                 "command": formatted_command,
@@ -265,6 +302,18 @@ class CommandUtility(BaseUtility):
 
         return result
 
+    def _command_env(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Build the command environment.
+
+        The parent environment is inherited so tools find PATH and HOME, and
+        with them their on-disk caches and settings such as ``UV_NO_SYNC``.
+        """
+        return {
+            **os.environ,
+            **context.get("env", {}),
+            **self.config.environment_variables,
+        }
+
     def _format_command(self, context: Dict[str, Any]) -> str:
         """Format command with context variables."""
         formatted = self.command
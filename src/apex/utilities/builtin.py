@@ -3,9 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import fnmatch
+import functools
+import hashlib
+import io
+import itertools
 import json
+import os
+import re
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import blake3
+except ImportError:
+    # Optional: file digests fall back to hashlib SHA-256 without it
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: scanner reports are parsed with the stdlib json module without it
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:
+    # Optional: GitManagerUtility falls back to the git CLI without it
+    pygit2 = None
 
 from .base import (
     BaseUtility,
@@ -13,8 +42,744 @@ from .base import (
     UtilityCategory,
     UtilityConfig,
     UtilityResult,
+    subprocess_slots,
 )
 
+# Anthropic API clients, one per event loop since connections are loop-bound
+_api_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+    weakref.WeakKeyDictionary()
+)
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_SUFFIX_GLOB = re.compile(r"\*(\.[^.*?\[/]+)")
+
+# Full commit hash in a `git commit` summary line: "[branch <hash>] subject"
+_COMMIT_SUMMARY_HASH = re.compile(r"\[.*? ([0-9a-f]{40}(?:[0-9a-f]{24})?)\] ")
+
+# A `git diff --numstat` record: added, deleted, path (counts are "-" for binaries)
+_NUMSTAT_LINE = re.compile(r"^(?:\d+|-)\t(?:\d+|-)\t")
+
+# Files above this size are scanned in chunks, not read whole, during collection
+_LAZY_READ_THRESHOLD = 256 * 1024
+_READ_CHUNK_SIZE = 1024 * 1024
+# Leading bytes checked for NUL when telling binary files from text
+_BINARY_SNIFF_SIZE = 1024
+# Files described per I/O job during Archivist content collection, at most
+_DESCRIBE_BATCH = 32
+# Reads are I/O-bound, so the pool is sized for disk queue depth, not CPUs
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_io_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+# Commit message prompt. The prefix is identical for every call so it can be
+# served from the prompt cache; the style, status and diff follow it.
+_COMMIT_PROMPT_PREFIX = """
+Generate a commit message for the changes below in the requested style.
+
+Style guidelines:
+- conventional: Use conventional commit format (type(scope): description)
+- descriptive: Clear, descriptive message explaining what changed
+- concise: Brief but informative message
+
+Generate only the commit message, no additional text or explanation.
+"""
+_COMMIT_PROMPT_STATUS = """
+Style: {style}
+
+Git status:
+"""
+_COMMIT_PROMPT_DIFF = """
+
+Git diff:
+"""
+
+
+# Instruction for merging summaries of content that was sent in chunks
+_SUMMARY_MERGE_PROMPT = """
+The project content was too large for a single request, so it was summarized
+in {count} parts. Combine the partial summaries below into one summary that
+follows these instructions:
+{prompt}
+"""
+
+# Archivist instructions, keyed by summary type
+_SUMMARY_PROMPTS: Dict[str, str] = {
+    "code_overview": """
+Analyze this codebase and provide a comprehensive code overview. Include:
+1. Main components and their purposes
+2. Architecture patterns used
+3. Key classes and functions
+4. Dependencies and integrations
+5. Code quality observations
+6. Suggested improvements
+
+Be concise but thorough. Focus on the most important aspects.
+""",
+    "documentation": """
+Generate comprehensive documentation for this codebase. Include:
+1. Project purpose and overview
+2. Setup and installation instructions
+3. Usage examples
+4. API documentation for key components
+5. Configuration options
+6. Troubleshooting guide
+
+Structure it as proper documentation with clear sections.
+""",
+    "changes": """
+Analyze this codebase and summarize recent changes and evolution. Include:
+1. Major architectural changes
+2. New features added
+3. Improvements and optimizations
+4. Bug fixes and stability improvements
+5. Deprecated or removed functionality
+6. Migration notes if applicable
+
+Focus on what has changed and why.
+""",
+    "architecture": """
+Provide a detailed architectural analysis of this codebase. Include:
+1. Overall system architecture
+2. Component relationships and data flow
+3. Design patterns employed
+4. Scalability considerations
+5. Security architecture
+6. Performance characteristics
+7. Areas for architectural improvement
+
+Be technical and specific about architectural decisions.
+""",
+}
+
+# Accepted configuration values, checked by validate_config
+_VALID_TEST_FRAMEWORKS = frozenset({"pytest", "unittest"})
+_VALID_DOC_TOOLS = frozenset({"mkdocs", "sphinx"})
+_VALID_DEPLOY_STRATEGIES = frozenset({"direct", "blue_green", "canary"})
+_VALID_SUMMARY_TYPES = frozenset(_SUMMARY_PROMPTS)
+_VALID_COMMIT_STYLES = frozenset({"conventional", "descriptive", "concise"})
+_VALID_BRANCH_STRATEGIES = frozenset({"feature", "hotfix", "release", "main"})
+
+
+def _compile_globs(patterns: List[str]) -> Optional[re.Pattern[str]]:
+    """Compile glob patterns into a single alternation regex."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_excludes(patterns: Tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile exclude patterns into one regex searched in each path name.
+
+    Plain names exclude any file or directory whose name contains them (so
+    ``venv`` also covers ``.venv`` and ``my_venv_tools``); glob patterns must
+    match the whole name. Results are cached, so repeated runs with the same
+    configuration reuse the compiled regex.
+    """
+    parts = [
+        rf"\A(?:{fnmatch.translate(p)})" if _GLOB_CHARS.search(p) else re.escape(p)
+        for p in patterns
+    ]
+    return re.compile("|".join(parts)) if parts else None
+
+
+@functools.lru_cache(maxsize=32)
+def _split_include_globs(
+    patterns: Tuple[str, ...],
+) -> Tuple[Tuple[str, ...], Optional[re.Pattern[str]]]:
+    """Split ``*.ext`` patterns into suffixes, compiling the rest as globs.
+
+    The suffixes are returned as a tuple for ``str.endswith``, which matches
+    exactly what the glob would, including names such as ``.py``. Results
+    are cached like those of ``_compile_excludes``.
+    """
+    suffixes = []
+    residual = []
+    for pattern in patterns:
+        match = _SUFFIX_GLOB.fullmatch(pattern)
+        if match:
+            suffixes.append(match.group(1))
+        else:
+            residual.append(pattern)
+    return tuple(dict.fromkeys(suffixes)), _compile_globs(residual)
+
+
+def _walk_files(
+    root: str, exclude_re: Optional[re.Pattern[str]]
+) -> Iterator[os.DirEntry]:
+    """Yield file entries under root, pruning excluded names at each level.
+
+    Directories are visited depth-first from an explicit stack, so entries are
+    not passed up through one generator frame per level of nesting.
+    """
+    pending = [root]
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    name = entry.name
+                    if exclude_re is not None and exclude_re.search(name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        # Reversed so the first subdirectory is walked next, as in recursion
+        pending.extend(reversed(subdirs))
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _scan_file(path: str) -> Tuple[int, str]:
+    """Count lines and digest a file in one chunked pass.
+
+    The file is never decoded or held in memory whole. The digest matches
+    ``_bytes_digest`` of its contents.
+    """
+    hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            hasher.update(chunk)
+            lines += chunk.count(b"\n")
+            last = chunk
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return lines, hasher.hexdigest()
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes as text-mode ``open()`` would, ignoring bad UTF-8."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        # Universal newlines, as in text mode
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _bytes_digest(data: bytes) -> str:
+    """Hex digest of in-memory bytes: BLAKE3 when available, else SHA-256."""
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _is_binary(path: str) -> bool:
+    """Check whether a file looks binary, i.e. starts with a NUL byte."""
+    with open(path, "rb") as f:
+        return b"\0" in f.read(_BINARY_SNIFF_SIZE)
+
+
+def _describe_file(
+    path: str, max_size: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Collect an Archivist file entry: size in bytes, line count and digest.
+
+    Only metadata is kept; the body is read at format time, and only if it
+    fits the chunk budget. Files over ``max_size`` bytes are recorded by size
+    alone, without being read. Returns None for binary files.
+    """
+    file_size = os.stat(path).st_size
+    if max_size is not None and file_size > max_size:
+        # Can never fit a chunk, so skip reading, counting and hashing it
+        if _is_binary(path):
+            return None
+        return {"source_path": path, "size": file_size}
+
+    if file_size > _LAZY_READ_THRESHOLD:
+        if _is_binary(path):
+            return None
+        # Large file: scan it in chunks instead of loading it
+        line_count, digest = _scan_file(path)
+        return {
+            "source_path": path,
+            "size": file_size,
+            "lines": line_count,
+            "digest": digest,
+        }
+
+    # Small file: one read yields size, lines and digest
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"\0" in data[:_BINARY_SNIFF_SIZE]:
+        return None
+
+    line_count = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        line_count += 1
+
+    return {
+        "source_path": path,
+        "size": len(data),
+        "lines": line_count,
+        "digest": _bytes_digest(data),
+    }
+
+
+def _get_io_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the thread pool used for Archivist file reads, creating it lazily."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_IO_WORKERS, thread_name_prefix="apex-io"
+        )
+    return _io_executor
+
+
+def _describe_files(
+    paths: List[str], max_size: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Describe a batch of files, with None for any that are binary or unreadable."""
+    file_infos = []
+    for path in paths:
+        try:
+            file_infos.append(_describe_file(path, max_size))
+        except Exception:
+            file_infos.append(None)
+    return file_infos
+
+
+def _write_text(path: Path, *parts: str) -> None:
+    """Write text parts to a UTF-8 file in one call."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+
+
+@functools.lru_cache(maxsize=32)
+def _summary_heading(summary_type: str) -> str:
+    """Markdown title line for a stored summary of the given type."""
+    return f"# {summary_type.replace('_', ' ').title()} Summary\n\n"
+
+
+def _commit_type_for_path(path: str) -> str:
+    """Guess a conventional commit type from a changed file's path."""
+    if path.startswith(".github/"):
+        return "ci"
+    if path.startswith(("docs/", "doc/")) or path.endswith((".md", ".rst")):
+        return "docs"
+    name = os.path.basename(path)
+    if path.startswith(("tests/", "test/")) or name.startswith("test_"):
+        return "test"
+    return "chore"
+
+
+def _porcelain_from_pygit2(status: Dict[str, int]) -> str:
+    """Render a pygit2 status mapping in ``git status --porcelain`` format."""
+    index_codes = (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    )
+    worktree_codes = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    )
+
+    lines = []
+    for path, flags in sorted(status.items()):
+        if flags & pygit2.GIT_STATUS_IGNORED:
+            continue
+        if flags == pygit2.GIT_STATUS_WT_NEW:
+            lines.append(f"?? {path}")
+            continue
+
+        x = next((code for flag, code in index_codes if flags & flag), " ")
+        y = next((code for flag, code in worktree_codes if flags & flag), " ")
+        lines.append(f"{x}{y} {path}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _porcelain_from_v2(data: bytes) -> str:
+    """Render ``git status --porcelain=v2 -z`` records in ``--porcelain`` format.
+
+    Records are split on NUL and dispatched on their first byte, so paths need
+    no unquoting and only the paths themselves are decoded.
+    """
+    lines = []
+    records = iter(data.split(b"\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == b"1":
+            xy, path = record[2:4], record.split(b" ", 8)[8]
+        elif kind == b"2":
+            # Renamed or copied: the original path is the next record
+            xy, path = record[2:4], record.split(b" ", 9)[9]
+            path = next(records, b"") + b" -> " + path
+        elif kind == b"u":
+            xy, path = record[2:4], record.split(b" ", 10)[10]
+        elif kind == b"?":
+            xy, path = b"??", record[2:]
+        else:
+            continue
+
+        code = xy.replace(b".", b" ").decode("ascii")
+        lines.append(f"{code} {path.decode('utf-8', errors='replace')}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+class _ClaudeSession:
+    """A long-lived ``claude`` CLI process that takes prompts over stdin.
+
+    Prompts are sent as stream-json user messages and answered with the
+    ``result`` event of each turn, so process startup and auth are paid once.
+    The CLI keeps conversation history, so a session is retired after a
+    bounded number of turns or prompt characters. Callers can record shared
+    content already sent in ``context`` and avoid sending it again; the pool
+    only hands a session out again for that same content.
+    """
+
+    MAX_TURNS = 8
+    MAX_PROMPT_CHARS = 400_000
+
+    def __init__(self, model: str):
+        self.model = model
+        self.turns = 0
+        self.prompt_chars = 0
+        self.context: Any = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the session can take another prompt."""
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and self.turns < self.MAX_TURNS
+            and self.prompt_chars < self.MAX_PROMPT_CHARS
+        )
+
+    async def ask(self, *parts: str, cache_through: Optional[int] = None) -> str:
+        """Send one prompt, given as consecutive text parts, and return the reply.
+
+        If ``cache_through`` is set, the part at that index is marked as the end
+        of a cacheable prompt prefix, so identical leading parts are read from
+        the prompt cache on later calls.
+        """
+        async with subprocess_slots():
+            if self._process is None:
+                # A new process starts a new conversation
+                self.context = None
+                self._process = await asyncio.create_subprocess_exec(
+                    "claude",
+                    "-p",
+                    "--input-format",
+                    "stream-json",
+                    "--output-format",
+                    "stream-json",
+                    "--verbose",
+                    "--model",
+                    self.model,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    limit=16 * 1024 * 1024,
+                )
+
+            # Write the message envelope around each part so the parts are never
+            # concatenated into one prompt string
+            stdin = self._process.stdin
+            stdin.write(b'{"type":"user","message":{"role":"user","content":[')
+            for index, part in enumerate(parts):
+                if index:
+                    stdin.write(b",")
+                stdin.write(b'{"type":"text","text":')
+                stdin.write(_dumps_json(part))
+                if index == cache_through:
+                    stdin.write(b',"cache_control":{"type":"ephemeral"}')
+                stdin.write(b"}")
+                await stdin.drain()
+            stdin.write(b"]}}\n")
+            await stdin.drain()
+
+            self.turns += 1
+            self.prompt_chars += sum(len(part) for part in parts)
+
+            while line := await self._process.stdout.readline():
+                try:
+                    event = _loads_json(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("type") != "result":
+                    continue
+                if event.get("is_error") or event.get("subtype") != "success":
+                    raise Exception(
+                        f"Claude CLI turn failed: {event.get('result', '')}"
+                    )
+                return event.get("result", "")
+
+            await self._process.wait()
+            raise Exception(
+                f"Claude CLI session exited with code {self._process.returncode}"
+            )
+
+    async def close(self) -> None:
+        """Terminate the underlying process."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+@functools.lru_cache(maxsize=None)
+def _import_anthropic() -> Optional[Any]:
+    """Import the ``anthropic`` package on first use, or None if missing.
+
+    The SDK is slow to import, so it is only loaded once an API key makes it
+    usable.
+    """
+    try:
+        import anthropic
+    except ImportError:
+        # Optional: Claude prompts go through the claude CLI without it
+        return None
+    return anthropic
+
+
+def _api_client() -> Optional[Any]:
+    """Get the shared Anthropic API client, or None to use the claude CLI.
+
+    The API is used when the ``anthropic`` package is installed and
+    ``ANTHROPIC_API_KEY`` is set.
+    """
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        return None
+    anthropic = _import_anthropic()
+    if anthropic is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    client = _api_clients.get(loop)
+    if client is None:
+        client = _api_clients[loop] = anthropic.AsyncAnthropic()
+    return client
+
+
+class _ClaudeAPISession:
+    """Sends prompts through a shared Anthropic API client.
+
+    Mirrors the ``_ClaudeSession`` interface; each prompt is a standalone
+    request, so the session is always reusable and holds no resources. A new
+    instance is handed out per checkout, so ``context`` never carries over.
+    """
+
+    reusable = True
+    context: Any = None
+
+    def __init__(
+        self, client: Any, model: str, max_tokens: int, temperature: Optional[float]
+    ):
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+
+    async def ask(self, *parts: str, cache_through: Optional[int] = None) -> str:
+        """Send one prompt, given as consecutive text parts, and return the reply."""
+        content = []
+        for index, part in enumerate(parts):
+            # The API rejects empty text blocks
+            if not part:
+                continue
+            block = {"type": "text", "text": part}
+            if index == cache_through:
+                block["cache_control"] = {"type": "ephemeral"}
+            content.append(block)
+
+        options = {}
+        if self.temperature is not None:
+            options["temperature"] = self.temperature
+
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            messages=[{"role": "user", "content": content}],
+            **options,
+        )
+        return "".join(block.text for block in response.content if block.type == "text")
+
+    async def close(self) -> None:
+        """Nothing to release; the client is shared."""
+
+
+class _ClaudeSessionPool:
+    """Reuses Claude sessions for one model across the prompts of an execution.
+
+    A CLI session keeps its whole conversation, so sessions are pooled by the
+    content they were given: a conversation only ever holds prompts about one
+    ``context``, and prompts without one get a fresh conversation. Sessions
+    are checked out exclusively, so concurrent prompts each get their own
+    process; all processes are closed when the pool exits. When the Anthropic
+    API is available, sessions share its client instead.
+    """
+
+    def __init__(
+        self, model: str, max_tokens: int = 1024, temperature: Optional[float] = None
+    ):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self._idle: Dict[str, List[_ClaudeSession]] = {}
+
+    async def __aenter__(self) -> _ClaudeSessionPool:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        idle, self._idle = self._idle, {}
+        await asyncio.gather(
+            *(session.close() for sessions in idle.values() for session in sessions)
+        )
+
+    @contextlib.asynccontextmanager
+    async def session(
+        self, context: Optional[str] = None
+    ) -> AsyncIterator[_ClaudeSession | _ClaudeAPISession]:
+        """Check out a session for prompts about ``context``.
+
+        An idle session whose conversation holds the same content is reused;
+        otherwise a new one is started. Sessions checked out without a context
+        are closed after use.
+        """
+        client = _api_client()
+        if client is not None:
+            yield _ClaudeAPISession(
+                client, self.model, self.max_tokens, self.temperature
+            )
+            return
+
+        idle = self._idle.get(context) if context is not None else None
+        session = idle.pop() if idle else _ClaudeSession(self.model)
+
+        try:
+            yield session
+        except BaseException:
+            # The process may be mid-turn; never hand it out again
+            await session.close()
+            raise
+
+        if context is not None and session.reusable:
+            self._idle.setdefault(context, []).append(session)
+        else:
+            await session.close()
+
+
+async def _ask_claude_once(
+    model: str,
+    *parts: str,
+    max_tokens: int = 1024,
+    temperature: Optional[float] = None,
+    cache_through: Optional[int] = None,
+) -> str:
+    """Send a single prompt in its own conversation and return the reply."""
+    client = _api_client()
+    if client is not None:
+        session = _ClaudeAPISession(client, model, max_tokens, temperature)
+    else:
+        session = _ClaudeSession(model)
+
+    try:
+        return await session.ask(*parts, cache_through=cache_through)
+    finally:
+        await session.close()
+
+
+class _CommitMessageCache:
+    """Generated commit messages keyed by a hash of the style and diff.
+
+    Entries live in an append-only JSONL file that is loaded lazily on first
+    use and compacted to the most recent ``max_entries`` once it grows.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 128):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: Optional[Dict[str, str]] = None
+        self._lines = 0
+
+    @staticmethod
+    def key(style: str, diff_output: str) -> str:
+        """Cache key for a message generated in ``style`` for ``diff_output``."""
+        data = f"{style}\x00{diff_output}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _load(self) -> Dict[str, str]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        self._lines += 1
+                        try:
+                            record = json.loads(line)
+                            self._remember(record["key"], record["message"])
+                        except (ValueError, KeyError, TypeError):
+                            continue
+            except OSError:
+                pass
+        return self._entries
+
+    def _remember(self, key: str, message: str) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = message
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached message for ``key``, if any."""
+        message = self._load().get(key)
+        if message is not None:
+            self._remember(key, message)
+        return message
+
+    def put(self, key: str, message: str) -> None:
+        """Store a message; failures to persist it are ignored."""
+        self._load()
+        self._remember(key, message)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._lines >= 2 * self.max_entries:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    for cached_key, cached_message in self._entries.items():
+                        record = {"key": cached_key, "message": cached_message}
+                        f.write(json.dumps(record) + "\n")
+                self._lines = len(self._entries)
+            else:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"key": key, "message": message}) + "\n")
+                self._lines += 1
+        except OSError:
+            pass
+
 
 class CodeLinterUtility(CommandUtility):
     """Utility for running code linters."""
@@ -127,14 +892,15 @@ class TestRunnerUtility(BaseUtility):
                 return result
 
             # Execute tests
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            async with subprocess_slots():
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    cwd=project_dir,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
 
-            stdout, stderr = await process.communicate()
+                stdout, stderr = await process.communicate()
 
             result.output = {
                 "command": " ".join(cmd),
@@ -212,3162 +978,325 @@ class TestRunnerUtility(BaseUtility):
         errors = []
 
         framework = self.config.parameters.get("test_framework")
-        if framework and framework not in ["pytest", "unittest"]:
+        if framework and framework not in _VALID_TEST_FRAMEWORKS:
             errors.append(f"Unsupported test framework: {framework}")
 
         return errors
 
 
-class ArchivistUtility(BaseUtility):
-    """Utility for content summarization using direct API calls."""
+class DocumentationGeneratorUtility(BaseUtility):
+    """Utility for generating documentation."""
 
     @classmethod
     def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
         return UtilityConfig(
             name=name,
             category=category,
-            description="Summarize and archive project content using Claude API",
+            description="Generate project documentation",
             parameters={
-                "model": "claude-3-5-sonnet-20241022",
-                "max_tokens": 4000,
-                "temperature": 0.1,
-                "include_patterns": [
-                    "*.py",
-                    "*.md",
-                    "*.txt",
-                    "*.json",
-                    "*.yaml",
-                    "*.yml",
-                ],
-                "exclude_patterns": [
-                    "*.pyc",
-                    "__pycache__",
-                    ".git",
-                    "node_modules",
-                    "venv",
-                    ".env",
-                ],
-                "summary_types": [
-                    "code_overview",
-                    "documentation",
-                    "changes",
-                    "architecture",
-                ],
-                "chunk_size": 100000,  # characters per chunk
+                "tool": "mkdocs",
+                "config_file": "mkdocs.yml",
+                "output_dir": "docs/",
+                "auto_generate": True,
             },
-            timeout_seconds=300,
+            timeout_seconds=180,
         )
 
     async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute content summarization."""
+        """Generate documentation."""
         result = self.create_result()
 
         try:
             project_dir = context.get("project_dir", ".")
-            summary_types = self.config.parameters.get(
-                "summary_types", ["code_overview"]
-            )
-
-            # Collect project content
-            content = await self._collect_project_content(project_dir)
-
-            if not content:
-                result.add_warning("No content found to summarize")
-                result.set_completed(True)
-                return result
-
-            # Generate summaries for each requested type
-            summaries = {}
-
-            for summary_type in summary_types:
-                try:
-                    summary = await self._generate_summary(content, summary_type)
-                    summaries[summary_type] = summary
-                except Exception as e:
-                    result.add_error(
-                        f"Failed to generate {summary_type} summary: {str(e)}"
-                    )
-
-            result.output["summaries"] = summaries
-            result.metadata["content_size"] = len(str(content))
-            result.metadata["summary_count"] = len(summaries)
-
-            # Store summaries as artifacts
-            await self._store_summaries(summaries, project_dir, result)
+            tool = self.config.parameters.get("tool", "mkdocs")
+            auto_generate = self.config.parameters.get("auto_generate", True)
 
-            result.set_completed(len(summaries) > 0)
+            if tool == "mkdocs":
+                await self._generate_mkdocs(result, project_dir, auto_generate)
+            else:
+                result.add_error(f"Unsupported documentation tool: {tool}")
+                result.set_completed(False)
 
         except Exception as e:
-            result.add_error(f"Content summarization failed: {str(e)}")
+            result.add_error(f"Documentation generation failed: {str(e)}")
             result.set_completed(False)
 
         return result
 
-    async def _collect_project_content(self, project_dir: str) -> Dict[str, Any]:
-        """Collect relevant project content."""
+    async def _generate_mkdocs(
+        self, result: UtilityResult, project_dir: str, auto_generate: bool
+    ):
+        """Generate MkDocs documentation."""
         project_path = Path(project_dir)
-        include_patterns = self.config.parameters.get("include_patterns", ["*.py"])
-        exclude_patterns = self.config.parameters.get("exclude_patterns", [])
-
-        content = {
-            "files": {},
-            "structure": [],
-            "metadata": {
-                "project_name": project_path.name,
-                "total_files": 0,
-                "total_size": 0,
-            },
-        }
+        config_file = project_path / self.config.parameters.get(
+            "config_file", "mkdocs.yml"
+        )
 
-        def should_include(file_path: Path) -> bool:
-            """Check if file should be included."""
-            # Check exclude patterns first
-            for pattern in exclude_patterns:
-                if pattern in str(file_path):
-                    return False
+        if auto_generate and not config_file.exists():
+            # Auto-generate basic mkdocs.yml
+            mkdocs_config = {
+                "site_name": project_path.name,
+                "theme": {"name": "material"},
+                "nav": [
+                    {"Home": "index.md"},
+                    {"API": "api.md"},
+                ],
+            }
 
-            # Check include patterns
-            for pattern in include_patterns:
-                if file_path.match(pattern):
-                    return True
+            with open(config_file, "w") as f:
+                import yaml
 
-            return False
+                yaml.dump(mkdocs_config, f)
 
-        # Collect file content and structure
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and should_include(file_path):
-                try:
-                    relative_path = file_path.relative_to(project_path)
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        file_content = f.read()
-
-                    content["files"][str(relative_path)] = {
-                        "content": file_content,
-                        "size": len(file_content),
-                        "lines": len(file_content.splitlines()),
-                    }
-
-                    content["structure"].append(
-                        {
-                            "path": str(relative_path),
-                            "size": len(file_content),
-                            "type": file_path.suffix,
-                        }
-                    )
+            result.add_artifact(str(config_file))
 
-                    content["metadata"]["total_files"] += 1
-                    content["metadata"]["total_size"] += len(file_content)
+            # Create basic documentation files
+            docs_dir = project_path / "docs"
+            docs_dir.mkdir(exist_ok=True)
 
-                except Exception:
-                    # Skip files that can't be read
-                    continue
+            # Create index.md
+            index_path = docs_dir / "index.md"
+            if not index_path.exists():
+                with open(index_path, "w") as f:
+                    f.write(f"# {project_path.name}\n\nProject documentation.\n")
+                result.add_artifact(str(index_path))
 
-        return content
+        # Build documentation
+        cmd = ["mkdocs", "build"]
+        async with subprocess_slots():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-    async def _generate_summary(
-        self, content: Dict[str, Any], summary_type: str
-    ) -> str:
-        """Generate summary using Claude API via CLI."""
-        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        temperature = self.config.parameters.get("temperature", 0.1)
+            stdout, stderr = await process.communicate()
 
-        # Create prompt based on summary type
-        prompts = {
-            "code_overview": """
-Analyze this codebase and provide a comprehensive code overview. Include:
-1. Main components and their purposes
-2. Architecture patterns used
-3. Key classes and functions
-4. Dependencies and integrations
-5. Code quality observations
-6. Suggested improvements
-
-Be concise but thorough. Focus on the most important aspects.
-""",
-            "documentation": """
-Generate comprehensive documentation for this codebase. Include:
-1. Project purpose and overview
-2. Setup and installation instructions
-3. Usage examples
-4. API documentation for key components
-5. Configuration options
-6. Troubleshooting guide
-
-Structure it as proper documentation with clear sections.
-""",
-            "changes": """
-Analyze this codebase and summarize recent changes and evolution. Include:
-1. Major architectural changes
-2. New features added
-3. Improvements and optimizations
-4. Bug fixes and stability improvements
-5. Deprecated or removed functionality
-6. Migration notes if applicable
-
-Focus on what has changed and why.
-""",
-            "architecture": """
-Provide a detailed architectural analysis of this codebase. Include:
-1. Overall system architecture
-2. Component relationships and data flow
-3. Design patterns employed
-4. Scalability considerations
-5. Security architecture
-6. Performance characteristics
-7. Areas for architectural improvement
-
-Be technical and specific about architectural decisions.
-""",
-        }
-
-        prompt = prompts.get(summary_type, prompts["code_overview"])
-
-        # Prepare content for API
-        content_text = self._format_content_for_api(content)
-
-        # Create temporary file with content
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(f"{prompt}\n\n--- PROJECT CONTENT ---\n\n{content_text}")
-            temp_file = f.name
-
-        try:
-            # Use Claude CLI to generate summary
-            cmd = [
-                "claude",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--temperature",
-                str(temperature),
-                "--file",
-                temp_file,
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0 and stdout:
-                summary = stdout.decode("utf-8").strip()
-                return summary
-            else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-                raise Exception(f"Claude API call failed: {error_msg}")
-
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
-
-    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
-        """Format content for API consumption."""
-        chunk_size = self.config.parameters.get("chunk_size", 100000)
-
-        formatted_parts = []
-
-        # Add project metadata
-        metadata = content.get("metadata", {})
-        formatted_parts.append(f"PROJECT: {metadata.get('project_name', 'Unknown')}")
-        formatted_parts.append(f"Files: {metadata.get('total_files', 0)}")
-        formatted_parts.append(
-            f"Total Size: {metadata.get('total_size', 0)} characters"
-        )
-        formatted_parts.append("")
-
-        # Add project structure
-        structure = content.get("structure", [])
-        if structure:
-            formatted_parts.append("PROJECT STRUCTURE:")
-            for item in structure[:50]:  # Limit structure items
-                formatted_parts.append(f"  {item['path']} ({item['size']} chars)")
-            formatted_parts.append("")
-
-        # Add file contents (chunked if necessary)
-        files = content.get("files", {})
-        current_size = len("\n".join(formatted_parts))
-
-        formatted_parts.append("FILE CONTENTS:")
-        for file_path, file_info in files.items():
-            file_content = file_info["content"]
-
-            # Check if adding this file would exceed chunk size
-            if current_size + len(file_content) > chunk_size:
-                formatted_parts.append(
-                    "\n[Content truncated - too large for single API call]"
-                )
-                break
-
-            formatted_parts.append(f"\n--- {file_path} ---")
-            formatted_parts.append(file_content)
-            current_size += len(file_content) + len(file_path) + 10
-
-        return "\n".join(formatted_parts)
-
-    async def _store_summaries(
-        self, summaries: Dict[str, str], project_dir: str, result: UtilityResult
-    ):
-        """Store generated summaries as artifacts."""
-        project_path = Path(project_dir)
-        summaries_dir = project_path / ".apex" / "summaries"
-        summaries_dir.mkdir(parents=True, exist_ok=True)
-
-        for summary_type, summary_content in summaries.items():
-            summary_file = summaries_dir / f"{summary_type}_summary.md"
-
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(f"# {summary_type.replace('_', ' ').title()} Summary\n\n")
-                f.write("Generated by APEX Archivist Utility\n")
-                f.write(f"Date: {result.started_at}\n\n")
-                f.write("---\n\n")
-                f.write(summary_content)
-
-            result.add_artifact(str(summary_file))
-
-    def validate_config(self) -> List[str]:
-        """Validate archivist utility configuration."""
-        errors = []
-
-        model = self.config.parameters.get("model")
-        if model and not model.startswith("claude-"):
-            errors.append(f"Unsupported model: {model}")
-
-        summary_types = self.config.parameters.get("summary_types", [])
-        valid_types = ["code_overview", "documentation", "changes", "architecture"]
-
-        for summary_type in summary_types:
-            if summary_type not in valid_types:
-                errors.append(f"Unsupported summary type: {summary_type}")
-
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        if max_tokens > 8192:
-            errors.append("max_tokens cannot exceed 8192")
-
-        return errors
-
-
-class GitManagerUtility(BaseUtility):
-    """Utility for intelligent Git operations and commit generation."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Intelligent Git operations with AI-generated commit messages",
-            parameters={
-                "auto_stage": True,
-                "generate_commit_message": True,
-                "commit_message_style": "conventional",  # conventional, descriptive, concise
-                "max_diff_size": 50000,  # characters
-                "include_file_changes": True,
-                "branch_strategy": "feature",  # feature, hotfix, release
-                "push_after_commit": False,
-            },
-            timeout_seconds=120,
-            required_tools=["git"],
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute Git operations."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            operation = context.get(
-                "operation", "commit"
-            )  # commit, status, branch, push
-
-            # Check if we're in a Git repository
-            if not await self._is_git_repo(project_dir):
-                result.add_error("Not a Git repository")
-                result.set_completed(False)
-                return result
-
-            if operation == "commit":
-                success = await self._handle_commit(project_dir, result)
-            elif operation == "status":
-                success = await self._handle_status(project_dir, result)
-            elif operation == "branch":
-                success = await self._handle_branch(project_dir, result, context)
-            elif operation == "push":
-                success = await self._handle_push(project_dir, result)
-            else:
-                result.add_error(f"Unsupported Git operation: {operation}")
-                success = False
-
-            result.set_completed(success)
-
-        except Exception as e:
-            result.add_error(f"Git operation failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _is_git_repo(self, project_dir: str) -> bool:
-        """Check if directory is a Git repository."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--git-dir",
-                cwd=project_dir,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.communicate()
-            return process.returncode == 0
-        except:
-            return False
-
-    async def _handle_commit(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git commit with intelligent message generation."""
-        try:
-            # Get current status
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-
-            if not status_output.strip():
-                result.add_warning("No changes to commit")
-                return True
-
-            # Stage files if auto_stage is enabled
-            if self.config.parameters.get("auto_stage", True):
-                await self._run_git_command(["git", "add", "."], project_dir)
-
-            # Get diff for commit message generation
-            diff_output = await self._run_git_command(
-                ["git", "diff", "--cached"], project_dir
-            )
-
-            if not diff_output.strip():
-                result.add_warning("No staged changes to commit")
-                return True
-
-            # Generate commit message
-            commit_message = await self._generate_commit_message(
-                diff_output, status_output
-            )
-
-            # Commit changes
-            commit_output = await self._run_git_command(
-                ["git", "commit", "-m", commit_message], project_dir
-            )
-
-            result.output["commit"] = {
-                "message": commit_message,
-                "output": commit_output,
-                "files_changed": len(
-                    [line for line in status_output.split("\n") if line.strip()]
-                ),
-            }
-
-            # Get commit hash
-            commit_hash = await self._run_git_command(
-                ["git", "rev-parse", "HEAD"], project_dir
-            )
-            result.metadata["commit_hash"] = commit_hash.strip()
-
-            # Push if configured
-            if self.config.parameters.get("push_after_commit", False):
-                push_output = await self._run_git_command(["git", "push"], project_dir)
-                result.output["push"] = push_output
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Commit failed: {str(e)}")
-            return False
-
-    async def _handle_status(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git status check."""
-        try:
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-            branch_output = await self._run_git_command(
-                ["git", "branch", "--show-current"], project_dir
-            )
-
-            result.output["status"] = {
-                "porcelain": status_output,
-                "current_branch": branch_output.strip(),
-                "clean": not status_output.strip(),
-            }
-
-            # Parse status
-            modified_files = []
-            staged_files = []
-            untracked_files = []
-
-            for line in status_output.split("\n"):
-                if line.strip():
-                    status_code = line[:2]
-                    filename = line[3:]
-
-                    if status_code[0] in ["M", "A", "D", "R", "C"]:
-                        staged_files.append(filename)
-                    if status_code[1] in ["M", "D"]:
-                        modified_files.append(filename)
-                    if status_code == "??":
-                        untracked_files.append(filename)
-
-            result.metadata["files"] = {
-                "staged": len(staged_files),
-                "modified": len(modified_files),
-                "untracked": len(untracked_files),
-            }
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Status check failed: {str(e)}")
-            return False
-
-    async def _handle_branch(
-        self, project_dir: str, result: UtilityResult, context: Dict[str, Any]
-    ) -> bool:
-        """Handle Git branch operations."""
-        try:
-            branch_operation = context.get(
-                "branch_operation", "list"
-            )  # list, create, switch, delete
-            branch_name = context.get("branch_name")
-
-            if branch_operation == "list":
-                branches_output = await self._run_git_command(
-                    ["git", "branch", "-a"], project_dir
-                )
-                result.output["branches"] = branches_output
-
-            elif branch_operation == "create" and branch_name:
-                create_output = await self._run_git_command(
-                    ["git", "branch", branch_name], project_dir
-                )
-                result.output["branch_create"] = create_output
-
-            elif branch_operation == "switch" and branch_name:
-                switch_output = await self._run_git_command(
-                    ["git", "checkout", branch_name], project_dir
-                )
-                result.output["branch_switch"] = switch_output
-
-            elif branch_operation == "delete" and branch_name:
-                delete_output = await self._run_git_command(
-                    ["git", "branch", "-d", branch_name], project_dir
-                )
-                result.output["branch_delete"] = delete_output
-
-            else:
-                result.add_error(f"Invalid branch operation: {branch_operation}")
-                return False
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Branch operation failed: {str(e)}")
-            return False
-
-    async def _handle_push(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git push operation."""
-        try:
-            push_output = await self._run_git_command(["git", "push"], project_dir)
-            result.output["push"] = push_output
-            return True
-
-        except Exception as e:
-            result.add_error(f"Push failed: {str(e)}")
-            return False
-
-    async def _run_git_command(self, cmd: List[str], project_dir: str) -> str:
-        """Run a Git command and return output."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-            raise Exception(f"Git command failed: {' '.join(cmd)} - {error_msg}")
-
-        return stdout.decode("utf-8")
-
-    async def _generate_commit_message(
-        self, diff_output: str, status_output: str
-    ) -> str:
-        """Generate intelligent commit message using Claude API."""
-        try:
-            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
-            style = self.config.parameters.get("commit_message_style", "conventional")
-
-            # Truncate diff if too large
-            if len(diff_output) > max_diff_size:
-                diff_output = diff_output[:max_diff_size] + "\n[... diff truncated ...]"
-
-            # Create prompt for commit message generation
-            prompt = f"""
-Generate a {style} commit message for the following changes.
-
-Style guidelines:
-- conventional: Use conventional commit format (type(scope): description)
-- descriptive: Clear, descriptive message explaining what changed
-- concise: Brief but informative message
-
-Git status:
-{status_output}
-
-Git diff:
-{diff_output}
-
-Generate only the commit message, no additional text or explanation.
-"""
-
-            # Use Claude CLI to generate commit message
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                f.write(prompt)
-                temp_file = f.name
-
-            try:
-                cmd = [
-                    "claude",
-                    "--model",
-                    "claude-3-5-sonnet-20241022",
-                    "--max-tokens",
-                    "200",
-                    "--temperature",
-                    "0.1",
-                    "--file",
-                    temp_file,
-                ]
-
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-
-                stdout, stderr = await process.communicate()
-
-                if process.returncode == 0 and stdout:
-                    commit_message = stdout.decode("utf-8").strip()
-                    # Clean up any unwanted formatting
-                    commit_message = commit_message.replace('"', "").replace("\n", " ")
-                    return commit_message
-                else:
-                    # Fallback to simple message
-                    return self._generate_fallback_commit_message(status_output)
-
-            finally:
-                try:
-                    Path(temp_file).unlink()
-                except:
-                    pass
-
-        except Exception:
-            # Fallback to simple message generation
-            return self._generate_fallback_commit_message(status_output)
-
-    def _generate_fallback_commit_message(self, status_output: str) -> str:
-        """Generate fallback commit message without API."""
-        lines = [line for line in status_output.split("\n") if line.strip()]
-
-        if not lines:
-            return "Update project files"
-
-        # Count different types of changes
-        added = len([line for line in lines if line.startswith("A")])
-        modified = len(
-            [line for line in lines if line.startswith("M") or line.startswith(" M")]
-        )
-        deleted = len([line for line in lines if line.startswith("D")])
-
-        # Generate message based on changes
-        if added and not modified and not deleted:
-            return f"Add {added} new file{'s' if added > 1 else ''}"
-        elif modified and not added and not deleted:
-            return f"Update {modified} file{'s' if modified > 1 else ''}"
-        elif deleted and not added and not modified:
-            return f"Remove {deleted} file{'s' if deleted > 1 else ''}"
-        else:
-            total = added + modified + deleted
-            return f"Update project: {total} file{'s' if total > 1 else ''} changed"
-
-    def validate_config(self) -> List[str]:
-        """Validate Git manager configuration."""
-        errors = []
-
-        style = self.config.parameters.get("commit_message_style")
-        if style and style not in ["conventional", "descriptive", "concise"]:
-            errors.append(f"Unsupported commit message style: {style}")
-
-        branch_strategy = self.config.parameters.get("branch_strategy")
-        if branch_strategy and branch_strategy not in [
-            "feature",
-            "hotfix",
-            "release",
-            "main",
-        ]:
-            errors.append(f"Unsupported branch strategy: {branch_strategy}")
-
-        return errors
-
-
-class DocumentationGeneratorUtility(BaseUtility):
-    """Utility for generating documentation."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Generate project documentation",
-            parameters={
-                "tool": "mkdocs",
-                "config_file": "mkdocs.yml",
-                "output_dir": "docs/",
-                "auto_generate": True,
-            },
-            timeout_seconds=180,
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Generate documentation."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            tool = self.config.parameters.get("tool", "mkdocs")
-            auto_generate = self.config.parameters.get("auto_generate", True)
-
-            if tool == "mkdocs":
-                await self._generate_mkdocs(result, project_dir, auto_generate)
-            else:
-                result.add_error(f"Unsupported documentation tool: {tool}")
-                result.set_completed(False)
-
-        except Exception as e:
-            result.add_error(f"Documentation generation failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _generate_mkdocs(
-        self, result: UtilityResult, project_dir: str, auto_generate: bool
-    ):
-        """Generate MkDocs documentation."""
-        project_path = Path(project_dir)
-        config_file = project_path / self.config.parameters.get(
-            "config_file", "mkdocs.yml"
-        )
-
-        if auto_generate and not config_file.exists():
-            # Auto-generate basic mkdocs.yml
-            mkdocs_config = {
-                "site_name": project_path.name,
-                "theme": {"name": "material"},
-                "nav": [
-                    {"Home": "index.md"},
-                    {"API": "api.md"},
-                ],
-            }
-
-            with open(config_file, "w") as f:
-                import yaml
-
-                yaml.dump(mkdocs_config, f)
-
-            result.add_artifact(str(config_file))
-
-            # Create basic documentation files
-            docs_dir = project_path / "docs"
-            docs_dir.mkdir(exist_ok=True)
-
-            # Create index.md
-            index_path = docs_dir / "index.md"
-            if not index_path.exists():
-                with open(index_path, "w") as f:
-                    f.write(f"# {project_path.name}\n\nProject documentation.\n")
-                result.add_artifact(str(index_path))
-
-        # Build documentation
-        cmd = ["mkdocs", "build"]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
-
-        result.output = {
-            "command": " ".join(cmd),
-            "return_code": process.returncode,
-            "stdout": stdout.decode("utf-8") if stdout else "",
-            "stderr": stderr.decode("utf-8") if stderr else "",
-        }
-
-        if process.returncode == 0:
-            # Count generated files
-            site_dir = project_path / "site"
-            if site_dir.exists():
-                html_files = list(site_dir.rglob("*.html"))
-                result.metadata["generated_pages"] = len(html_files)
-                result.add_artifact(str(site_dir))
-
-            result.set_completed(True)
-        else:
-            result.add_error(
-                f"MkDocs build failed: {stderr.decode('utf-8') if stderr else 'Unknown error'}"
-            )
-            result.set_completed(False)
-
-    def validate_config(self) -> List[str]:
-        """Validate documentation generator configuration."""
-        errors = []
-
-        tool = self.config.parameters.get("tool")
-        if tool and tool not in ["mkdocs", "sphinx"]:
-            errors.append(f"Unsupported documentation tool: {tool}")
-
-        return errors
-
-
-class ArchivistUtility(BaseUtility):
-    """Utility for content summarization using direct API calls."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Summarize and archive project content using Claude API",
-            parameters={
-                "model": "claude-3-5-sonnet-20241022",
-                "max_tokens": 4000,
-                "temperature": 0.1,
-                "include_patterns": [
-                    "*.py",
-                    "*.md",
-                    "*.txt",
-                    "*.json",
-                    "*.yaml",
-                    "*.yml",
-                ],
-                "exclude_patterns": [
-                    "*.pyc",
-                    "__pycache__",
-                    ".git",
-                    "node_modules",
-                    "venv",
-                    ".env",
-                ],
-                "summary_types": [
-                    "code_overview",
-                    "documentation",
-                    "changes",
-                    "architecture",
-                ],
-                "chunk_size": 100000,  # characters per chunk
-            },
-            timeout_seconds=300,
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute content summarization."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            summary_types = self.config.parameters.get(
-                "summary_types", ["code_overview"]
-            )
-
-            # Collect project content
-            content = await self._collect_project_content(project_dir)
-
-            if not content:
-                result.add_warning("No content found to summarize")
-                result.set_completed(True)
-                return result
-
-            # Generate summaries for each requested type
-            summaries = {}
-
-            for summary_type in summary_types:
-                try:
-                    summary = await self._generate_summary(content, summary_type)
-                    summaries[summary_type] = summary
-                except Exception as e:
-                    result.add_error(
-                        f"Failed to generate {summary_type} summary: {str(e)}"
-                    )
-
-            result.output["summaries"] = summaries
-            result.metadata["content_size"] = len(str(content))
-            result.metadata["summary_count"] = len(summaries)
-
-            # Store summaries as artifacts
-            await self._store_summaries(summaries, project_dir, result)
-
-            result.set_completed(len(summaries) > 0)
-
-        except Exception as e:
-            result.add_error(f"Content summarization failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _collect_project_content(self, project_dir: str) -> Dict[str, Any]:
-        """Collect relevant project content."""
-        project_path = Path(project_dir)
-        include_patterns = self.config.parameters.get("include_patterns", ["*.py"])
-        exclude_patterns = self.config.parameters.get("exclude_patterns", [])
-
-        content = {
-            "files": {},
-            "structure": [],
-            "metadata": {
-                "project_name": project_path.name,
-                "total_files": 0,
-                "total_size": 0,
-            },
-        }
-
-        def should_include(file_path: Path) -> bool:
-            """Check if file should be included."""
-            # Check exclude patterns first
-            for pattern in exclude_patterns:
-                if pattern in str(file_path):
-                    return False
-
-            # Check include patterns
-            for pattern in include_patterns:
-                if file_path.match(pattern):
-                    return True
-
-            return False
-
-        # Collect file content and structure
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and should_include(file_path):
-                try:
-                    relative_path = file_path.relative_to(project_path)
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        file_content = f.read()
-
-                    content["files"][str(relative_path)] = {
-                        "content": file_content,
-                        "size": len(file_content),
-                        "lines": len(file_content.splitlines()),
-                    }
-
-                    content["structure"].append(
-                        {
-                            "path": str(relative_path),
-                            "size": len(file_content),
-                            "type": file_path.suffix,
-                        }
-                    )
-
-                    content["metadata"]["total_files"] += 1
-                    content["metadata"]["total_size"] += len(file_content)
-
-                except Exception:
-                    # Skip files that can't be read
-                    continue
-
-        return content
-
-    async def _generate_summary(
-        self, content: Dict[str, Any], summary_type: str
-    ) -> str:
-        """Generate summary using Claude API via CLI."""
-        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        temperature = self.config.parameters.get("temperature", 0.1)
-
-        # Create prompt based on summary type
-        prompts = {
-            "code_overview": """
-Analyze this codebase and provide a comprehensive code overview. Include:
-1. Main components and their purposes
-2. Architecture patterns used
-3. Key classes and functions
-4. Dependencies and integrations
-5. Code quality observations
-6. Suggested improvements
-
-Be concise but thorough. Focus on the most important aspects.
-""",
-            "documentation": """
-Generate comprehensive documentation for this codebase. Include:
-1. Project purpose and overview
-2. Setup and installation instructions
-3. Usage examples
-4. API documentation for key components
-5. Configuration options
-6. Troubleshooting guide
-
-Structure it as proper documentation with clear sections.
-""",
-            "changes": """
-Analyze this codebase and summarize recent changes and evolution. Include:
-1. Major architectural changes
-2. New features added
-3. Improvements and optimizations
-4. Bug fixes and stability improvements
-5. Deprecated or removed functionality
-6. Migration notes if applicable
-
-Focus on what has changed and why.
-""",
-            "architecture": """
-Provide a detailed architectural analysis of this codebase. Include:
-1. Overall system architecture
-2. Component relationships and data flow
-3. Design patterns employed
-4. Scalability considerations
-5. Security architecture
-6. Performance characteristics
-7. Areas for architectural improvement
-
-Be technical and specific about architectural decisions.
-""",
-        }
-
-        prompt = prompts.get(summary_type, prompts["code_overview"])
-
-        # Prepare content for API
-        content_text = self._format_content_for_api(content)
-
-        # Create temporary file with content
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(f"{prompt}\n\n--- PROJECT CONTENT ---\n\n{content_text}")
-            temp_file = f.name
-
-        try:
-            # Use Claude CLI to generate summary
-            cmd = [
-                "claude",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--temperature",
-                str(temperature),
-                "--file",
-                temp_file,
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0 and stdout:
-                summary = stdout.decode("utf-8").strip()
-                return summary
-            else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-                raise Exception(f"Claude API call failed: {error_msg}")
-
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
-
-    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
-        """Format content for API consumption."""
-        chunk_size = self.config.parameters.get("chunk_size", 100000)
-
-        formatted_parts = []
-
-        # Add project metadata
-        metadata = content.get("metadata", {})
-        formatted_parts.append(f"PROJECT: {metadata.get('project_name', 'Unknown')}")
-        formatted_parts.append(f"Files: {metadata.get('total_files', 0)}")
-        formatted_parts.append(
-            f"Total Size: {metadata.get('total_size', 0)} characters"
-        )
-        formatted_parts.append("")
-
-        # Add project structure
-        structure = content.get("structure", [])
-        if structure:
-            formatted_parts.append("PROJECT STRUCTURE:")
-            for item in structure[:50]:  # Limit structure items
-                formatted_parts.append(f"  {item['path']} ({item['size']} chars)")
-            formatted_parts.append("")
-
-        # Add file contents (chunked if necessary)
-        files = content.get("files", {})
-        current_size = len("\n".join(formatted_parts))
-
-        formatted_parts.append("FILE CONTENTS:")
-        for file_path, file_info in files.items():
-            file_content = file_info["content"]
-
-            # Check if adding this file would exceed chunk size
-            if current_size + len(file_content) > chunk_size:
-                formatted_parts.append(
-                    "\n[Content truncated - too large for single API call]"
-                )
-                break
-
-            formatted_parts.append(f"\n--- {file_path} ---")
-            formatted_parts.append(file_content)
-            current_size += len(file_content) + len(file_path) + 10
-
-        return "\n".join(formatted_parts)
-
-    async def _store_summaries(
-        self, summaries: Dict[str, str], project_dir: str, result: UtilityResult
-    ):
-        """Store generated summaries as artifacts."""
-        project_path = Path(project_dir)
-        summaries_dir = project_path / ".apex" / "summaries"
-        summaries_dir.mkdir(parents=True, exist_ok=True)
-
-        for summary_type, summary_content in summaries.items():
-            summary_file = summaries_dir / f"{summary_type}_summary.md"
-
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(f"# {summary_type.replace('_', ' ').title()} Summary\n\n")
-                f.write("Generated by APEX Archivist Utility\n")
-                f.write(f"Date: {result.started_at}\n\n")
-                f.write("---\n\n")
-                f.write(summary_content)
-
-            result.add_artifact(str(summary_file))
-
-    def validate_config(self) -> List[str]:
-        """Validate archivist utility configuration."""
-        errors = []
-
-        model = self.config.parameters.get("model")
-        if model and not model.startswith("claude-"):
-            errors.append(f"Unsupported model: {model}")
-
-        summary_types = self.config.parameters.get("summary_types", [])
-        valid_types = ["code_overview", "documentation", "changes", "architecture"]
-
-        for summary_type in summary_types:
-            if summary_type not in valid_types:
-                errors.append(f"Unsupported summary type: {summary_type}")
-
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        if max_tokens > 8192:
-            errors.append("max_tokens cannot exceed 8192")
-
-        return errors
-
-
-class GitManagerUtility(BaseUtility):
-    """Utility for intelligent Git operations and commit generation."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Intelligent Git operations with AI-generated commit messages",
-            parameters={
-                "auto_stage": True,
-                "generate_commit_message": True,
-                "commit_message_style": "conventional",  # conventional, descriptive, concise
-                "max_diff_size": 50000,  # characters
-                "include_file_changes": True,
-                "branch_strategy": "feature",  # feature, hotfix, release
-                "push_after_commit": False,
-            },
-            timeout_seconds=120,
-            required_tools=["git"],
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute Git operations."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            operation = context.get(
-                "operation", "commit"
-            )  # commit, status, branch, push
-
-            # Check if we're in a Git repository
-            if not await self._is_git_repo(project_dir):
-                result.add_error("Not a Git repository")
-                result.set_completed(False)
-                return result
-
-            if operation == "commit":
-                success = await self._handle_commit(project_dir, result)
-            elif operation == "status":
-                success = await self._handle_status(project_dir, result)
-            elif operation == "branch":
-                success = await self._handle_branch(project_dir, result, context)
-            elif operation == "push":
-                success = await self._handle_push(project_dir, result)
-            else:
-                result.add_error(f"Unsupported Git operation: {operation}")
-                success = False
-
-            result.set_completed(success)
-
-        except Exception as e:
-            result.add_error(f"Git operation failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _is_git_repo(self, project_dir: str) -> bool:
-        """Check if directory is a Git repository."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--git-dir",
-                cwd=project_dir,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.communicate()
-            return process.returncode == 0
-        except:
-            return False
-
-    async def _handle_commit(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git commit with intelligent message generation."""
-        try:
-            # Get current status
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-
-            if not status_output.strip():
-                result.add_warning("No changes to commit")
-                return True
-
-            # Stage files if auto_stage is enabled
-            if self.config.parameters.get("auto_stage", True):
-                await self._run_git_command(["git", "add", "."], project_dir)
-
-            # Get diff for commit message generation
-            diff_output = await self._run_git_command(
-                ["git", "diff", "--cached"], project_dir
-            )
-
-            if not diff_output.strip():
-                result.add_warning("No staged changes to commit")
-                return True
-
-            # Generate commit message
-            commit_message = await self._generate_commit_message(
-                diff_output, status_output
-            )
-
-            # Commit changes
-            commit_output = await self._run_git_command(
-                ["git", "commit", "-m", commit_message], project_dir
-            )
-
-            result.output["commit"] = {
-                "message": commit_message,
-                "output": commit_output,
-                "files_changed": len(
-                    [line for line in status_output.split("\n") if line.strip()]
-                ),
-            }
-
-            # Get commit hash
-            commit_hash = await self._run_git_command(
-                ["git", "rev-parse", "HEAD"], project_dir
-            )
-            result.metadata["commit_hash"] = commit_hash.strip()
-
-            # Push if configured
-            if self.config.parameters.get("push_after_commit", False):
-                push_output = await self._run_git_command(["git", "push"], project_dir)
-                result.output["push"] = push_output
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Commit failed: {str(e)}")
-            return False
-
-    async def _handle_status(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git status check."""
-        try:
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-            branch_output = await self._run_git_command(
-                ["git", "branch", "--show-current"], project_dir
-            )
-
-            result.output["status"] = {
-                "porcelain": status_output,
-                "current_branch": branch_output.strip(),
-                "clean": not status_output.strip(),
-            }
-
-            # Parse status
-            modified_files = []
-            staged_files = []
-            untracked_files = []
-
-            for line in status_output.split("\n"):
-                if line.strip():
-                    status_code = line[:2]
-                    filename = line[3:]
-
-                    if status_code[0] in ["M", "A", "D", "R", "C"]:
-                        staged_files.append(filename)
-                    if status_code[1] in ["M", "D"]:
-                        modified_files.append(filename)
-                    if status_code == "??":
-                        untracked_files.append(filename)
-
-            result.metadata["files"] = {
-                "staged": len(staged_files),
-                "modified": len(modified_files),
-                "untracked": len(untracked_files),
-            }
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Status check failed: {str(e)}")
-            return False
-
-    async def _handle_branch(
-        self, project_dir: str, result: UtilityResult, context: Dict[str, Any]
-    ) -> bool:
-        """Handle Git branch operations."""
-        try:
-            branch_operation = context.get(
-                "branch_operation", "list"
-            )  # list, create, switch, delete
-            branch_name = context.get("branch_name")
-
-            if branch_operation == "list":
-                branches_output = await self._run_git_command(
-                    ["git", "branch", "-a"], project_dir
-                )
-                result.output["branches"] = branches_output
-
-            elif branch_operation == "create" and branch_name:
-                create_output = await self._run_git_command(
-                    ["git", "branch", branch_name], project_dir
-                )
-                result.output["branch_create"] = create_output
-
-            elif branch_operation == "switch" and branch_name:
-                switch_output = await self._run_git_command(
-                    ["git", "checkout", branch_name], project_dir
-                )
-                result.output["branch_switch"] = switch_output
-
-            elif branch_operation == "delete" and branch_name:
-                delete_output = await self._run_git_command(
-                    ["git", "branch", "-d", branch_name], project_dir
-                )
-                result.output["branch_delete"] = delete_output
-
-            else:
-                result.add_error(f"Invalid branch operation: {branch_operation}")
-                return False
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Branch operation failed: {str(e)}")
-            return False
-
-    async def _handle_push(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git push operation."""
-        try:
-            push_output = await self._run_git_command(["git", "push"], project_dir)
-            result.output["push"] = push_output
-            return True
-
-        except Exception as e:
-            result.add_error(f"Push failed: {str(e)}")
-            return False
-
-    async def _run_git_command(self, cmd: List[str], project_dir: str) -> str:
-        """Run a Git command and return output."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-            raise Exception(f"Git command failed: {' '.join(cmd)} - {error_msg}")
-
-        return stdout.decode("utf-8")
-
-    async def _generate_commit_message(
-        self, diff_output: str, status_output: str
-    ) -> str:
-        """Generate intelligent commit message using Claude API."""
-        try:
-            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
-            style = self.config.parameters.get("commit_message_style", "conventional")
-
-            # Truncate diff if too large
-            if len(diff_output) > max_diff_size:
-                diff_output = diff_output[:max_diff_size] + "\n[... diff truncated ...]"
-
-            # Create prompt for commit message generation
-            prompt = f"""
-Generate a {style} commit message for the following changes.
-
-Style guidelines:
-- conventional: Use conventional commit format (type(scope): description)
-- descriptive: Clear, descriptive message explaining what changed
-- concise: Brief but informative message
-
-Git status:
-{status_output}
-
-Git diff:
-{diff_output}
-
-Generate only the commit message, no additional text or explanation.
-"""
-
-            # Use Claude CLI to generate commit message
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                f.write(prompt)
-                temp_file = f.name
-
-            try:
-                cmd = [
-                    "claude",
-                    "--model",
-                    "claude-3-5-sonnet-20241022",
-                    "--max-tokens",
-                    "200",
-                    "--temperature",
-                    "0.1",
-                    "--file",
-                    temp_file,
-                ]
-
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-
-                stdout, stderr = await process.communicate()
-
-                if process.returncode == 0 and stdout:
-                    commit_message = stdout.decode("utf-8").strip()
-                    # Clean up any unwanted formatting
-                    commit_message = commit_message.replace('"', "").replace("\n", " ")
-                    return commit_message
-                else:
-                    # Fallback to simple message
-                    return self._generate_fallback_commit_message(status_output)
-
-            finally:
-                try:
-                    Path(temp_file).unlink()
-                except:
-                    pass
-
-        except Exception:
-            # Fallback to simple message generation
-            return self._generate_fallback_commit_message(status_output)
-
-    def _generate_fallback_commit_message(self, status_output: str) -> str:
-        """Generate fallback commit message without API."""
-        lines = [line for line in status_output.split("\n") if line.strip()]
-
-        if not lines:
-            return "Update project files"
-
-        # Count different types of changes
-        added = len([line for line in lines if line.startswith("A")])
-        modified = len(
-            [line for line in lines if line.startswith("M") or line.startswith(" M")]
-        )
-        deleted = len([line for line in lines if line.startswith("D")])
-
-        # Generate message based on changes
-        if added and not modified and not deleted:
-            return f"Add {added} new file{'s' if added > 1 else ''}"
-        elif modified and not added and not deleted:
-            return f"Update {modified} file{'s' if modified > 1 else ''}"
-        elif deleted and not added and not modified:
-            return f"Remove {deleted} file{'s' if deleted > 1 else ''}"
-        else:
-            total = added + modified + deleted
-            return f"Update project: {total} file{'s' if total > 1 else ''} changed"
-
-    def validate_config(self) -> List[str]:
-        """Validate Git manager configuration."""
-        errors = []
-
-        style = self.config.parameters.get("commit_message_style")
-        if style and style not in ["conventional", "descriptive", "concise"]:
-            errors.append(f"Unsupported commit message style: {style}")
-
-        branch_strategy = self.config.parameters.get("branch_strategy")
-        if branch_strategy and branch_strategy not in [
-            "feature",
-            "hotfix",
-            "release",
-            "main",
-        ]:
-            errors.append(f"Unsupported branch strategy: {branch_strategy}")
-
-        return errors
-
-
-class SecurityScannerUtility(BaseUtility):
-    """Utility for security scanning."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Scan for security vulnerabilities",
-            parameters={
-                "tools": ["bandit", "safety"],
-                "include_dependencies": True,
-                "severity_threshold": "medium",
-            },
-            timeout_seconds=240,
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute security scan."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            tools = self.config.parameters.get("tools", ["bandit"])
-
-            scan_results = {}
-
-            for tool in tools:
-                if tool == "bandit":
-                    tool_result = await self._run_bandit(project_dir)
-                elif tool == "safety":
-                    tool_result = await self._run_safety(project_dir)
-                else:
-                    tool_result = {"error": f"Unknown security tool: {tool}"}
-
-                scan_results[tool] = tool_result
-
-            result.output["scan_results"] = scan_results
-
-            # Aggregate results
-            total_issues = 0
-            high_severity = 0
-
-            for tool, tool_result in scan_results.items():
-                if "issues" in tool_result:
-                    issues = tool_result["issues"]
-                    total_issues += len(issues)
-
-                    for issue in issues:
-                        if issue.get("severity", "").lower() in ["high", "critical"]:
-                            high_severity += 1
-
-            result.metadata["total_issues"] = total_issues
-            result.metadata["high_severity_issues"] = high_severity
-
-            # Set completion status
-            threshold = self.config.parameters.get("severity_threshold", "medium")
-            if threshold == "high" and high_severity == 0:
-                result.set_completed(True)
-            elif threshold == "medium" and total_issues == 0:
-                result.set_completed(True)
-            else:
-                result.set_completed(total_issues == 0)
-
-        except Exception as e:
-            result.add_error(f"Security scan failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _run_bandit(self, project_dir: str) -> Dict[str, Any]:
-        """Run Bandit security scanner."""
-        try:
-            cmd = ["bandit", "-r", project_dir, "-f", "json"]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if stdout:
-                bandit_data = json.loads(stdout.decode("utf-8"))
-                issues = bandit_data.get("results", [])
-
-                return {
-                    "tool": "bandit",
-                    "issues": issues,
-                    "summary": bandit_data.get("metrics", {}),
-                }
-            else:
-                return {
-                    "tool": "bandit",
-                    "issues": [],
-                    "error": stderr.decode("utf-8") if stderr else "No output",
-                }
-
-        except Exception as e:
-            return {"tool": "bandit", "error": str(e)}
-
-    async def _run_safety(self, project_dir: str) -> Dict[str, Any]:
-        """Run Safety dependency scanner."""
-        try:
-            cmd = ["safety", "check", "--json"]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if stdout:
-                safety_data = json.loads(stdout.decode("utf-8"))
-
-                return {
-                    "tool": "safety",
-                    "issues": safety_data,
-                    "summary": {"vulnerable_packages": len(safety_data)},
-                }
-            else:
-                return {
-                    "tool": "safety",
-                    "issues": [],
-                    "message": "No vulnerabilities found",
-                }
-
-        except Exception as e:
-            return {"tool": "safety", "error": str(e)}
-
-    def validate_config(self) -> List[str]:
-        """Validate security scanner configuration."""
-        errors = []
-
-        tools = self.config.parameters.get("tools", [])
-        supported_tools = ["bandit", "safety", "semgrep"]
-
-        for tool in tools:
-            if tool not in supported_tools:
-                errors.append(f"Unsupported security tool: {tool}")
-
-        return errors
-
-
-class ArchivistUtility(BaseUtility):
-    """Utility for content summarization using direct API calls."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Summarize and archive project content using Claude API",
-            parameters={
-                "model": "claude-3-5-sonnet-20241022",
-                "max_tokens": 4000,
-                "temperature": 0.1,
-                "include_patterns": [
-                    "*.py",
-                    "*.md",
-                    "*.txt",
-                    "*.json",
-                    "*.yaml",
-                    "*.yml",
-                ],
-                "exclude_patterns": [
-                    "*.pyc",
-                    "__pycache__",
-                    ".git",
-                    "node_modules",
-                    "venv",
-                    ".env",
-                ],
-                "summary_types": [
-                    "code_overview",
-                    "documentation",
-                    "changes",
-                    "architecture",
-                ],
-                "chunk_size": 100000,  # characters per chunk
-            },
-            timeout_seconds=300,
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute content summarization."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            summary_types = self.config.parameters.get(
-                "summary_types", ["code_overview"]
-            )
-
-            # Collect project content
-            content = await self._collect_project_content(project_dir)
-
-            if not content:
-                result.add_warning("No content found to summarize")
-                result.set_completed(True)
-                return result
-
-            # Generate summaries for each requested type
-            summaries = {}
-
-            for summary_type in summary_types:
-                try:
-                    summary = await self._generate_summary(content, summary_type)
-                    summaries[summary_type] = summary
-                except Exception as e:
-                    result.add_error(
-                        f"Failed to generate {summary_type} summary: {str(e)}"
-                    )
-
-            result.output["summaries"] = summaries
-            result.metadata["content_size"] = len(str(content))
-            result.metadata["summary_count"] = len(summaries)
-
-            # Store summaries as artifacts
-            await self._store_summaries(summaries, project_dir, result)
-
-            result.set_completed(len(summaries) > 0)
-
-        except Exception as e:
-            result.add_error(f"Content summarization failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _collect_project_content(self, project_dir: str) -> Dict[str, Any]:
-        """Collect relevant project content."""
-        project_path = Path(project_dir)
-        include_patterns = self.config.parameters.get("include_patterns", ["*.py"])
-        exclude_patterns = self.config.parameters.get("exclude_patterns", [])
-
-        content = {
-            "files": {},
-            "structure": [],
-            "metadata": {
-                "project_name": project_path.name,
-                "total_files": 0,
-                "total_size": 0,
-            },
-        }
-
-        def should_include(file_path: Path) -> bool:
-            """Check if file should be included."""
-            # Check exclude patterns first
-            for pattern in exclude_patterns:
-                if pattern in str(file_path):
-                    return False
-
-            # Check include patterns
-            for pattern in include_patterns:
-                if file_path.match(pattern):
-                    return True
-
-            return False
-
-        # Collect file content and structure
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and should_include(file_path):
-                try:
-                    relative_path = file_path.relative_to(project_path)
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        file_content = f.read()
-
-                    content["files"][str(relative_path)] = {
-                        "content": file_content,
-                        "size": len(file_content),
-                        "lines": len(file_content.splitlines()),
-                    }
-
-                    content["structure"].append(
-                        {
-                            "path": str(relative_path),
-                            "size": len(file_content),
-                            "type": file_path.suffix,
-                        }
-                    )
-
-                    content["metadata"]["total_files"] += 1
-                    content["metadata"]["total_size"] += len(file_content)
-
-                except Exception:
-                    # Skip files that can't be read
-                    continue
-
-        return content
-
-    async def _generate_summary(
-        self, content: Dict[str, Any], summary_type: str
-    ) -> str:
-        """Generate summary using Claude API via CLI."""
-        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        temperature = self.config.parameters.get("temperature", 0.1)
-
-        # Create prompt based on summary type
-        prompts = {
-            "code_overview": """
-Analyze this codebase and provide a comprehensive code overview. Include:
-1. Main components and their purposes
-2. Architecture patterns used
-3. Key classes and functions
-4. Dependencies and integrations
-5. Code quality observations
-6. Suggested improvements
-
-Be concise but thorough. Focus on the most important aspects.
-""",
-            "documentation": """
-Generate comprehensive documentation for this codebase. Include:
-1. Project purpose and overview
-2. Setup and installation instructions
-3. Usage examples
-4. API documentation for key components
-5. Configuration options
-6. Troubleshooting guide
-
-Structure it as proper documentation with clear sections.
-""",
-            "changes": """
-Analyze this codebase and summarize recent changes and evolution. Include:
-1. Major architectural changes
-2. New features added
-3. Improvements and optimizations
-4. Bug fixes and stability improvements
-5. Deprecated or removed functionality
-6. Migration notes if applicable
-
-Focus on what has changed and why.
-""",
-            "architecture": """
-Provide a detailed architectural analysis of this codebase. Include:
-1. Overall system architecture
-2. Component relationships and data flow
-3. Design patterns employed
-4. Scalability considerations
-5. Security architecture
-6. Performance characteristics
-7. Areas for architectural improvement
-
-Be technical and specific about architectural decisions.
-""",
-        }
-
-        prompt = prompts.get(summary_type, prompts["code_overview"])
-
-        # Prepare content for API
-        content_text = self._format_content_for_api(content)
-
-        # Create temporary file with content
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(f"{prompt}\n\n--- PROJECT CONTENT ---\n\n{content_text}")
-            temp_file = f.name
-
-        try:
-            # Use Claude CLI to generate summary
-            cmd = [
-                "claude",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--temperature",
-                str(temperature),
-                "--file",
-                temp_file,
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0 and stdout:
-                summary = stdout.decode("utf-8").strip()
-                return summary
-            else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-                raise Exception(f"Claude API call failed: {error_msg}")
-
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
-
-    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
-        """Format content for API consumption."""
-        chunk_size = self.config.parameters.get("chunk_size", 100000)
-
-        formatted_parts = []
-
-        # Add project metadata
-        metadata = content.get("metadata", {})
-        formatted_parts.append(f"PROJECT: {metadata.get('project_name', 'Unknown')}")
-        formatted_parts.append(f"Files: {metadata.get('total_files', 0)}")
-        formatted_parts.append(
-            f"Total Size: {metadata.get('total_size', 0)} characters"
-        )
-        formatted_parts.append("")
-
-        # Add project structure
-        structure = content.get("structure", [])
-        if structure:
-            formatted_parts.append("PROJECT STRUCTURE:")
-            for item in structure[:50]:  # Limit structure items
-                formatted_parts.append(f"  {item['path']} ({item['size']} chars)")
-            formatted_parts.append("")
-
-        # Add file contents (chunked if necessary)
-        files = content.get("files", {})
-        current_size = len("\n".join(formatted_parts))
-
-        formatted_parts.append("FILE CONTENTS:")
-        for file_path, file_info in files.items():
-            file_content = file_info["content"]
-
-            # Check if adding this file would exceed chunk size
-            if current_size + len(file_content) > chunk_size:
-                formatted_parts.append(
-                    "\n[Content truncated - too large for single API call]"
-                )
-                break
-
-            formatted_parts.append(f"\n--- {file_path} ---")
-            formatted_parts.append(file_content)
-            current_size += len(file_content) + len(file_path) + 10
-
-        return "\n".join(formatted_parts)
-
-    async def _store_summaries(
-        self, summaries: Dict[str, str], project_dir: str, result: UtilityResult
-    ):
-        """Store generated summaries as artifacts."""
-        project_path = Path(project_dir)
-        summaries_dir = project_path / ".apex" / "summaries"
-        summaries_dir.mkdir(parents=True, exist_ok=True)
-
-        for summary_type, summary_content in summaries.items():
-            summary_file = summaries_dir / f"{summary_type}_summary.md"
-
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(f"# {summary_type.replace('_', ' ').title()} Summary\n\n")
-                f.write("Generated by APEX Archivist Utility\n")
-                f.write(f"Date: {result.started_at}\n\n")
-                f.write("---\n\n")
-                f.write(summary_content)
-
-            result.add_artifact(str(summary_file))
-
-    def validate_config(self) -> List[str]:
-        """Validate archivist utility configuration."""
-        errors = []
-
-        model = self.config.parameters.get("model")
-        if model and not model.startswith("claude-"):
-            errors.append(f"Unsupported model: {model}")
-
-        summary_types = self.config.parameters.get("summary_types", [])
-        valid_types = ["code_overview", "documentation", "changes", "architecture"]
-
-        for summary_type in summary_types:
-            if summary_type not in valid_types:
-                errors.append(f"Unsupported summary type: {summary_type}")
-
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        if max_tokens > 8192:
-            errors.append("max_tokens cannot exceed 8192")
-
-        return errors
-
-
-class GitManagerUtility(BaseUtility):
-    """Utility for intelligent Git operations and commit generation."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Intelligent Git operations with AI-generated commit messages",
-            parameters={
-                "auto_stage": True,
-                "generate_commit_message": True,
-                "commit_message_style": "conventional",  # conventional, descriptive, concise
-                "max_diff_size": 50000,  # characters
-                "include_file_changes": True,
-                "branch_strategy": "feature",  # feature, hotfix, release
-                "push_after_commit": False,
-            },
-            timeout_seconds=120,
-            required_tools=["git"],
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute Git operations."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            operation = context.get(
-                "operation", "commit"
-            )  # commit, status, branch, push
-
-            # Check if we're in a Git repository
-            if not await self._is_git_repo(project_dir):
-                result.add_error("Not a Git repository")
-                result.set_completed(False)
-                return result
-
-            if operation == "commit":
-                success = await self._handle_commit(project_dir, result)
-            elif operation == "status":
-                success = await self._handle_status(project_dir, result)
-            elif operation == "branch":
-                success = await self._handle_branch(project_dir, result, context)
-            elif operation == "push":
-                success = await self._handle_push(project_dir, result)
-            else:
-                result.add_error(f"Unsupported Git operation: {operation}")
-                success = False
-
-            result.set_completed(success)
-
-        except Exception as e:
-            result.add_error(f"Git operation failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _is_git_repo(self, project_dir: str) -> bool:
-        """Check if directory is a Git repository."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--git-dir",
-                cwd=project_dir,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.communicate()
-            return process.returncode == 0
-        except:
-            return False
-
-    async def _handle_commit(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git commit with intelligent message generation."""
-        try:
-            # Get current status
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-
-            if not status_output.strip():
-                result.add_warning("No changes to commit")
-                return True
-
-            # Stage files if auto_stage is enabled
-            if self.config.parameters.get("auto_stage", True):
-                await self._run_git_command(["git", "add", "."], project_dir)
-
-            # Get diff for commit message generation
-            diff_output = await self._run_git_command(
-                ["git", "diff", "--cached"], project_dir
-            )
-
-            if not diff_output.strip():
-                result.add_warning("No staged changes to commit")
-                return True
-
-            # Generate commit message
-            commit_message = await self._generate_commit_message(
-                diff_output, status_output
-            )
-
-            # Commit changes
-            commit_output = await self._run_git_command(
-                ["git", "commit", "-m", commit_message], project_dir
-            )
-
-            result.output["commit"] = {
-                "message": commit_message,
-                "output": commit_output,
-                "files_changed": len(
-                    [line for line in status_output.split("\n") if line.strip()]
-                ),
-            }
-
-            # Get commit hash
-            commit_hash = await self._run_git_command(
-                ["git", "rev-parse", "HEAD"], project_dir
-            )
-            result.metadata["commit_hash"] = commit_hash.strip()
-
-            # Push if configured
-            if self.config.parameters.get("push_after_commit", False):
-                push_output = await self._run_git_command(["git", "push"], project_dir)
-                result.output["push"] = push_output
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Commit failed: {str(e)}")
-            return False
-
-    async def _handle_status(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git status check."""
-        try:
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-            branch_output = await self._run_git_command(
-                ["git", "branch", "--show-current"], project_dir
-            )
-
-            result.output["status"] = {
-                "porcelain": status_output,
-                "current_branch": branch_output.strip(),
-                "clean": not status_output.strip(),
-            }
-
-            # Parse status
-            modified_files = []
-            staged_files = []
-            untracked_files = []
-
-            for line in status_output.split("\n"):
-                if line.strip():
-                    status_code = line[:2]
-                    filename = line[3:]
-
-                    if status_code[0] in ["M", "A", "D", "R", "C"]:
-                        staged_files.append(filename)
-                    if status_code[1] in ["M", "D"]:
-                        modified_files.append(filename)
-                    if status_code == "??":
-                        untracked_files.append(filename)
-
-            result.metadata["files"] = {
-                "staged": len(staged_files),
-                "modified": len(modified_files),
-                "untracked": len(untracked_files),
-            }
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Status check failed: {str(e)}")
-            return False
-
-    async def _handle_branch(
-        self, project_dir: str, result: UtilityResult, context: Dict[str, Any]
-    ) -> bool:
-        """Handle Git branch operations."""
-        try:
-            branch_operation = context.get(
-                "branch_operation", "list"
-            )  # list, create, switch, delete
-            branch_name = context.get("branch_name")
-
-            if branch_operation == "list":
-                branches_output = await self._run_git_command(
-                    ["git", "branch", "-a"], project_dir
-                )
-                result.output["branches"] = branches_output
-
-            elif branch_operation == "create" and branch_name:
-                create_output = await self._run_git_command(
-                    ["git", "branch", branch_name], project_dir
-                )
-                result.output["branch_create"] = create_output
-
-            elif branch_operation == "switch" and branch_name:
-                switch_output = await self._run_git_command(
-                    ["git", "checkout", branch_name], project_dir
-                )
-                result.output["branch_switch"] = switch_output
-
-            elif branch_operation == "delete" and branch_name:
-                delete_output = await self._run_git_command(
-                    ["git", "branch", "-d", branch_name], project_dir
-                )
-                result.output["branch_delete"] = delete_output
-
-            else:
-                result.add_error(f"Invalid branch operation: {branch_operation}")
-                return False
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Branch operation failed: {str(e)}")
-            return False
-
-    async def _handle_push(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git push operation."""
-        try:
-            push_output = await self._run_git_command(["git", "push"], project_dir)
-            result.output["push"] = push_output
-            return True
-
-        except Exception as e:
-            result.add_error(f"Push failed: {str(e)}")
-            return False
-
-    async def _run_git_command(self, cmd: List[str], project_dir: str) -> str:
-        """Run a Git command and return output."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-            raise Exception(f"Git command failed: {' '.join(cmd)} - {error_msg}")
-
-        return stdout.decode("utf-8")
-
-    async def _generate_commit_message(
-        self, diff_output: str, status_output: str
-    ) -> str:
-        """Generate intelligent commit message using Claude API."""
-        try:
-            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
-            style = self.config.parameters.get("commit_message_style", "conventional")
-
-            # Truncate diff if too large
-            if len(diff_output) > max_diff_size:
-                diff_output = diff_output[:max_diff_size] + "\n[... diff truncated ...]"
-
-            # Create prompt for commit message generation
-            prompt = f"""
-Generate a {style} commit message for the following changes.
-
-Style guidelines:
-- conventional: Use conventional commit format (type(scope): description)
-- descriptive: Clear, descriptive message explaining what changed
-- concise: Brief but informative message
-
-Git status:
-{status_output}
-
-Git diff:
-{diff_output}
-
-Generate only the commit message, no additional text or explanation.
-"""
-
-            # Use Claude CLI to generate commit message
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                f.write(prompt)
-                temp_file = f.name
-
-            try:
-                cmd = [
-                    "claude",
-                    "--model",
-                    "claude-3-5-sonnet-20241022",
-                    "--max-tokens",
-                    "200",
-                    "--temperature",
-                    "0.1",
-                    "--file",
-                    temp_file,
-                ]
-
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-
-                stdout, stderr = await process.communicate()
-
-                if process.returncode == 0 and stdout:
-                    commit_message = stdout.decode("utf-8").strip()
-                    # Clean up any unwanted formatting
-                    commit_message = commit_message.replace('"', "").replace("\n", " ")
-                    return commit_message
-                else:
-                    # Fallback to simple message
-                    return self._generate_fallback_commit_message(status_output)
-
-            finally:
-                try:
-                    Path(temp_file).unlink()
-                except:
-                    pass
-
-        except Exception:
-            # Fallback to simple message generation
-            return self._generate_fallback_commit_message(status_output)
-
-    def _generate_fallback_commit_message(self, status_output: str) -> str:
-        """Generate fallback commit message without API."""
-        lines = [line for line in status_output.split("\n") if line.strip()]
-
-        if not lines:
-            return "Update project files"
-
-        # Count different types of changes
-        added = len([line for line in lines if line.startswith("A")])
-        modified = len(
-            [line for line in lines if line.startswith("M") or line.startswith(" M")]
-        )
-        deleted = len([line for line in lines if line.startswith("D")])
-
-        # Generate message based on changes
-        if added and not modified and not deleted:
-            return f"Add {added} new file{'s' if added > 1 else ''}"
-        elif modified and not added and not deleted:
-            return f"Update {modified} file{'s' if modified > 1 else ''}"
-        elif deleted and not added and not modified:
-            return f"Remove {deleted} file{'s' if deleted > 1 else ''}"
-        else:
-            total = added + modified + deleted
-            return f"Update project: {total} file{'s' if total > 1 else ''} changed"
-
-    def validate_config(self) -> List[str]:
-        """Validate Git manager configuration."""
-        errors = []
-
-        style = self.config.parameters.get("commit_message_style")
-        if style and style not in ["conventional", "descriptive", "concise"]:
-            errors.append(f"Unsupported commit message style: {style}")
-
-        branch_strategy = self.config.parameters.get("branch_strategy")
-        if branch_strategy and branch_strategy not in [
-            "feature",
-            "hotfix",
-            "release",
-            "main",
-        ]:
-            errors.append(f"Unsupported branch strategy: {branch_strategy}")
-
-        return errors
-
-
-class BuildUtility(CommandUtility):
-    """Utility for building projects."""
-
-    def __init__(self, config: UtilityConfig):
-        command = config.parameters.get("command", "uv build")
-        super().__init__(config, command, shell=True)
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Build project artifacts",
-            parameters={
-                "command": "uv build",
-                "output_dir": "dist/",
-                "clean_first": True,
-            },
-            timeout_seconds=300,
-        )
-
-    def validate_config(self) -> List[str]:
-        """Validate build utility configuration."""
-        errors = []
-
-        if not self.config.parameters.get("command"):
-            errors.append("Build command is required")
-
-        return errors
-
-
-class ArchivistUtility(BaseUtility):
-    """Utility for content summarization using direct API calls."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Summarize and archive project content using Claude API",
-            parameters={
-                "model": "claude-3-5-sonnet-20241022",
-                "max_tokens": 4000,
-                "temperature": 0.1,
-                "include_patterns": [
-                    "*.py",
-                    "*.md",
-                    "*.txt",
-                    "*.json",
-                    "*.yaml",
-                    "*.yml",
-                ],
-                "exclude_patterns": [
-                    "*.pyc",
-                    "__pycache__",
-                    ".git",
-                    "node_modules",
-                    "venv",
-                    ".env",
-                ],
-                "summary_types": [
-                    "code_overview",
-                    "documentation",
-                    "changes",
-                    "architecture",
-                ],
-                "chunk_size": 100000,  # characters per chunk
-            },
-            timeout_seconds=300,
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute content summarization."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            summary_types = self.config.parameters.get(
-                "summary_types", ["code_overview"]
-            )
-
-            # Collect project content
-            content = await self._collect_project_content(project_dir)
-
-            if not content:
-                result.add_warning("No content found to summarize")
-                result.set_completed(True)
-                return result
-
-            # Generate summaries for each requested type
-            summaries = {}
-
-            for summary_type in summary_types:
-                try:
-                    summary = await self._generate_summary(content, summary_type)
-                    summaries[summary_type] = summary
-                except Exception as e:
-                    result.add_error(
-                        f"Failed to generate {summary_type} summary: {str(e)}"
-                    )
-
-            result.output["summaries"] = summaries
-            result.metadata["content_size"] = len(str(content))
-            result.metadata["summary_count"] = len(summaries)
-
-            # Store summaries as artifacts
-            await self._store_summaries(summaries, project_dir, result)
-
-            result.set_completed(len(summaries) > 0)
-
-        except Exception as e:
-            result.add_error(f"Content summarization failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _collect_project_content(self, project_dir: str) -> Dict[str, Any]:
-        """Collect relevant project content."""
-        project_path = Path(project_dir)
-        include_patterns = self.config.parameters.get("include_patterns", ["*.py"])
-        exclude_patterns = self.config.parameters.get("exclude_patterns", [])
-
-        content = {
-            "files": {},
-            "structure": [],
-            "metadata": {
-                "project_name": project_path.name,
-                "total_files": 0,
-                "total_size": 0,
-            },
-        }
-
-        def should_include(file_path: Path) -> bool:
-            """Check if file should be included."""
-            # Check exclude patterns first
-            for pattern in exclude_patterns:
-                if pattern in str(file_path):
-                    return False
-
-            # Check include patterns
-            for pattern in include_patterns:
-                if file_path.match(pattern):
-                    return True
-
-            return False
-
-        # Collect file content and structure
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and should_include(file_path):
-                try:
-                    relative_path = file_path.relative_to(project_path)
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        file_content = f.read()
-
-                    content["files"][str(relative_path)] = {
-                        "content": file_content,
-                        "size": len(file_content),
-                        "lines": len(file_content.splitlines()),
-                    }
-
-                    content["structure"].append(
-                        {
-                            "path": str(relative_path),
-                            "size": len(file_content),
-                            "type": file_path.suffix,
-                        }
-                    )
-
-                    content["metadata"]["total_files"] += 1
-                    content["metadata"]["total_size"] += len(file_content)
-
-                except Exception:
-                    # Skip files that can't be read
-                    continue
-
-        return content
-
-    async def _generate_summary(
-        self, content: Dict[str, Any], summary_type: str
-    ) -> str:
-        """Generate summary using Claude API via CLI."""
-        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        temperature = self.config.parameters.get("temperature", 0.1)
-
-        # Create prompt based on summary type
-        prompts = {
-            "code_overview": """
-Analyze this codebase and provide a comprehensive code overview. Include:
-1. Main components and their purposes
-2. Architecture patterns used
-3. Key classes and functions
-4. Dependencies and integrations
-5. Code quality observations
-6. Suggested improvements
-
-Be concise but thorough. Focus on the most important aspects.
-""",
-            "documentation": """
-Generate comprehensive documentation for this codebase. Include:
-1. Project purpose and overview
-2. Setup and installation instructions
-3. Usage examples
-4. API documentation for key components
-5. Configuration options
-6. Troubleshooting guide
-
-Structure it as proper documentation with clear sections.
-""",
-            "changes": """
-Analyze this codebase and summarize recent changes and evolution. Include:
-1. Major architectural changes
-2. New features added
-3. Improvements and optimizations
-4. Bug fixes and stability improvements
-5. Deprecated or removed functionality
-6. Migration notes if applicable
-
-Focus on what has changed and why.
-""",
-            "architecture": """
-Provide a detailed architectural analysis of this codebase. Include:
-1. Overall system architecture
-2. Component relationships and data flow
-3. Design patterns employed
-4. Scalability considerations
-5. Security architecture
-6. Performance characteristics
-7. Areas for architectural improvement
-
-Be technical and specific about architectural decisions.
-""",
+        result.output = {
+            "command": " ".join(cmd),
+            "return_code": process.returncode,
+            "stdout": stdout.decode("utf-8") if stdout else "",
+            "stderr": stderr.decode("utf-8") if stderr else "",
         }
 
-        prompt = prompts.get(summary_type, prompts["code_overview"])
-
-        # Prepare content for API
-        content_text = self._format_content_for_api(content)
-
-        # Create temporary file with content
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(f"{prompt}\n\n--- PROJECT CONTENT ---\n\n{content_text}")
-            temp_file = f.name
-
-        try:
-            # Use Claude CLI to generate summary
-            cmd = [
-                "claude",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--temperature",
-                str(temperature),
-                "--file",
-                temp_file,
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0 and stdout:
-                summary = stdout.decode("utf-8").strip()
-                return summary
-            else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-                raise Exception(f"Claude API call failed: {error_msg}")
-
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
-
-    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
-        """Format content for API consumption."""
-        chunk_size = self.config.parameters.get("chunk_size", 100000)
-
-        formatted_parts = []
-
-        # Add project metadata
-        metadata = content.get("metadata", {})
-        formatted_parts.append(f"PROJECT: {metadata.get('project_name', 'Unknown')}")
-        formatted_parts.append(f"Files: {metadata.get('total_files', 0)}")
-        formatted_parts.append(
-            f"Total Size: {metadata.get('total_size', 0)} characters"
-        )
-        formatted_parts.append("")
-
-        # Add project structure
-        structure = content.get("structure", [])
-        if structure:
-            formatted_parts.append("PROJECT STRUCTURE:")
-            for item in structure[:50]:  # Limit structure items
-                formatted_parts.append(f"  {item['path']} ({item['size']} chars)")
-            formatted_parts.append("")
-
-        # Add file contents (chunked if necessary)
-        files = content.get("files", {})
-        current_size = len("\n".join(formatted_parts))
-
-        formatted_parts.append("FILE CONTENTS:")
-        for file_path, file_info in files.items():
-            file_content = file_info["content"]
-
-            # Check if adding this file would exceed chunk size
-            if current_size + len(file_content) > chunk_size:
-                formatted_parts.append(
-                    "\n[Content truncated - too large for single API call]"
-                )
-                break
-
-            formatted_parts.append(f"\n--- {file_path} ---")
-            formatted_parts.append(file_content)
-            current_size += len(file_content) + len(file_path) + 10
-
-        return "\n".join(formatted_parts)
-
-    async def _store_summaries(
-        self, summaries: Dict[str, str], project_dir: str, result: UtilityResult
-    ):
-        """Store generated summaries as artifacts."""
-        project_path = Path(project_dir)
-        summaries_dir = project_path / ".apex" / "summaries"
-        summaries_dir.mkdir(parents=True, exist_ok=True)
-
-        for summary_type, summary_content in summaries.items():
-            summary_file = summaries_dir / f"{summary_type}_summary.md"
-
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(f"# {summary_type.replace('_', ' ').title()} Summary\n\n")
-                f.write("Generated by APEX Archivist Utility\n")
-                f.write(f"Date: {result.started_at}\n\n")
-                f.write("---\n\n")
-                f.write(summary_content)
-
-            result.add_artifact(str(summary_file))
-
-    def validate_config(self) -> List[str]:
-        """Validate archivist utility configuration."""
-        errors = []
-
-        model = self.config.parameters.get("model")
-        if model and not model.startswith("claude-"):
-            errors.append(f"Unsupported model: {model}")
-
-        summary_types = self.config.parameters.get("summary_types", [])
-        valid_types = ["code_overview", "documentation", "changes", "architecture"]
-
-        for summary_type in summary_types:
-            if summary_type not in valid_types:
-                errors.append(f"Unsupported summary type: {summary_type}")
-
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        if max_tokens > 8192:
-            errors.append("max_tokens cannot exceed 8192")
-
-        return errors
-
-
-class GitManagerUtility(BaseUtility):
-    """Utility for intelligent Git operations and commit generation."""
-
-    @classmethod
-    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
-        return UtilityConfig(
-            name=name,
-            category=category,
-            description="Intelligent Git operations with AI-generated commit messages",
-            parameters={
-                "auto_stage": True,
-                "generate_commit_message": True,
-                "commit_message_style": "conventional",  # conventional, descriptive, concise
-                "max_diff_size": 50000,  # characters
-                "include_file_changes": True,
-                "branch_strategy": "feature",  # feature, hotfix, release
-                "push_after_commit": False,
-            },
-            timeout_seconds=120,
-            required_tools=["git"],
-        )
-
-    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
-        """Execute Git operations."""
-        result = self.create_result()
-
-        try:
-            project_dir = context.get("project_dir", ".")
-            operation = context.get(
-                "operation", "commit"
-            )  # commit, status, branch, push
-
-            # Check if we're in a Git repository
-            if not await self._is_git_repo(project_dir):
-                result.add_error("Not a Git repository")
-                result.set_completed(False)
-                return result
-
-            if operation == "commit":
-                success = await self._handle_commit(project_dir, result)
-            elif operation == "status":
-                success = await self._handle_status(project_dir, result)
-            elif operation == "branch":
-                success = await self._handle_branch(project_dir, result, context)
-            elif operation == "push":
-                success = await self._handle_push(project_dir, result)
-            else:
-                result.add_error(f"Unsupported Git operation: {operation}")
-                success = False
-
-            result.set_completed(success)
-
-        except Exception as e:
-            result.add_error(f"Git operation failed: {str(e)}")
-            result.set_completed(False)
-
-        return result
-
-    async def _is_git_repo(self, project_dir: str) -> bool:
-        """Check if directory is a Git repository."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--git-dir",
-                cwd=project_dir,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.communicate()
-            return process.returncode == 0
-        except:
-            return False
-
-    async def _handle_commit(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git commit with intelligent message generation."""
-        try:
-            # Get current status
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-
-            if not status_output.strip():
-                result.add_warning("No changes to commit")
-                return True
-
-            # Stage files if auto_stage is enabled
-            if self.config.parameters.get("auto_stage", True):
-                await self._run_git_command(["git", "add", "."], project_dir)
-
-            # Get diff for commit message generation
-            diff_output = await self._run_git_command(
-                ["git", "diff", "--cached"], project_dir
-            )
-
-            if not diff_output.strip():
-                result.add_warning("No staged changes to commit")
-                return True
-
-            # Generate commit message
-            commit_message = await self._generate_commit_message(
-                diff_output, status_output
-            )
-
-            # Commit changes
-            commit_output = await self._run_git_command(
-                ["git", "commit", "-m", commit_message], project_dir
-            )
-
-            result.output["commit"] = {
-                "message": commit_message,
-                "output": commit_output,
-                "files_changed": len(
-                    [line for line in status_output.split("\n") if line.strip()]
-                ),
-            }
-
-            # Get commit hash
-            commit_hash = await self._run_git_command(
-                ["git", "rev-parse", "HEAD"], project_dir
-            )
-            result.metadata["commit_hash"] = commit_hash.strip()
-
-            # Push if configured
-            if self.config.parameters.get("push_after_commit", False):
-                push_output = await self._run_git_command(["git", "push"], project_dir)
-                result.output["push"] = push_output
-
-            return True
-
-        except Exception as e:
-            result.add_error(f"Commit failed: {str(e)}")
-            return False
+        if process.returncode == 0:
+            # Count generated files
+            site_dir = project_path / "site"
+            if site_dir.exists():
+                html_files = list(site_dir.rglob("*.html"))
+                result.metadata["generated_pages"] = len(html_files)
+                result.add_artifact(str(site_dir))
 
-    async def _handle_status(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git status check."""
-        try:
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-            branch_output = await self._run_git_command(
-                ["git", "branch", "--show-current"], project_dir
+            result.set_completed(True)
+        else:
+            result.add_error(
+                f"MkDocs build failed: {stderr.decode('utf-8') if stderr else 'Unknown error'}"
             )
+            result.set_completed(False)
 
-            result.output["status"] = {
-                "porcelain": status_output,
-                "current_branch": branch_output.strip(),
-                "clean": not status_output.strip(),
-            }
+    def validate_config(self) -> List[str]:
+        """Validate documentation generator configuration."""
+        errors = []
 
-            # Parse status
-            modified_files = []
-            staged_files = []
-            untracked_files = []
+        tool = self.config.parameters.get("tool")
+        if tool and tool not in _VALID_DOC_TOOLS:
+            errors.append(f"Unsupported documentation tool: {tool}")
 
-            for line in status_output.split("\n"):
-                if line.strip():
-                    status_code = line[:2]
-                    filename = line[3:]
+        return errors
 
-                    if status_code[0] in ["M", "A", "D", "R", "C"]:
-                        staged_files.append(filename)
-                    if status_code[1] in ["M", "D"]:
-                        modified_files.append(filename)
-                    if status_code == "??":
-                        untracked_files.append(filename)
 
-            result.metadata["files"] = {
-                "staged": len(staged_files),
-                "modified": len(modified_files),
-                "untracked": len(untracked_files),
-            }
+class SecurityScannerUtility(BaseUtility):
+    """Utility for security scanning."""
 
-            return True
+    @classmethod
+    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
+        return UtilityConfig(
+            name=name,
+            category=category,
+            description="Scan for security vulnerabilities",
+            parameters={
+                "tools": ["bandit", "safety"],
+                "include_dependencies": True,
+                "severity_threshold": "medium",
+            },
+            timeout_seconds=240,
+        )
 
-        except Exception as e:
-            result.add_error(f"Status check failed: {str(e)}")
-            return False
+    async def execute(self, context: Dict[str, Any]) -> UtilityResult:
+        """Execute security scan."""
+        result = self.create_result()
 
-    async def _handle_branch(
-        self, project_dir: str, result: UtilityResult, context: Dict[str, Any]
-    ) -> bool:
-        """Handle Git branch operations."""
         try:
-            branch_operation = context.get(
-                "branch_operation", "list"
-            )  # list, create, switch, delete
-            branch_name = context.get("branch_name")
-
-            if branch_operation == "list":
-                branches_output = await self._run_git_command(
-                    ["git", "branch", "-a"], project_dir
-                )
-                result.output["branches"] = branches_output
-
-            elif branch_operation == "create" and branch_name:
-                create_output = await self._run_git_command(
-                    ["git", "branch", branch_name], project_dir
-                )
-                result.output["branch_create"] = create_output
+            project_dir = context.get("project_dir", ".")
+            tools = self.config.parameters.get("tools", ["bandit"])
 
-            elif branch_operation == "switch" and branch_name:
-                switch_output = await self._run_git_command(
-                    ["git", "checkout", branch_name], project_dir
-                )
-                result.output["branch_switch"] = switch_output
+            scan_results = {}
 
-            elif branch_operation == "delete" and branch_name:
-                delete_output = await self._run_git_command(
-                    ["git", "branch", "-d", branch_name], project_dir
-                )
-                result.output["branch_delete"] = delete_output
+            for tool in tools:
+                if tool == "bandit":
+                    tool_result = await self._run_bandit(project_dir)
+                elif tool == "safety":
+                    tool_result = await self._run_safety(project_dir)
+                else:
+                    tool_result = {"error": f"Unknown security tool: {tool}"}
 
-            else:
-                result.add_error(f"Invalid branch operation: {branch_operation}")
-                return False
+                scan_results[tool] = tool_result
 
-            return True
+            result.output["scan_results"] = scan_results
 
-        except Exception as e:
-            result.add_error(f"Branch operation failed: {str(e)}")
-            return False
+            # Aggregate results
+            total_issues = 0
+            high_severity = 0
 
-    async def _handle_push(self, project_dir: str, result: UtilityResult) -> bool:
-        """Handle Git push operation."""
-        try:
-            push_output = await self._run_git_command(["git", "push"], project_dir)
-            result.output["push"] = push_output
-            return True
+            for tool, tool_result in scan_results.items():
+                if "issues" in tool_result:
+                    issues = tool_result["issues"]
+                    total_issues += len(issues)
 
-        except Exception as e:
-            result.add_error(f"Push failed: {str(e)}")
-            return False
+                    for issue in issues:
+                        if issue.get("severity", "").lower() in ["high", "critical"]:
+                            high_severity += 1
 
-    async def _run_git_command(self, cmd: List[str], project_dir: str) -> str:
-        """Run a Git command and return output."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+            result.metadata["total_issues"] = total_issues
+            result.metadata["high_severity_issues"] = high_severity
 
-        stdout, stderr = await process.communicate()
+            # Set completion status
+            threshold = self.config.parameters.get("severity_threshold", "medium")
+            if threshold == "high" and high_severity == 0:
+                result.set_completed(True)
+            elif threshold == "medium" and total_issues == 0:
+                result.set_completed(True)
+            else:
+                result.set_completed(total_issues == 0)
 
-        if process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-            raise Exception(f"Git command failed: {' '.join(cmd)} - {error_msg}")
+        except Exception as e:
+            result.add_error(f"Security scan failed: {str(e)}")
+            result.set_completed(False)
 
-        return stdout.decode("utf-8")
+        return result
 
-    async def _generate_commit_message(
-        self, diff_output: str, status_output: str
-    ) -> str:
-        """Generate intelligent commit message using Claude API."""
+    async def _run_bandit(self, project_dir: str) -> Dict[str, Any]:
+        """Run Bandit security scanner."""
         try:
-            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
-            style = self.config.parameters.get("commit_message_style", "conventional")
-
-            # Truncate diff if too large
-            if len(diff_output) > max_diff_size:
-                diff_output = diff_output[:max_diff_size] + "\n[... diff truncated ...]"
-
-            # Create prompt for commit message generation
-            prompt = f"""
-Generate a {style} commit message for the following changes.
-
-Style guidelines:
-- conventional: Use conventional commit format (type(scope): description)
-- descriptive: Clear, descriptive message explaining what changed
-- concise: Brief but informative message
-
-Git status:
-{status_output}
+            import tempfile
 
-Git diff:
-{diff_output}
+            # Have bandit write its report to disk rather than through a pipe
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                report_path = Path(tmp_dir) / "bandit.json"
+                cmd = [
+                    "bandit",
+                    "-r",
+                    project_dir,
+                    "-f",
+                    "json",
+                    "-o",
+                    str(report_path),
+                ]
+                async with subprocess_slots():
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
 
-Generate only the commit message, no additional text or explanation.
-"""
+                    _, stderr = await process.communicate()
+                report = report_path.read_bytes() if report_path.exists() else b""
 
-            # Use Claude CLI to generate commit message
-            import tempfile
+            if report:
+                bandit_data = _loads_json(report)
+                issues = bandit_data.get("results", [])
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                f.write(prompt)
-                temp_file = f.name
+                return {
+                    "tool": "bandit",
+                    "issues": issues,
+                    "summary": bandit_data.get("metrics", {}),
+                }
+            else:
+                return {
+                    "tool": "bandit",
+                    "issues": [],
+                    "error": stderr.decode("utf-8") if stderr else "No output",
+                }
 
-            try:
-                cmd = [
-                    "claude",
-                    "--model",
-                    "claude-3-5-sonnet-20241022",
-                    "--max-tokens",
-                    "200",
-                    "--temperature",
-                    "0.1",
-                    "--file",
-                    temp_file,
-                ]
+        except Exception as e:
+            return {"tool": "bandit", "error": str(e)}
 
+    async def _run_safety(self, project_dir: str) -> Dict[str, Any]:
+        """Run Safety dependency scanner."""
+        try:
+            cmd = ["safety", "check", "--json"]
+            async with subprocess_slots():
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
+                    cwd=project_dir,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
 
                 stdout, stderr = await process.communicate()
 
-                if process.returncode == 0 and stdout:
-                    commit_message = stdout.decode("utf-8").strip()
-                    # Clean up any unwanted formatting
-                    commit_message = commit_message.replace('"', "").replace("\n", " ")
-                    return commit_message
-                else:
-                    # Fallback to simple message
-                    return self._generate_fallback_commit_message(status_output)
+            if stdout:
+                safety_data = _loads_json(stdout)
 
-            finally:
-                try:
-                    Path(temp_file).unlink()
-                except:
-                    pass
+                return {
+                    "tool": "safety",
+                    "issues": safety_data,
+                    "summary": {"vulnerable_packages": len(safety_data)},
+                }
+            else:
+                return {
+                    "tool": "safety",
+                    "issues": [],
+                    "message": "No vulnerabilities found",
+                }
 
-        except Exception:
-            # Fallback to simple message generation
-            return self._generate_fallback_commit_message(status_output)
+        except Exception as e:
+            return {"tool": "safety", "error": str(e)}
 
-    def _generate_fallback_commit_message(self, status_output: str) -> str:
-        """Generate fallback commit message without API."""
-        lines = [line for line in status_output.split("\n") if line.strip()]
+    def validate_config(self) -> List[str]:
+        """Validate security scanner configuration."""
+        errors = []
 
-        if not lines:
-            return "Update project files"
+        tools = self.config.parameters.get("tools", [])
+        supported_tools = ["bandit", "safety", "semgrep"]
 
-        # Count different types of changes
-        added = len([line for line in lines if line.startswith("A")])
-        modified = len(
-            [line for line in lines if line.startswith("M") or line.startswith(" M")]
-        )
-        deleted = len([line for line in lines if line.startswith("D")])
+        for tool in tools:
+            if tool not in supported_tools:
+                errors.append(f"Unsupported security tool: {tool}")
 
-        # Generate message based on changes
-        if added and not modified and not deleted:
-            return f"Add {added} new file{'s' if added > 1 else ''}"
-        elif modified and not added and not deleted:
-            return f"Update {modified} file{'s' if modified > 1 else ''}"
-        elif deleted and not added and not modified:
-            return f"Remove {deleted} file{'s' if deleted > 1 else ''}"
-        else:
-            total = added + modified + deleted
-            return f"Update project: {total} file{'s' if total > 1 else ''} changed"
+        return errors
+
+
+class BuildUtility(CommandUtility):
+    """Utility for building projects."""
+
+    def __init__(self, config: UtilityConfig):
+        command = config.parameters.get("command", "uv build")
+        # Plain commands such as the default `uv build` are exec'd directly,
+        # sparing a /bin/sh process per build
+        super().__init__(config, command, shell=None)
+
+    @classmethod
+    def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
+        return UtilityConfig(
+            name=name,
+            category=category,
+            description="Build project artifacts",
+            parameters={
+                "command": "uv build",
+                "output_dir": "dist/",
+                "clean_first": True,
+            },
+            timeout_seconds=300,
+        )
 
     def validate_config(self) -> List[str]:
-        """Validate Git manager configuration."""
+        """Validate build utility configuration."""
         errors = []
 
-        style = self.config.parameters.get("commit_message_style")
-        if style and style not in ["conventional", "descriptive", "concise"]:
-            errors.append(f"Unsupported commit message style: {style}")
-
-        branch_strategy = self.config.parameters.get("branch_strategy")
-        if branch_strategy and branch_strategy not in [
-            "feature",
-            "hotfix",
-            "release",
-            "main",
-        ]:
-            errors.append(f"Unsupported branch strategy: {branch_strategy}")
+        if not self.config.parameters.get("command"):
+            errors.append("Build command is required")
 
         return errors
 
@@ -3431,7 +1360,7 @@ class DeploymentUtility(BaseUtility):
             errors.append("Deployment target is required")
 
         strategy = self.config.parameters.get("strategy")
-        if strategy and strategy not in ["direct", "blue_green", "canary"]:
+        if strategy and strategy not in _VALID_DEPLOY_STRATEGIES:
             errors.append(f"Unsupported deployment strategy: {strategy}")
 
         return errors
@@ -3472,7 +1401,10 @@ class ArchivistUtility(BaseUtility):
                     "changes",
                     "architecture",
                 ],
-                "chunk_size": 100000,  # characters per chunk
+                "chunk_size": 100000,  # bytes of file content per chunk
+                "max_chunks": 4,  # chunks summarized separately, then merged
+                "max_concurrent_summaries": 2,  # parallel Claude CLI calls
+                "reuse_summaries": True,  # skip types whose inputs are unchanged
             },
             timeout_seconds=300,
         )
@@ -3483,36 +1415,67 @@ class ArchivistUtility(BaseUtility):
 
         try:
             project_dir = context.get("project_dir", ".")
-            summary_types = self.config.parameters.get(
-                "summary_types", ["code_overview"]
+            # Each type is generated once, even if listed more than once
+            summary_types = list(
+                dict.fromkeys(
+                    self.config.parameters.get("summary_types", ["code_overview"])
+                )
             )
 
-            # Collect project content
-            content = await self._collect_project_content(project_dir)
-
-            if not content:
+            # Find matching files. Their names, sizes and mtimes fingerprint the
+            # project, so summaries stored for unchanged content are reused
+            # without reading any file bodies.
+            files = self._find_project_files(project_dir)
+            if not files:
                 result.add_warning("No content found to summarize")
                 result.set_completed(True)
                 return result
 
-            # Generate summaries for each requested type
-            summaries = {}
+            fingerprint = self._content_fingerprint(project_dir, files)
+            reused = self._load_stored_summaries(
+                project_dir, fingerprint, summary_types, result
+            )
+            pending_types = [t for t in summary_types if t not in reused]
+
+            generated = {}
+            if pending_types:
+                # Collect project content
+                content = await self._collect_project_content(project_dir, files)
+
+                if not content["files"]:
+                    result.add_warning("No content found to summarize")
+                    result.set_completed(True)
+                    return result
+
+                # Format content once, split at file boundaries into API-sized
+                # chunks, and share it across all summary types
+                outcomes = await self._generate_summaries(
+                    self._format_content_chunks(content), pending_types
+                )
 
-            for summary_type in summary_types:
-                try:
-                    summary = await self._generate_summary(content, summary_type)
-                    summaries[summary_type] = summary
-                except Exception as e:
-                    result.add_error(
-                        f"Failed to generate {summary_type} summary: {str(e)}"
-                    )
+                for summary_type, outcome in zip(pending_types, outcomes, strict=True):
+                    if isinstance(outcome, Exception):
+                        result.add_error(
+                            f"Failed to generate {summary_type} summary: "
+                            f"{str(outcome)}"
+                        )
+                    else:
+                        generated[summary_type] = outcome
+
+                result.metadata["content_size"] = content["metadata"]["total_size"]
+
+            summaries = {
+                summary_type: reused.get(summary_type, generated.get(summary_type))
+                for summary_type in summary_types
+                if summary_type in reused or summary_type in generated
+            }
 
             result.output["summaries"] = summaries
-            result.metadata["content_size"] = len(str(content))
             result.metadata["summary_count"] = len(summaries)
+            result.metadata["reused_summaries"] = len(reused)
 
             # Store summaries as artifacts
-            await self._store_summaries(summaries, project_dir, result)
+            await self._store_summaries(generated, project_dir, result, fingerprint)
 
             result.set_completed(len(summaries) > 0)
 
@@ -3522,12 +1485,123 @@ class ArchivistUtility(BaseUtility):
 
         return result
 
-    async def _collect_project_content(self, project_dir: str) -> Dict[str, Any]:
-        """Collect relevant project content."""
-        project_path = Path(project_dir)
+    async def _generate_summaries(
+        self, content_chunks: List[str], summary_types: List[str]
+    ) -> List[Any]:
+        """Generate each summary type from the content chunks concurrently.
+
+        Each chunk is summarized separately and the partial summaries are then
+        merged.
+
+        Returns:
+            Summary or raised exception for each type, in order
+
+        """
+        # Generate summaries for each requested type concurrently
+        semaphore = asyncio.Semaphore(
+            self.config.parameters.get("max_concurrent_summaries", 2)
+        )
+
+        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
+
+        async with _ClaudeSessionPool(
+            model,
+            max_tokens=self.config.parameters.get("max_tokens", 4000),
+            temperature=self.config.parameters.get("temperature"),
+        ) as claude:
+
+            # The first summary type sends each chunk alone; the others
+            # wait for it, so they read the chunk from the prompt cache
+            # instead of all writing it at once.
+            primed = [asyncio.Event() for _ in content_chunks]
+
+            async def summarize(index: int, summary_type: str) -> str:
+                first = summary_type == summary_types[0]
+                if not first:
+                    await primed[index].wait()
+                try:
+                    async with semaphore:
+                        return await self._generate_summary(
+                            content_chunks[index], summary_type, claude
+                        )
+                finally:
+                    if first:
+                        primed[index].set()
+
+            async def generate(summary_type: str) -> str:
+                # Summarize each chunk concurrently, then merge the parts
+                partials = await asyncio.gather(
+                    *(
+                        summarize(index, summary_type)
+                        for index in range(len(content_chunks))
+                    )
+                )
+                if len(partials) == 1:
+                    return partials[0]
+                async with semaphore:
+                    return await self._merge_summaries(partials, summary_type, claude)
+
+            return await asyncio.gather(
+                *(generate(summary_type) for summary_type in summary_types),
+                return_exceptions=True,
+            )
+
+    def _find_project_files(self, project_dir: str) -> List[os.DirEntry]:
+        """Find project files matching the include and exclude patterns."""
         include_patterns = self.config.parameters.get("include_patterns", ["*.py"])
         exclude_patterns = self.config.parameters.get("exclude_patterns", [])
 
+        # Compile patterns once; excluded directories are pruned during the walk
+        include_suffixes, include_re = _split_include_globs(tuple(include_patterns))
+        exclude_re = _compile_excludes(tuple(exclude_patterns))
+        if not include_suffixes and include_re is None:
+            return []
+
+        def should_include(name: str) -> bool:
+            """Check if file should be included."""
+            if name.endswith(include_suffixes):
+                return True
+            return include_re is not None and include_re.match(name) is not None
+
+        return [
+            entry
+            for entry in _walk_files(str(Path(project_dir)), exclude_re)
+            if should_include(entry.name)
+        ]
+
+    def _content_fingerprint(self, project_dir: str, files: List[os.DirEntry]) -> str:
+        """Fingerprint matched files by path, size and mtime.
+
+        The model and chunk size are included since they shape the summaries.
+        Stored summaries are left out, so writing them does not invalidate it.
+        """
+        root_prefix_len = len(os.path.join(str(Path(project_dir)), ""))
+        summaries_prefix = os.path.join(".apex", "summaries", "")
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for key in ("model", "chunk_size", "max_chunks"):
+            hasher.update(f"{key}={self.config.parameters.get(key)}\0".encode())
+        for entry in files:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            relative_path = entry.path[root_prefix_len:]
+            if relative_path.startswith(summaries_prefix):
+                continue
+            hasher.update(
+                f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode(
+                    "utf-8", errors="surrogateescape"
+                )
+            )
+        return hasher.hexdigest()
+
+    async def _collect_project_content(
+        self, project_dir: str, files: Optional[List[os.DirEntry]] = None
+    ) -> Dict[str, Any]:
+        """Collect relevant project content."""
+        project_path = Path(project_dir)
+
         content = {
             "files": {},
             "structure": [],
@@ -3538,222 +1612,353 @@ class ArchivistUtility(BaseUtility):
             },
         }
 
-        def should_include(file_path: Path) -> bool:
-            """Check if file should be included."""
-            # Check exclude patterns first
-            for pattern in exclude_patterns:
-                if pattern in str(file_path):
-                    return False
-
-            # Check include patterns
-            for pattern in include_patterns:
-                if file_path.match(pattern):
-                    return True
+        matched = self._find_project_files(project_dir) if files is None else files
+
+        # Entries are joined onto this root, so relative paths are plain slices
+        root_prefix_len = len(os.path.join(str(project_path), ""))
+
+        # Collect file metadata and structure. Matching files are described in
+        # batches on a dedicated I/O pool, so reads overlap and the event loop
+        # stays free without paying for one future per file. Batches shrink
+        # for small projects so every worker still gets a share.
+        # Files larger than a whole chunk cannot fit one and are not read.
+        loop = asyncio.get_running_loop()
+        executor = _get_io_executor()
+        max_size = self.config.parameters.get("chunk_size", 100000)
+        batch_size = max(1, min(_DESCRIBE_BATCH, -(-len(matched) // _IO_WORKERS)))
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _describe_files,
+                    [entry.path for entry in matched[start : start + batch_size]],
+                    max_size,
+                )
+                for start in range(0, len(matched), batch_size)
+            )
+        )
+        file_infos = [file_info for batch in batches for file_info in batch]
 
-            return False
+        for entry, file_info in zip(matched, file_infos, strict=True):
+            if file_info is None:
+                # Skip binary files and files that can't be read
+                continue
 
-        # Collect file content and structure
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and should_include(file_path):
-                try:
-                    relative_path = file_path.relative_to(project_path)
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        file_content = f.read()
-
-                    content["files"][str(relative_path)] = {
-                        "content": file_content,
-                        "size": len(file_content),
-                        "lines": len(file_content.splitlines()),
-                    }
-
-                    content["structure"].append(
-                        {
-                            "path": str(relative_path),
-                            "size": len(file_content),
-                            "type": file_path.suffix,
-                        }
-                    )
+            relative_path = entry.path[root_prefix_len:]
+            content["files"][relative_path] = file_info
 
-                    content["metadata"]["total_files"] += 1
-                    content["metadata"]["total_size"] += len(file_content)
+            content["structure"].append(
+                {
+                    "path": relative_path,
+                    "size": file_info["size"],
+                    "type": os.path.splitext(entry.name)[1],
+                }
+            )
 
-                except Exception:
-                    # Skip files that can't be read
-                    continue
+            content["metadata"]["total_files"] += 1
+            content["metadata"]["total_size"] += file_info["size"]
 
         return content
 
     async def _generate_summary(
-        self, content: Dict[str, Any], summary_type: str
+        self, content_text: str, summary_type: str, claude: _ClaudeSessionPool
     ) -> str:
         """Generate summary using Claude API via CLI."""
-        model = self.config.parameters.get("model", "claude-3-5-sonnet-20241022")
-        max_tokens = self.config.parameters.get("max_tokens", 4000)
-        temperature = self.config.parameters.get("temperature", 0.1)
-
-        # Create prompt based on summary type
-        prompts = {
-            "code_overview": """
-Analyze this codebase and provide a comprehensive code overview. Include:
-1. Main components and their purposes
-2. Architecture patterns used
-3. Key classes and functions
-4. Dependencies and integrations
-5. Code quality observations
-6. Suggested improvements
-
-Be concise but thorough. Focus on the most important aspects.
-""",
-            "documentation": """
-Generate comprehensive documentation for this codebase. Include:
-1. Project purpose and overview
-2. Setup and installation instructions
-3. Usage examples
-4. API documentation for key components
-5. Configuration options
-6. Troubleshooting guide
-
-Structure it as proper documentation with clear sections.
-""",
-            "changes": """
-Analyze this codebase and summarize recent changes and evolution. Include:
-1. Major architectural changes
-2. New features added
-3. Improvements and optimizations
-4. Bug fixes and stability improvements
-5. Deprecated or removed functionality
-6. Migration notes if applicable
+        prompt = _SUMMARY_PROMPTS.get(summary_type, _SUMMARY_PROMPTS["code_overview"])
+
+        async with claude.session(content_text) as session:
+            if session.context == content_text:
+                # The conversation already holds the content; send only the
+                # instruction for this summary type
+                summary = await session.ask(
+                    f"Using the same project content as above:\n{prompt}"
+                )
+            else:
+                # Send the shared project content first, marked cacheable, so
+                # every summary type reuses one cache entry; only the
+                # instruction differs.
+                summary = await session.ask(
+                    "--- PROJECT CONTENT ---\n\n",
+                    content_text,
+                    f"\n\n--- END PROJECT CONTENT ---\n{prompt}",
+                    cache_through=1,
+                )
+                session.context = content_text
 
-Focus on what has changed and why.
-""",
-            "architecture": """
-Provide a detailed architectural analysis of this codebase. Include:
-1. Overall system architecture
-2. Component relationships and data flow
-3. Design patterns employed
-4. Scalability considerations
-5. Security architecture
-6. Performance characteristics
-7. Areas for architectural improvement
+        if not summary.strip():
+            raise Exception("Claude API call failed: empty response")
+        return summary.strip()
 
-Be technical and specific about architectural decisions.
-""",
-        }
+    async def _merge_summaries(
+        self, partials: List[str], summary_type: str, claude: _ClaudeSessionPool
+    ) -> str:
+        """Merge summaries of content chunks into one summary."""
+        prompt = _SUMMARY_PROMPTS.get(summary_type, _SUMMARY_PROMPTS["code_overview"])
+        parts = "\n\n".join(
+            f"--- PART {index} ---\n{partial}"
+            for index, partial in enumerate(partials, 1)
+        )
 
-        prompt = prompts.get(summary_type, prompts["code_overview"])
+        async with claude.session() as session:
+            summary = await session.ask(
+                _SUMMARY_MERGE_PROMPT.format(count=len(partials), prompt=prompt),
+                parts,
+            )
 
-        # Prepare content for API
-        content_text = self._format_content_for_api(content)
+        if not summary.strip():
+            raise Exception("Claude API call failed: empty response")
+        return summary.strip()
 
-        # Create temporary file with content
-        import tempfile
+    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
+        """Format content for API consumption."""
+        return self._format_content_chunks(content, max_chunks=1)[0]
+
+    def _format_content_chunks(
+        self, content: Dict[str, Any], max_chunks: Optional[int] = None
+    ) -> List[str]:
+        """Format content into API-sized chunks split at file boundaries.
+
+        The first chunk carries the project overview. Content left over after
+        ``max_chunks`` chunks is truncated.
+        """
+        if max_chunks is None:
+            max_chunks = self.config.parameters.get("max_chunks", 4)
+
+        # Group identical files by digest so each unique body is sent once
+        paths_by_digest: Dict[str, List[str]] = {}
+        for file_path, file_info in content.get("files", {}).items():
+            paths_by_digest.setdefault(file_info.get("digest", file_path), []).append(
+                file_path
+            )
+        file_groups = list(paths_by_digest.values())
+
+        chunks = []
+        start = 0
+        while True:
+            buf = io.StringIO()
+            start, wrote_file = self._write_content_for_api(
+                content,
+                buf,
+                file_groups,
+                start,
+                part=len(chunks) + 1,
+                final=len(chunks) + 1 >= max_chunks,
+            )
+            # Drop continuation chunks holding only omitted files
+            if wrote_file or not chunks:
+                chunks.append(buf.getvalue())
+            if start >= len(file_groups) or len(chunks) >= max_chunks:
+                return chunks
+
+    def _write_content_for_api(
+        self,
+        content: Dict[str, Any],
+        out: TextIO,
+        file_groups: List[List[str]],
+        start: int,
+        part: int = 1,
+        final: bool = True,
+    ) -> Tuple[int, bool]:
+        """Stream one chunk of formatted content into a text handle.
+
+        Writes the file groups from ``start`` on while they fit the chunk size.
+        Sizes are counted in bytes; decoded text is never longer, so a chunk
+        never holds more characters than ``chunk_size`` either.
+
+        Returns:
+            Index of the first file group not written, and whether any file
+            content was written
+
+        """
+        chunk_size = self.config.parameters.get("chunk_size", 100000)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(f"{prompt}\n\n--- PROJECT CONTENT ---\n\n{content_text}")
-            temp_file = f.name
+        current_size = 0
 
-        try:
-            # Use Claude CLI to generate summary
-            cmd = [
-                "claude",
-                "--model",
-                model,
-                "--max-tokens",
-                str(max_tokens),
-                "--temperature",
-                str(temperature),
-                "--file",
-                temp_file,
-            ]
+        def emit(text: str, size: Optional[int] = None) -> None:
+            nonlocal current_size
+            if current_size:
+                out.write("\n")
+                current_size += 1
+            out.write(text)
+            current_size += len(text.encode("utf-8")) if size is None else size
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        # Add project metadata and structure
+        for text in self._content_header(content, part):
+            emit(text)
 
-            stdout, stderr = await process.communicate()
+        # Add file contents (chunked if necessary)
+        files = content.get("files", {})
+        emit("FILE CONTENTS:")
+        index = start
+        wrote_file = False
+        while index < len(file_groups):
+            file_path, *duplicate_paths = file_groups[index]
+            file_info = files[file_path]
 
-            if process.returncode == 0 and stdout:
-                summary = stdout.decode("utf-8").strip()
-                return summary
+            # Check if adding this file would exceed chunk size
+            if current_size + file_info["size"] > chunk_size:
+                if wrote_file or final or part == 1:
+                    break
+                # Too large even for a continuation chunk of its own
+                emit(f"\n[{file_path} omitted - too large for single API call]")
+                index += 1
+                continue
+
+            index += 1
+            file_content = self._read_file_content(file_info)
+            if file_content is None:
+                continue
+
+            if duplicate_paths:
+                emit(f"\n--- {file_path} (also: {', '.join(duplicate_paths)}) ---")
             else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
-                raise Exception(f"Claude API call failed: {error_msg}")
-
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
+                emit(f"\n--- {file_path} ---")
+            emit(file_content, file_info["size"])
+            wrote_file = True
 
-    def _format_content_for_api(self, content: Dict[str, Any]) -> str:
-        """Format content for API consumption."""
-        chunk_size = self.config.parameters.get("chunk_size", 100000)
+        if final and index < len(file_groups):
+            emit("\n[Content truncated - too large for single API call]")
 
-        formatted_parts = []
+        return index, wrote_file
 
-        # Add project metadata
+    def _content_header(self, content: Dict[str, Any], part: int) -> List[str]:
+        """Header lines of a content chunk: project overview or continuation."""
         metadata = content.get("metadata", {})
-        formatted_parts.append(f"PROJECT: {metadata.get('project_name', 'Unknown')}")
-        formatted_parts.append(f"Files: {metadata.get('total_files', 0)}")
-        formatted_parts.append(
-            f"Total Size: {metadata.get('total_size', 0)} characters"
-        )
-        formatted_parts.append("")
+        project_name = metadata.get("project_name", "Unknown")
+        if part > 1:
+            return [f"PROJECT: {project_name} (continued, part {part})", ""]
+
+        header = [
+            f"PROJECT: {project_name}",
+            f"Files: {metadata.get('total_files', 0)}",
+            f"Total Size: {metadata.get('total_size', 0)} bytes",
+            "",
+        ]
 
         # Add project structure
         structure = content.get("structure", [])
         if structure:
-            formatted_parts.append("PROJECT STRUCTURE:")
-            for item in structure[:50]:  # Limit structure items
-                formatted_parts.append(f"  {item['path']} ({item['size']} chars)")
-            formatted_parts.append("")
-
-        # Add file contents (chunked if necessary)
-        files = content.get("files", {})
-        current_size = len("\n".join(formatted_parts))
+            # Limit structure items and write them in one piece
+            header.append("PROJECT STRUCTURE:")
+            header.append(
+                "\n".join(
+                    f"  {item['path']} ({item['size']} bytes)"
+                    for item in itertools.islice(structure, 50)
+                )
+            )
+            header.append("")
+        return header
+
+    @staticmethod
+    def _read_file_content(file_info: Dict[str, Any]) -> Optional[str]:
+        """Get collected file text, reading deferred files from disk.
+
+        Returns None if the file was removed or became unreadable since it
+        was collected.
+        """
+        file_content = file_info.get("content")
+        if file_content is not None:
+            return file_content
+        try:
+            with open(file_info["source_path"], "rb") as f:
+                return _decode_text(f.read())
+        except OSError:
+            return None
+
+    def _load_stored_summaries(
+        self,
+        project_dir: str,
+        fingerprint: str,
+        summary_types: List[str],
+        result: UtilityResult,
+    ) -> Dict[str, str]:
+        """Load stored summaries that were generated from identical content.
+
+        Nothing is loaded when ``reuse_summaries`` is turned off.
+        """
+        if not self.config.parameters.get("reuse_summaries", True):
+            return {}
+
+        summaries_dir = Path(project_dir) / ".apex" / "summaries"
+        try:
+            with open(summaries_dir / ".fingerprints.json", encoding="utf-8") as f:
+                fingerprints = json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        formatted_parts.append("FILE CONTENTS:")
-        for file_path, file_info in files.items():
-            file_content = file_info["content"]
+        summaries = {}
+        for summary_type in summary_types:
+            if fingerprints.get(summary_type) != fingerprint:
+                continue
 
-            # Check if adding this file would exceed chunk size
-            if current_size + len(file_content) > chunk_size:
-                formatted_parts.append(
-                    "\n[Content truncated - too large for single API call]"
-                )
-                break
+            summary_file = summaries_dir / f"{summary_type}_summary.md"
+            try:
+                stored = summary_file.read_text(encoding="utf-8")
+            except OSError:
+                continue
 
-            formatted_parts.append(f"\n--- {file_path} ---")
-            formatted_parts.append(file_content)
-            current_size += len(file_content) + len(file_path) + 10
+            # Drop the header written by _store_summaries
+            _, separator, summary = stored.partition("\n---\n\n")
+            if separator:
+                summaries[summary_type] = summary
+                result.add_artifact(str(summary_file))
 
-        return "\n".join(formatted_parts)
+        return summaries
 
     async def _store_summaries(
-        self, summaries: Dict[str, str], project_dir: str, result: UtilityResult
+        self,
+        summaries: Dict[str, str],
+        project_dir: str,
+        result: UtilityResult,
+        fingerprint: Optional[str] = None,
     ):
         """Store generated summaries as artifacts."""
         project_path = Path(project_dir)
         summaries_dir = project_path / ".apex" / "summaries"
         summaries_dir.mkdir(parents=True, exist_ok=True)
 
-        for summary_type, summary_content in summaries.items():
-            summary_file = summaries_dir / f"{summary_type}_summary.md"
-
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(f"# {summary_type.replace('_', ' ').title()} Summary\n\n")
-                f.write("Generated by APEX Archivist Utility\n")
-                f.write(f"Date: {result.started_at}\n\n")
-                f.write("---\n\n")
-                f.write(summary_content)
+        # Everything after the title is shared by all summaries
+        header = (
+            f"Generated by APEX Archivist Utility\nDate: {result.started_at}\n\n---\n\n"
+        )
 
+        # Write the summary files concurrently on the I/O pool
+        loop = asyncio.get_running_loop()
+        executor = _get_io_executor()
+        summary_files = [
+            summaries_dir / f"{summary_type}_summary.md" for summary_type in summaries
+        ]
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _write_text,
+                    summary_file,
+                    _summary_heading(summary_type),
+                    header,
+                    summary_content,
+                )
+                for summary_file, (summary_type, summary_content) in zip(
+                    summary_files, summaries.items(), strict=True
+                )
+            )
+        )
+        for summary_file in summary_files:
             result.add_artifact(str(summary_file))
 
+        # Record the content each summary was generated from
+        if fingerprint is not None and summaries:
+            fingerprints_file = summaries_dir / ".fingerprints.json"
+            try:
+                with open(fingerprints_file, encoding="utf-8") as f:
+                    fingerprints = json.load(f)
+            except (OSError, ValueError):
+                fingerprints = {}
+
+            fingerprints.update(dict.fromkeys(summaries, fingerprint))
+            with open(fingerprints_file, "w", encoding="utf-8") as f:
+                json.dump(fingerprints, f, indent=2)
+
     def validate_config(self) -> List[str]:
         """Validate archivist utility configuration."""
         errors = []
@@ -3763,22 +1968,33 @@ Be technical and specific about architectural decisions.
             errors.append(f"Unsupported model: {model}")
 
         summary_types = self.config.parameters.get("summary_types", [])
-        valid_types = ["code_overview", "documentation", "changes", "architecture"]
-
         for summary_type in summary_types:
-            if summary_type not in valid_types:
+            if summary_type not in _VALID_SUMMARY_TYPES:
                 errors.append(f"Unsupported summary type: {summary_type}")
 
         max_tokens = self.config.parameters.get("max_tokens", 4000)
         if max_tokens > 8192:
             errors.append("max_tokens cannot exceed 8192")
 
+        max_concurrent = self.config.parameters.get("max_concurrent_summaries", 2)
+        if max_concurrent < 1:
+            errors.append("max_concurrent_summaries must be at least 1")
+
+        max_chunks = self.config.parameters.get("max_chunks", 4)
+        if max_chunks < 1:
+            errors.append("max_chunks must be at least 1")
+
         return errors
 
 
 class GitManagerUtility(BaseUtility):
     """Utility for intelligent Git operations and commit generation."""
 
+    def __init__(self, config: UtilityConfig):
+        super().__init__(config)
+        self._repos: Dict[str, Any] = {}
+        self._message_caches: Dict[str, _CommitMessageCache] = {}
+
     @classmethod
     def get_default_config(cls, name: str, category: UtilityCategory) -> UtilityConfig:
         return UtilityConfig(
@@ -3793,6 +2009,8 @@ class GitManagerUtility(BaseUtility):
                 "include_file_changes": True,
                 "branch_strategy": "feature",  # feature, hotfix, release
                 "push_after_commit": False,
+                "trivial_change_lines": 10,  # below this, skip the LLM (0 = never)
+                "cache_messages": True,  # reuse messages for identical diffs
             },
             timeout_seconds=120,
             required_tools=["git"],
@@ -3809,7 +2027,7 @@ class GitManagerUtility(BaseUtility):
             )  # commit, status, branch, push
 
             # Check if we're in a Git repository
-            if not await self._is_git_repo(project_dir):
+            if not self._is_git_repo(project_dir):
                 result.add_error("Not a Git repository")
                 result.set_completed(False)
                 return result
@@ -3817,7 +2035,7 @@ class GitManagerUtility(BaseUtility):
             if operation == "commit":
                 success = await self._handle_commit(project_dir, result)
             elif operation == "status":
-                success = await self._handle_status(project_dir, result)
+                success = await self._handle_status(project_dir, result, context)
             elif operation == "branch":
                 success = await self._handle_branch(project_dir, result, context)
             elif operation == "push":
@@ -3834,31 +2052,30 @@ class GitManagerUtility(BaseUtility):
 
         return result
 
-    async def _is_git_repo(self, project_dir: str) -> bool:
-        """Check if directory is a Git repository."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--git-dir",
-                cwd=project_dir,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.communicate()
-            return process.returncode == 0
-        except:
-            return False
+    def _is_git_repo(self, project_dir: str) -> bool:
+        """Check if directory is inside a Git work tree.
+
+        Looks for a ``.git`` directory or file in the directory and its
+        parents instead of spawning ``git rev-parse``.
+        """
+        if self._open_repo(project_dir) is not None:
+            return True
+
+        current = Path(project_dir).resolve()
+        for directory in (current, *current.parents):
+            if (directory / ".git").exists():
+                return True
+        return False
 
     async def _handle_commit(self, project_dir: str, result: UtilityResult) -> bool:
         """Handle Git commit with intelligent message generation."""
         try:
-            # Get current status
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
+            # Get current status; porcelain output has one newline-terminated
+            # entry per changed path, so counting newlines counts the changes
+            status_output = await self._get_status(project_dir)
+            files_changed = status_output.count("\n")
 
-            if not status_output.strip():
+            if not files_changed:
                 result.add_warning("No changes to commit")
                 return True
 
@@ -3866,37 +2083,57 @@ class GitManagerUtility(BaseUtility):
             if self.config.parameters.get("auto_stage", True):
                 await self._run_git_command(["git", "add", "."], project_dir)
 
-            # Get diff for commit message generation
-            diff_output = await self._run_git_command(
-                ["git", "diff", "--cached"], project_dir
+            # Get a bounded diff for commit message generation: numstat and stat
+            # summary in full, the patch read off the pipe up to the size cap.
+            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
+            numstat_output, stat_output, patch_output, truncated = (
+                await self._get_staged_diff(project_dir, max_diff_size)
             )
 
-            if not diff_output.strip():
+            # A truncated patch always means something is staged
+            if not stat_output.strip() and not truncated:
                 result.add_warning("No staged changes to commit")
                 return True
 
-            # Generate commit message
-            commit_message = await self._generate_commit_message(
-                diff_output, status_output
-            )
+            truncation_marker = "\n[... diff truncated ...]"
+            patch_limit = max_diff_size - len(stat_output) - len(truncation_marker) - 1
+            if truncated or len(patch_output) > patch_limit:
+                patch_output = patch_output[: max(patch_limit, 0)] + truncation_marker
+            diff_output = f"{stat_output}\n{patch_output}"
+
+            # Generate commit message, skipping the LLM for trivial changes
+            commit_message = self._generate_trivial_commit_message(numstat_output)
+            if commit_message is None:
+                commit_message = await self._generate_commit_message(
+                    diff_output,
+                    status_output,
+                    await self._get_message_cache(project_dir),
+                )
 
-            # Commit changes
+            # Commit changes. With abbreviation off, the summary line carries
+            # the full hash of the new commit.
             commit_output = await self._run_git_command(
-                ["git", "commit", "-m", commit_message], project_dir
+                ["git", "-c", "core.abbrev=no", "commit", "-m", commit_message],
+                project_dir,
             )
 
             result.output["commit"] = {
                 "message": commit_message,
                 "output": commit_output,
-                "files_changed": len(
-                    [line for line in status_output.split("\n") if line.strip()]
-                ),
+                "files_changed": files_changed,
             }
 
             # Get commit hash
-            commit_hash = await self._run_git_command(
-                ["git", "rev-parse", "HEAD"], project_dir
-            )
+            repo = self._open_repo(project_dir)
+            summary_match = _COMMIT_SUMMARY_HASH.match(commit_output)
+            if repo is not None:
+                commit_hash = str(repo.head.target)
+            elif summary_match:
+                commit_hash = summary_match.group(1)
+            else:
+                commit_hash = await self._run_git_command(
+                    ["git", "rev-parse", "HEAD"], project_dir, quiet=True
+                )
             result.metadata["commit_hash"] = commit_hash.strip()
 
             # Push if configured
@@ -3910,14 +2147,15 @@ class GitManagerUtility(BaseUtility):
             result.add_error(f"Commit failed: {str(e)}")
             return False
 
-    async def _handle_status(self, project_dir: str, result: UtilityResult) -> bool:
+    async def _handle_status(
+        self, project_dir: str, result: UtilityResult, context: Dict[str, Any]
+    ) -> bool:
         """Handle Git status check."""
         try:
-            status_output = await self._run_git_command(
-                ["git", "status", "--porcelain"], project_dir
-            )
-            branch_output = await self._run_git_command(
-                ["git", "branch", "--show-current"], project_dir
+            include_untracked = context.get("include_untracked", True)
+            status_output, branch_output = await asyncio.gather(
+                self._get_status(project_dir, untracked=include_untracked),
+                self._get_current_branch(project_dir),
             )
 
             result.output["status"] = {
@@ -3926,27 +2164,22 @@ class GitManagerUtility(BaseUtility):
                 "clean": not status_output.strip(),
             }
 
-            # Parse status
-            modified_files = []
-            staged_files = []
-            untracked_files = []
-
-            for line in status_output.split("\n"):
-                if line.strip():
-                    status_code = line[:2]
-                    filename = line[3:]
-
-                    if status_code[0] in ["M", "A", "D", "R", "C"]:
-                        staged_files.append(filename)
-                    if status_code[1] in ["M", "D"]:
-                        modified_files.append(filename)
-                    if status_code == "??":
-                        untracked_files.append(filename)
+            # Tally entries by status code in one pass, then classify the few
+            # distinct codes rather than every line
+            code_counts = collections.Counter(
+                line[:2] for line in status_output.splitlines() if line.strip()
+            )
 
             result.metadata["files"] = {
-                "staged": len(staged_files),
-                "modified": len(modified_files),
-                "untracked": len(untracked_files),
+                "staged": sum(
+                    count for code, count in code_counts.items() if code[0] in "MADRC"
+                ),
+                "modified": sum(
+                    count
+                    for code, count in code_counts.items()
+                    if code[1:2] in ("M", "D")
+                ),
+                "untracked": code_counts["??"],
             }
 
             return True
@@ -3966,15 +2199,10 @@ class GitManagerUtility(BaseUtility):
             branch_name = context.get("branch_name")
 
             if branch_operation == "list":
-                branches_output = await self._run_git_command(
-                    ["git", "branch", "-a"], project_dir
-                )
-                result.output["branches"] = branches_output
+                result.output["branches"] = await self._list_branches(project_dir)
 
             elif branch_operation == "create" and branch_name:
-                create_output = await self._run_git_command(
-                    ["git", "branch", branch_name], project_dir
-                )
+                create_output = await self._create_branch(project_dir, branch_name)
                 result.output["branch_create"] = create_output
 
             elif branch_operation == "switch" and branch_name:
@@ -4010,115 +2238,343 @@ class GitManagerUtility(BaseUtility):
             result.add_error(f"Push failed: {str(e)}")
             return False
 
-    async def _run_git_command(self, cmd: List[str], project_dir: str) -> str:
-        """Run a Git command and return output."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+    def _open_repo(self, project_dir: str) -> Optional[Any]:
+        """Get a cached pygit2 repository handle, or None to use the git CLI."""
+        if pygit2 is None:
+            return None
+
+        if project_dir not in self._repos:
+            try:
+                repo_path = pygit2.discover_repository(project_dir)
+                self._repos[project_dir] = (
+                    pygit2.Repository(repo_path) if repo_path else None
+                )
+            except Exception:
+                self._repos[project_dir] = None
+
+        return self._repos[project_dir]
+
+    async def _get_message_cache(
+        self, project_dir: str
+    ) -> Optional[_CommitMessageCache]:
+        """Get the commit message cache, stored inside the Git directory."""
+        if not self.config.parameters.get("cache_messages", True):
+            return None
+
+        if project_dir not in self._message_caches:
+            # Keep the cache out of the work tree so `git add .` never stages it
+            repo = self._open_repo(project_dir)
+            if repo is not None:
+                git_dir = repo.path
+            else:
+                git_dir = await self._run_git_command(
+                    ["git", "rev-parse", "--absolute-git-dir"], project_dir, quiet=True
+                )
+                git_dir = git_dir.strip()
+            self._message_caches[project_dir] = _CommitMessageCache(
+                Path(git_dir) / "apex" / "commit_cache.jsonl"
+            )
+
+        return self._message_caches[project_dir]
+
+    async def _get_status(self, project_dir: str, untracked: bool = True) -> str:
+        """Get working tree status in porcelain format.
+
+        Untracked directories are listed once rather than walked file by file,
+        and are skipped altogether when ``untracked`` is false.
+        """
+        untracked_files = "normal" if untracked else "no"
+
+        repo = self._open_repo(project_dir)
+        if repo is not None:
+            try:
+                status = repo.status(untracked_files=untracked_files)
+            except TypeError:
+                # pygit2 < 1.14 always lists every untracked file
+                status = {
+                    path: flags
+                    for path, flags in repo.status().items()
+                    if untracked or flags != pygit2.GIT_STATUS_WT_NEW
+                }
+            return _porcelain_from_pygit2(status)
+
+        # No rename detection, matching the pygit2 status above
+        status = await self._run_git_command_raw(
+            [
+                "git",
+                "status",
+                "--porcelain=v2",
+                "-z",
+                "--no-renames",
+                f"--untracked-files={untracked_files}",
+            ],
+            project_dir,
+            quiet=True,
         )
+        return _porcelain_from_v2(status)
+
+    async def _get_current_branch(self, project_dir: str) -> str:
+        """Get the current branch name (empty when HEAD is detached)."""
+        repo = self._open_repo(project_dir)
+        if repo is not None:
+            if repo.head_is_detached:
+                return ""
+            head_target = repo.lookup_reference("HEAD").target
+            return head_target.removeprefix("refs/heads/")
+
+        return await self._run_git_command(
+            ["git", "branch", "--show-current"], project_dir, quiet=True
+        )
+
+    async def _list_branches(self, project_dir: str) -> str:
+        """List local and remote branches in ``git branch -a`` format."""
+        repo = self._open_repo(project_dir)
+        if repo is not None:
+            current = await self._get_current_branch(project_dir)
+            lines = [
+                f"{'*' if name == current else ' '} {name}"
+                for name in sorted(repo.branches.local)
+            ]
+            lines.extend(f"  remotes/{name}" for name in sorted(repo.branches.remote))
+            return "".join(f"{line}\n" for line in lines)
+
+        return await self._run_git_command(
+            ["git", "branch", "-a"], project_dir, quiet=True
+        )
+
+    async def _create_branch(self, project_dir: str, branch_name: str) -> str:
+        """Create a branch at HEAD, printing nothing like ``git branch``."""
+        repo = self._open_repo(project_dir)
+        if repo is not None:
+            repo.branches.local.create(branch_name, repo.head.peel(pygit2.Commit))
+            return ""
+
+        return await self._run_git_command(["git", "branch", branch_name], project_dir)
+
+    async def _run_git_command(
+        self, cmd: List[str], project_dir: str, quiet: bool = False
+    ) -> str:
+        """Run a Git command and return output."""
+        output = await self._run_git_command_raw(cmd, project_dir, quiet)
+        return output.decode("utf-8")
+
+    async def _run_git_command_raw(
+        self, cmd: List[str], project_dir: str, quiet: bool = False
+    ) -> bytes:
+        """Run a Git command and return its undecoded output.
+
+        ``quiet`` discards stderr instead of piping it; use it for read-only
+        queries whose failures need no detail.
+        """
+        async with subprocess_slots():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=(
+                    asyncio.subprocess.DEVNULL if quiet else asyncio.subprocess.PIPE
+                ),
+            )
 
-        stdout, stderr = await process.communicate()
+            stdout, stderr = await process.communicate()
 
         if process.returncode != 0:
             error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
             raise Exception(f"Git command failed: {' '.join(cmd)} - {error_msg}")
 
-        return stdout.decode("utf-8")
+        return stdout
 
-    async def _generate_commit_message(
-        self, diff_output: str, status_output: str
-    ) -> str:
-        """Generate intelligent commit message using Claude API."""
-        try:
-            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
-            style = self.config.parameters.get("commit_message_style", "conventional")
+    async def _get_staged_diff(
+        self, project_dir: str, max_diff_size: int
+    ) -> Tuple[str, str, str, bool]:
+        """Read numstat, stat summary and patch of the index.
 
-            # Truncate diff if too large
-            if len(diff_output) > max_diff_size:
-                diff_output = diff_output[:max_diff_size] + "\n[... diff truncated ...]"
+        The numstat and stat summary are read in full, so a large staged set is
+        never mistaken for an empty or trivial one; only the patch is capped at
+        ``max_diff_size``. Colour and external diff drivers from user
+        configuration are turned off, so they can neither break parsing nor
+        pad the capped output.
 
-            # Create prompt for commit message generation
-            prompt = f"""
-Generate a {style} commit message for the following changes.
+        Returns:
+            Tuple of (numstat, stat, patch, truncated)
 
-Style guidelines:
-- conventional: Use conventional commit format (type(scope): description)
-- descriptive: Clear, descriptive message explaining what changed
-- concise: Brief but informative message
+        """
+        diff_cmd = ["git", "diff", "--cached", "--no-color", "--no-ext-diff"]
+        summary, (patch, truncated) = await asyncio.gather(
+            self._run_git_command([*diff_cmd, "--numstat", "--stat=200"], project_dir),
+            self._run_git_command_capped([*diff_cmd, "-p"], project_dir, max_diff_size),
+        )
 
-Git status:
-{status_output}
+        numstat_lines = []
+        stat_lines = []
+        for line in summary.splitlines():
+            if _NUMSTAT_LINE.match(line):
+                numstat_lines.append(line)
+            elif line:
+                stat_lines.append(line)
 
-Git diff:
-{diff_output}
+        numstat = "".join(f"{line}\n" for line in numstat_lines)
+        stat = "".join(f"{line}\n" for line in stat_lines)
+        return numstat, stat, patch, truncated
 
-Generate only the commit message, no additional text or explanation.
-"""
+    async def _run_git_command_capped(
+        self, cmd: List[str], project_dir: str, limit: int
+    ) -> Tuple[str, bool]:
+        """Run a Git command, reading at most ``limit`` bytes of its output.
 
-            # Use Claude CLI to generate commit message
-            import tempfile
+        The child is killed as soon as the limit is reached, so large outputs
+        are never buffered in full.
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                f.write(prompt)
-                temp_file = f.name
+        Returns:
+            Tuple of (output, truncated)
+
+        """
+        async with subprocess_slots():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
             try:
-                cmd = [
-                    "claude",
-                    "--model",
-                    "claude-3-5-sonnet-20241022",
-                    "--max-tokens",
-                    "200",
-                    "--temperature",
-                    "0.1",
-                    "--file",
-                    temp_file,
-                ]
+                data = await process.stdout.readexactly(limit + 1)
+            except asyncio.IncompleteReadError as e:
+                # Hit EOF before the limit: this is the complete output
+                stderr = await process.stderr.read()
+                await process.wait()
 
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                if process.returncode != 0:
+                    error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
+                    raise Exception(
+                        f"Git command failed: {' '.join(cmd)} - {error_msg}"
+                    ) from e
+
+                return e.partial.decode("utf-8", errors="ignore"), False
+
+            process.kill()
+            await process.wait()
+            return data[:limit].decode("utf-8", errors="ignore"), True
+
+    async def _generate_commit_message(
+        self,
+        diff_output: str,
+        status_output: str,
+        cache: Optional[_CommitMessageCache] = None,
+    ) -> str:
+        """Generate intelligent commit message using Claude API."""
+        try:
+            max_diff_size = self.config.parameters.get("max_diff_size", 50000)
+            style = self.config.parameters.get("commit_message_style", "conventional")
+
+            # Reuse the message generated for an identical diff, if any
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.key(style, diff_output)
+                cached_message = cache.get(cache_key)
+                if cached_message is not None:
+                    return cached_message
+
+            # Truncate status and diff if too large; slices are only made when
+            # needed, so bounded inputs are passed through without copying
+            if len(status_output) > max_diff_size:
+                status_parts = (
+                    status_output[:max_diff_size],
+                    "\n[... status truncated ...]",
                 )
+            else:
+                status_parts = (status_output,)
 
-                stdout, stderr = await process.communicate()
+            if len(diff_output) > max_diff_size:
+                diff_parts = (diff_output[:max_diff_size], "\n[... diff truncated ...]")
+            else:
+                diff_parts = (diff_output,)
+
+            # Generate the commit message in a one-off conversation. The prompt
+            # is sent in pieces so the diff is never copied into one str.
+            commit_message = await _ask_claude_once(
+                "claude-3-5-sonnet-20241022",
+                _COMMIT_PROMPT_PREFIX,
+                _COMMIT_PROMPT_STATUS.format(style=style),
+                *status_parts,
+                _COMMIT_PROMPT_DIFF,
+                *diff_parts,
+                max_tokens=200,
+                temperature=0.1,
+                cache_through=0,
+            )
 
-                if process.returncode == 0 and stdout:
-                    commit_message = stdout.decode("utf-8").strip()
-                    # Clean up any unwanted formatting
-                    commit_message = commit_message.replace('"', "").replace("\n", " ")
-                    return commit_message
-                else:
-                    # Fallback to simple message
-                    return self._generate_fallback_commit_message(status_output)
+            commit_message = commit_message.strip()
+            if not commit_message:
+                # Fallback to simple message
+                return self._generate_fallback_commit_message(status_output)
 
-            finally:
-                try:
-                    Path(temp_file).unlink()
-                except:
-                    pass
+            # Clean up any unwanted formatting
+            commit_message = commit_message.replace('"', "").replace("\n", " ")
+            if cache is not None:
+                cache.put(cache_key, commit_message)
+            return commit_message
 
         except Exception:
             # Fallback to simple message generation
             return self._generate_fallback_commit_message(status_output)
 
+    def _generate_trivial_commit_message(self, numstat_output: str) -> Optional[str]:
+        """Generate a commit message locally for trivially small changes.
+
+        Returns:
+            Commit message, or None if the change warrants an LLM-written one
+
+        """
+        threshold = self.config.parameters.get("trivial_change_lines", 10)
+        if threshold <= 0:
+            return None
+
+        paths = []
+        changed_lines = 0
+        for line in numstat_output.splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            # Binary files report "-" for both counts
+            changed_lines += int(added) if added.isdigit() else 0
+            changed_lines += int(deleted) if deleted.isdigit() else 0
+            # Renames are reported as "old => new" or "dir/{old => new}/file"
+            paths.append(path.split(" => ")[-1].replace("}", ""))
+
+        if not paths:
+            return None
+
+        if changed_lines >= threshold:
+            return None
+
+        change_types = {_commit_type_for_path(path) for path in paths}
+
+        change_type = change_types.pop() if len(change_types) == 1 else "chore"
+        if len(paths) == 1:
+            subject = f"update {os.path.basename(paths[0])}"
+        else:
+            subject = f"update {len(paths)} files"
+
+        style = self.config.parameters.get("commit_message_style", "conventional")
+        if style == "conventional":
+            return f"{change_type}: {subject}"
+        return subject[:1].upper() + subject[1:]
+
     def _generate_fallback_commit_message(self, status_output: str) -> str:
         """Generate fallback commit message without API."""
-        lines = [line for line in status_output.split("\n") if line.strip()]
-
-        if not lines:
+        if not status_output or status_output.isspace():
             return "Update project files"
 
-        # Count different types of changes
-        added = len([line for line in lines if line.startswith("A")])
-        modified = len(
-            [line for line in lines if line.startswith("M") or line.startswith(" M")]
-        )
-        deleted = len([line for line in lines if line.startswith("D")])
+        def count_lines_starting(prefix: str) -> int:
+            # str.count scans in C, without splitting the output into lines
+            return status_output.startswith(prefix) + status_output.count("\n" + prefix)
+
+        # Count different types of changes by their leading status code
+        added = count_lines_starting("A")
+        deleted = count_lines_starting("D")
+        modified = count_lines_starting("M") + count_lines_starting(" M")
 
         # Generate message based on changes
         if added and not modified and not deleted:
@@ -4136,16 +2592,11 @@ Generate only the commit message, no additional text or explanation.
         errors = []
 
         style = self.config.parameters.get("commit_message_style")
-        if style and style not in ["conventional", "descriptive", "concise"]:
+        if style and style not in _VALID_COMMIT_STYLES:
             errors.append(f"Unsupported commit message style: {style}")
 
         branch_strategy = self.config.parameters.get("branch_strategy")
-        if branch_strategy and branch_strategy not in [
-            "feature",
-            "hotfix",
-            "release",
-            "main",
-        ]:
+        if branch_strategy and branch_strategy not in _VALID_BRANCH_STRATEGIES:
             errors.append(f"Unsupported branch strategy: {branch_strategy}")
 
         return errors
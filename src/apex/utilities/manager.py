@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import graphlib
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional: results and plans are (de)serialized with the stdlib json module
+    orjson = None
 
 from apex.core.error_handling import ErrorRecoveryManager, error_handler
 from apex.core.memory import MemoryPatterns
@@ -15,19 +23,143 @@ from .base import UtilityCategory, UtilityResult, UtilityStatus
 from .registry import UtilityRegistry
 
 
+def _dumps_json(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # Beyond what orjson encodes (e.g. integers over 64 bits)
+            pass
+    return json.dumps(obj, default=default)
+
+
+def _loads_json(data: Any) -> Any:
+    """Parse JSON from a string or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _failed_result(
+    utility_id: str,
+    started_at: str,
+    error: str,
+    status: UtilityStatus = UtilityStatus.FAILED,
+) -> UtilityResult:
+    """Build a completed (by default FAILED) result without re-validating it."""
+    completed_at = datetime.now()
+    duration = completed_at - datetime.fromisoformat(started_at)
+    return UtilityResult.model_construct(
+        utility_id=utility_id,
+        status=status,
+        started_at=started_at,
+        completed_at=completed_at.isoformat(),
+        duration_seconds=duration.total_seconds(),
+        errors=[error],
+    )
+
+
+# Plan shapes: utilities in plan order, and (utility, dependencies) pairs
+_PlanUtilities = Tuple[str, ...]
+_PlanDependencies = FrozenSet[Tuple[str, Tuple[str, ...]]]
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_groups(
+    utilities: _PlanUtilities, dependencies: _PlanDependencies
+) -> Tuple[Tuple[str, ...], ...]:
+    """Group utilities that can run in parallel, in dependency order.
+
+    Cached per plan shape, since the same set of utilities is typically
+    planned again and again.
+    """
+    dependencies_by_utility = dict(dependencies)
+
+    # Topological sort for dependency resolution; dependencies outside the
+    # plan are ignored
+    planned = set(utilities)
+    sorter = graphlib.TopologicalSorter()
+    for utility in utilities:
+        sorter.add(
+            utility,
+            *(
+                dep
+                for dep in dependencies_by_utility.get(utility, ())
+                if dep in planned
+            ),
+        )
+
+    try:
+        sorter.prepare()
+    except graphlib.CycleError:
+        # Circular dependency
+        return _force_groups(utilities, dependencies_by_utility)
+
+    # Group utilities that can run in parallel
+    groups = []
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        groups.append(ready)
+        sorter.done(*ready)
+    return tuple(groups)
+
+
+def _force_groups(
+    utilities: _PlanUtilities, dependencies: Dict[str, Tuple[str, ...]]
+) -> Tuple[Tuple[str, ...], ...]:
+    """Group utilities in dependency order, forcing any cycle to run at once."""
+    in_degree = {utility: 0 for utility in utilities}
+    graph = {utility: [] for utility in utilities}
+
+    # Build dependency graph
+    for utility, deps in dependencies.items():
+        for dep in deps:
+            if dep in graph:
+                graph[dep].append(utility)
+                in_degree[utility] += 1
+
+    groups = []
+    remaining = set(utilities)
+    ready = [u for u in utilities if in_degree[u] == 0]
+
+    while remaining:
+        if not ready:
+            ready = list(remaining)  # Force execution
+
+        groups.append(tuple(ready))
+
+        # Remove ready utilities and collect dependents that became ready
+        next_ready = []
+        for utility in ready:
+            remaining.remove(utility)
+            for dependent in graph[utility]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0 and dependent in remaining:
+                    next_ready.append(dependent)
+        ready = next_ready
+
+    return tuple(groups)
+
+
 class UtilityExecutionPlan:
     """Plan for executing a set of utilities."""
 
     def __init__(self, plan_id: str):
         self.plan_id = plan_id
         self.utilities: List[str] = []
+        # Membership index over utilities, which keeps insertion order
+        self._utility_names: Set[str] = set()
         self.dependencies: Dict[str, List[str]] = {}
         self.parallel_groups: List[List[str]] = []
         self.created_at = datetime.now().isoformat()
 
     def add_utility(self, utility_name: str, dependencies: Optional[List[str]] = None):
         """Add a utility to the execution plan."""
-        if utility_name not in self.utilities:
+        if utility_name not in self._utility_names:
+            self._utility_names.add(utility_name)
             self.utilities.append(utility_name)
 
         if dependencies:
@@ -38,39 +170,43 @@ class UtilityExecutionPlan:
         if self.parallel_groups:
             return self.parallel_groups
 
-        # Topological sort for dependency resolution
-        in_degree = {utility: 0 for utility in self.utilities}
-        graph = {utility: [] for utility in self.utilities}
-
-        # Build dependency graph
-        for utility, deps in self.dependencies.items():
-            for dep in deps:
-                if dep in graph:
-                    graph[dep].append(utility)
-                    in_degree[utility] += 1
-
-        # Group utilities that can run in parallel
-        groups = []
-        remaining = set(self.utilities)
+        if not self.dependencies:
+            # Nothing to order: everything can run in parallel
+            self.parallel_groups = [list(self.utilities)] if self.utilities else []
+            return self.parallel_groups
 
-        while remaining:
-            # Find utilities with no dependencies
-            ready = [u for u in remaining if in_degree[u] == 0]
+        groups = _resolve_groups(
+            tuple(self.utilities),
+            frozenset(
+                (utility, tuple(deps)) for utility, deps in self.dependencies.items()
+            ),
+        )
 
-            if not ready:
-                # Circular dependency or missing dependency
-                ready = list(remaining)  # Force execution
+        self.parallel_groups = [list(group) for group in groups]
+        return self.parallel_groups
 
-            groups.append(ready)
+    def execution_sorter(self) -> graphlib.TopologicalSorter:
+        """Get a prepared sorter releasing utilities as their dependencies finish.
 
-            # Remove ready utilities and update dependencies
-            for utility in ready:
-                remaining.remove(utility)
-                for dependent in graph[utility]:
-                    in_degree[dependent] -= 1
+        Only dependencies in earlier groups of the resolved order are kept, so
+        utilities forced into one group by a cycle are released together.
+        """
+        sorter = graphlib.TopologicalSorter()
+        earlier = set()
+        for group in self.resolve_execution_order():
+            for utility in group:
+                sorter.add(
+                    utility,
+                    *(
+                        dep
+                        for dep in self.dependencies.get(utility, [])
+                        if dep in earlier
+                    ),
+                )
+            earlier.update(group)
 
-        self.parallel_groups = groups
-        return groups
+        sorter.prepare()
+        return sorter
 
 
 class UtilityManager:
@@ -110,9 +246,15 @@ class UtilityManager:
             (DeploymentUtility, "deployment", UtilityCategory.DEPLOYMENT),
         ]
 
-        for utility_class, name, category in builtins:
-            config = utility_class.get_default_config(name, category)
-            await self.registry.register_utility(utility_class, config)
+        # Registrations write disjoint keys, so persist them concurrently
+        await asyncio.gather(
+            *(
+                self.registry.register_utility(
+                    utility_class, utility_class.get_default_config(name, category)
+                )
+                for utility_class, name, category in builtins
+            )
+        )
 
         self.logger.info(f"Registered {len(builtins)} built-in utilities")
 
@@ -130,6 +272,9 @@ class UtilityManager:
             UtilityResult with execution details
 
         """
+        # Results built here report when the call started
+        started_at = datetime.now().isoformat()
+
         async with error_handler(
             self.memory,
             component="utility_manager",
@@ -139,26 +284,16 @@ class UtilityManager:
             utility = await self.registry.get_utility(utility_name)
 
             if not utility:
-                result = UtilityResult(
-                    utility_id=utility_name,
-                    status=UtilityStatus.FAILED,
-                    started_at=datetime.now().isoformat(),
+                return _failed_result(
+                    utility_name, started_at, f"Utility '{utility_name}' not found"
                 )
-                result.add_error(f"Utility '{utility_name}' not found")
-                result.set_completed(False)
-                return result
 
             # Validate dependencies
             missing_deps = await self.registry.validate_dependencies(utility_name)
             if missing_deps:
-                result = UtilityResult(
-                    utility_id=utility_name,
-                    status=UtilityStatus.FAILED,
-                    started_at=datetime.now().isoformat(),
+                return _failed_result(
+                    utility_name, started_at, f"Missing dependencies: {missing_deps}"
                 )
-                result.add_error(f"Missing dependencies: {missing_deps}")
-                result.set_completed(False)
-                return result
 
             if async_execution:
                 # Execute asynchronously
@@ -169,7 +304,7 @@ class UtilityManager:
                 result = UtilityResult(
                     utility_id=utility_name,
                     status=UtilityStatus.RUNNING,
-                    started_at=datetime.now().isoformat(),
+                    started_at=started_at,
                 )
                 return result
             else:
@@ -202,45 +337,62 @@ class UtilityManager:
             f"Executing plan {plan.plan_id} with {len(execution_order)} groups"
         )
 
-        for group_index, utility_group in enumerate(execution_order):
-            self.logger.info(f"Executing group {group_index + 1}: {utility_group}")
+        async def run(utility_name: str) -> UtilityResult:
+            started_at = datetime.now().isoformat()
+            try:
+                return await self.execute_utility(
+                    utility_name, context, async_execution=False
+                )
+            except Exception as e:
+                return _failed_result(
+                    utility_name, started_at, f"Execution failed: {str(e)}"
+                )
 
-            # Execute utilities in parallel within the group
-            group_tasks = []
-            for utility_name in utility_group:
-                task = asyncio.create_task(
-                    self.execute_utility(utility_name, context, async_execution=False)
+        # Start each utility as soon as its own dependencies finish, instead of
+        # waiting for every utility in the previous group. The task group
+        # awaits any cancelled utilities before the plan returns.
+        sorter = plan.execution_sorter()
+        pending: Dict[asyncio.Task, str] = {}
+        started_at: Dict[str, str] = {}
+
+        async with asyncio.TaskGroup() as task_group:
+
+            def start_ready() -> None:
+                for utility_name in sorter.get_ready():
+                    self.logger.info(f"Executing {utility_name}")
+                    started_at[utility_name] = datetime.now().isoformat()
+                    pending[task_group.create_task(run(utility_name))] = utility_name
+
+            start_ready()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                group_tasks.append((utility_name, task))
 
-            # Wait for group to complete
-            for utility_name, task in group_tasks:
-                try:
-                    result = await task
-                    results[utility_name] = result
+                failed = None
+                for task in done:
+                    utility_name = pending.pop(task)
+                    result = results[utility_name] = task.result()
 
                     if result.status == UtilityStatus.FAILED and stop_on_failure:
-                        self.logger.error(
-                            f"Stopping execution due to failure in {utility_name}"
+                        failed = failed or utility_name
+                    else:
+                        sorter.done(utility_name)
+
+                if failed is not None:
+                    self.logger.error(f"Stopping execution due to failure in {failed}")
+                    # Cancel remaining tasks, reporting them as cancelled
+                    for remaining_task, remaining_name in pending.items():
+                        remaining_task.cancel()
+                        results[remaining_name] = _failed_result(
+                            remaining_name,
+                            started_at[remaining_name],
+                            f"Cancelled after {failed} failed",
+                            status=UtilityStatus.CANCELLED,
                         )
-                        # Cancel remaining tasks
-                        for _, remaining_task in group_tasks:
-                            if not remaining_task.done():
-                                remaining_task.cancel()
-                        return results
-
-                except Exception as e:
-                    result = UtilityResult(
-                        utility_id=utility_name,
-                        status=UtilityStatus.FAILED,
-                        started_at=datetime.now().isoformat(),
-                    )
-                    result.add_error(f"Execution failed: {str(e)}")
-                    result.set_completed(False)
-                    results[utility_name] = result
+                    return results
 
-                    if stop_on_failure:
-                        return results
+                start_ready()
 
         # Store plan execution results
         await self._store_plan_results(plan, results, context)
@@ -264,31 +416,38 @@ class UtilityManager:
         plan = UtilityExecutionPlan(plan_id)
 
         utilities_to_add = set(utility_names)
+        # Dependencies looked up so far, so each utility is queried only once
+        dependencies_by_name: Dict[str, List[str]] = {}
 
         if auto_resolve_dependencies:
-            # Add dependencies recursively
-            to_process = list(utility_names)
-            processed = set()
-
-            while to_process:
-                utility_name = to_process.pop(0)
-                if utility_name in processed:
-                    continue
+            # Add dependencies breadth-first, looking up a whole frontier of
+            # utilities concurrently
+            frontier = list(utilities_to_add)
+            while frontier:
+                frontier_dependencies = await asyncio.gather(
+                    *(
+                        self.registry.get_utility_dependencies(utility_name)
+                        for utility_name in frontier
+                    )
+                )
+                dependencies_by_name.update(
+                    zip(frontier, frontier_dependencies, strict=True)
+                )
 
-                processed.add(utility_name)
-                utilities_to_add.add(utility_name)
+                frontier = []
+                for dependencies in frontier_dependencies:
+                    for dep in dependencies:
+                        if dep not in utilities_to_add:
+                            utilities_to_add.add(dep)
+                            frontier.append(dep)
 
+        # Add utilities to plan
+        for utility_name in utilities_to_add:
+            dependencies = dependencies_by_name.get(utility_name)
+            if dependencies is None:
                 dependencies = await self.registry.get_utility_dependencies(
                     utility_name
                 )
-                for dep in dependencies:
-                    if dep not in processed:
-                        to_process.append(dep)
-                        utilities_to_add.add(dep)
-
-        # Add utilities to plan
-        for utility_name in utilities_to_add:
-            dependencies = await self.registry.get_utility_dependencies(utility_name)
             # Only include dependencies that are also in the plan
             plan_dependencies = [dep for dep in dependencies if dep in utilities_to_add]
             plan.add_utility(utility_name, plan_dependencies)
@@ -306,24 +465,9 @@ class UtilityManager:
 
         """
         # Check active executions
-        if utility_name in self.active_executions:
-            task = self.active_executions[utility_name]
-            if task.done():
-                try:
-                    result = task.result()
-                    self.execution_results[utility_name] = result
-                    del self.active_executions[utility_name]
-                    return result
-                except Exception as e:
-                    result = UtilityResult(
-                        utility_id=utility_name,
-                        status=UtilityStatus.FAILED,
-                        started_at=datetime.now().isoformat(),
-                    )
-                    result.add_error(f"Execution failed: {str(e)}")
-                    result.set_completed(False)
-                    return result
-            else:
+        task = self.active_executions.get(utility_name)
+        if task is not None:
+            if not task.done():
                 # Still running
                 return UtilityResult(
                     utility_id=utility_name,
@@ -331,16 +475,33 @@ class UtilityManager:
                     started_at=datetime.now().isoformat(),
                 )
 
+            try:
+                result = task.result()
+            except Exception as e:
+                result = UtilityResult(
+                    utility_id=utility_name,
+                    status=UtilityStatus.FAILED,
+                    started_at=datetime.now().isoformat(),
+                )
+                result.add_error(f"Execution failed: {str(e)}")
+                result.set_completed(False)
+
+            # Settle the finished execution, so later polls hit the stored result
+            self.execution_results[utility_name] = result
+            del self.active_executions[utility_name]
+            return result
+
         # Check stored results
-        if utility_name in self.execution_results:
-            return self.execution_results[utility_name]
+        result = self.execution_results.get(utility_name)
+        if result is not None:
+            return result
 
         # Try to load from memory
         result_key = f"/utilities/executions/{utility_name}/latest"
         result_json = await self.memory.mcp.read(result_key)
 
         if result_json:
-            result_data = json.loads(result_json)
+            result_data = _loads_json(result_json)
             return UtilityResult(**result_data)
 
         return None
@@ -453,22 +614,21 @@ class UtilityManager:
     ) -> None:
         """Store execution result in memory."""
         try:
-            # Store latest result
-            result_key = f"/utilities/executions/{result.utility_id}/latest"
-            await self.memory.mcp.write(result_key, result.model_dump_json())
-
-            # Store timestamped result
+            result_json = result.model_dump_json()
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            timestamped_key = (
-                f"/utilities/executions/{result.utility_id}/history/{timestamp}"
+            prefix = f"/utilities/executions/{result.utility_id}"
+
+            # Store latest and timestamped result plus execution context; the
+            # keys are independent, so the writes are issued together. Values
+            # JSON cannot encode are stored as strings so that the context
+            # never keeps the results from being written.
+            await asyncio.gather(
+                self.memory.mcp.write(f"{prefix}/latest", result_json),
+                self.memory.mcp.write(f"{prefix}/history/{timestamp}", result_json),
+                self.memory.mcp.write(
+                    f"{prefix}/context/{timestamp}", _dumps_json(context, default=str)
+                ),
             )
-            await self.memory.mcp.write(timestamped_key, result.model_dump_json())
-
-            # Store execution context
-            context_key = (
-                f"/utilities/executions/{result.utility_id}/context/{timestamp}"
-            )
-            await self.memory.mcp.write(context_key, json.dumps(context))
 
         except Exception as e:
             self.logger.error(f"Failed to store execution result: {e}")
@@ -494,19 +654,23 @@ class UtilityManager:
             }
 
             plan_key = f"/utilities/plans/{plan.plan_id}/execution"
-            await self.memory.mcp.write(plan_key, json.dumps(plan_data))
+            await self.memory.mcp.write(plan_key, _dumps_json(plan_data))
 
         except Exception as e:
             self.logger.error(f"Failed to store plan results: {e}")
 
     async def get_execution_history(
-        self, utility_name: Optional[str] = None, limit: int = 10
+        self,
+        utility_name: Optional[str] = None,
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Get execution history.
 
         Args:
             utility_name: Optional utility name filter
             limit: Maximum number of results
+            fields: Optional result fields to keep in each entry
 
         Returns:
             List of execution history entries
@@ -522,15 +686,22 @@ class UtilityManager:
 
             keys = await self.memory.mcp.list_keys(pattern)
 
-            # Sort by timestamp (most recent first)
-            keys.sort(reverse=True)
+            # Keep history entries only, before applying the limit, and sort
+            # them by timestamp (most recent first) across utilities
+            history_keys = [key for key in keys if "/history/" in key]
+            history_keys.sort(key=lambda key: key.rpartition("/")[2], reverse=True)
+            del history_keys[limit:]
 
-            for key in keys[:limit]:
-                if "/history/" in key:
-                    result_json = await self.memory.mcp.read(key)
-                    if result_json:
-                        result_data = json.loads(result_json)
-                        history.append(result_data)
+            # Read the selected history entries concurrently
+            results_json = await asyncio.gather(
+                *(self.memory.mcp.read(key) for key in history_keys)
+            )
+            for result_json in results_json:
+                if result_json:
+                    entry = _loads_json(result_json)
+                    if fields is not None:
+                        entry = {key: entry[key] for key in fields if key in entry}
+                    history.append(entry)
 
         except Exception as e:
             self.logger.error(f"Failed to get execution history: {e}")
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import json
 import logging
+import sys
 from typing import Any, Dict, List, Optional, Type
 
 from apex.core.memory import MemoryPatterns
@@ -19,6 +22,8 @@ class UtilityRegistry:
         self.logger = logging.getLogger(__name__)
         self._utilities: Dict[str, Type[BaseUtility]] = {}
         self._configs: Dict[str, UtilityConfig] = {}
+        # Dependencies read from LMDB for utilities whose config isn't loaded
+        self._dependencies: Dict[str, List[str]] = {}
 
     async def register_utility(
         self, utility_class: Type[BaseUtility], config: UtilityConfig
@@ -45,6 +50,7 @@ class UtilityRegistry:
             # Store in memory
             self._utilities[config.name] = utility_class
             self._configs[config.name] = config
+            self._dependencies.pop(config.name, None)
 
             # Persist to LMDB
             config_key = f"/utilities/registry/{config.name}/config"
@@ -109,17 +115,21 @@ class UtilityRegistry:
             # Load from memory if not already loaded
             registry_keys = await self.memory.mcp.list_keys("/utilities/registry/")
 
-            for key in registry_keys:
-                if key.endswith("/metadata"):
-                    metadata_json = await self.memory.mcp.read(key)
-                    if metadata_json:
-                        metadata = json.loads(metadata_json)
+            # Read all metadata entries concurrently
+            metadata_keys = [key for key in registry_keys if key.endswith("/metadata")]
+            metadata_jsons = await asyncio.gather(
+                *(self.memory.mcp.read(key) for key in metadata_keys)
+            )
 
-                        # Apply category filter
-                        if category and metadata.get("category") != category.value:
-                            continue
+            for metadata_json in metadata_jsons:
+                if metadata_json:
+                    metadata = json.loads(metadata_json)
 
-                        utilities.append(metadata)
+                    # Apply category filter
+                    if category and metadata.get("category") != category.value:
+                        continue
+
+                    utilities.append(metadata)
 
         except Exception as e:
             self.logger.error(f"Failed to list utilities: {e}")
@@ -142,10 +152,20 @@ class UtilityRegistry:
 
         utility_list = await self.list_utilities(category)
 
+        # Load utilities not yet in memory concurrently, reusing the metadata
+        # just listed instead of reading it again
+        await asyncio.gather(
+            *(
+                self._load_utility_from_memory(utility_info["name"], utility_info)
+                for utility_info in utility_list
+                if utility_info["name"] not in self._utilities
+            )
+        )
+
         for utility_info in utility_list:
-            utility = await self.get_utility(utility_info["name"])
-            if utility:
-                utilities.append(utility)
+            name = utility_info["name"]
+            if name in self._utilities:
+                utilities.append(self._utilities[name](self._configs[name]))
 
         return utilities
 
@@ -165,6 +185,7 @@ class UtilityRegistry:
                 del self._utilities[name]
             if name in self._configs:
                 del self._configs[name]
+            self._dependencies.pop(name, None)
 
             # Remove from LMDB
             config_key = f"/utilities/registry/{name}/config"
@@ -207,6 +228,7 @@ class UtilityRegistry:
 
             # Update configuration
             self._configs[name] = config
+            self._dependencies.pop(name, None)
 
             # Persist to LMDB
             config_key = f"/utilities/registry/{name}/config"
@@ -219,11 +241,14 @@ class UtilityRegistry:
             self.logger.error(f"Failed to update utility config {name}: {e}")
             return False
 
-    async def _load_utility_from_memory(self, name: str) -> bool:
+    async def _load_utility_from_memory(
+        self, name: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """Load utility from LMDB memory.
 
         Args:
             name: Name of the utility
+            metadata: Utility metadata, if already read
 
         Returns:
             True if loaded successfully, False otherwise
@@ -241,19 +266,26 @@ class UtilityRegistry:
             config = UtilityConfig(**config_data)
 
             # Load metadata to get class information
-            metadata_key = f"/utilities/registry/{name}/metadata"
-            metadata_json = await self.memory.mcp.read(metadata_key)
+            if metadata is None:
+                metadata_key = f"/utilities/registry/{name}/metadata"
+                metadata_json = await self.memory.mcp.read(metadata_key)
 
-            if not metadata_json:
-                return False
+                if not metadata_json:
+                    return False
 
-            metadata = json.loads(metadata_json)
+                metadata = json.loads(metadata_json)
 
             # Dynamically import the utility class
             module_name = metadata["module"]
             class_name = metadata["class_name"]
 
-            module = __import__(module_name, fromlist=[class_name])
+            module = sys.modules.get(module_name)
+            if module is None:
+                # A first import can be slow; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                module = await loop.run_in_executor(
+                    None, importlib.import_module, module_name
+                )
             utility_class = getattr(module, class_name)
 
             # Store in memory
@@ -302,6 +334,8 @@ class UtilityRegistry:
         """
         if name in self._configs:
             return self._configs[name].dependencies
+        if name in self._dependencies:
+            return self._dependencies[name]
 
         # Try to load from memory
         config_key = f"/utilities/registry/{name}/config"
@@ -309,7 +343,8 @@ class UtilityRegistry:
 
         if config_json:
             config_data = json.loads(config_json)
-            return config_data.get("dependencies", [])
+            self._dependencies[name] = config_data.get("dependencies", [])
+            return self._dependencies[name]
 
         return []
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -12,6 +15,34 @@ from apex.core.memory import MemoryPatterns
 from apex.utilities.base import UtilityCategory, UtilityConfig
 from apex.utilities.registry import UtilityRegistry
 
+# Python types for template parameter types
+_PARAMETER_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+    "list": list,
+    "dict": dict,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a parameter validation pattern, reusing it across validations."""
+    return re.compile(pattern)
+
+
+def _dumps_export(template_id: str, template: UtilityTemplate) -> str:
+    """Serialize a template export as indented JSON."""
+    return json.dumps(
+        {
+            "template_id": template_id,
+            "template": template.model_dump(mode="json"),
+            "exported_by": "APEX Utility Template Manager",
+            "export_version": "1.0",
+        },
+        indent=2,
+    )
+
 
 class ParameterTemplate(BaseModel):
     """Template for utility parameters."""
@@ -63,6 +94,247 @@ class UtilityTemplate(BaseModel):
     references: List[str] = Field(default_factory=list)
 
 
+def _construct_template(data: Dict[str, Any]) -> UtilityTemplate:
+    """Build a template from data written by save_custom_template.
+
+    Stored templates were validated before they were saved, so they are
+    rebuilt without validation; only the category enum and the nested
+    parameters need converting back from their JSON form.
+    """
+    parameters = [ParameterTemplate.model_construct(**p) for p in data["parameters"]]
+    return UtilityTemplate.model_construct(
+        **{
+            **data,
+            "category": UtilityCategory(data["category"]),
+            "parameters": parameters,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_templates() -> Dict[str, UtilityTemplate]:
+    """Build the built-in utility templates once, on first use."""
+    return {
+        "command_utility": UtilityTemplate(
+            name="Command Utility Template",
+            category=UtilityCategory.AUTOMATION,
+            description="Template for creating command-line utilities",
+            execution_type="command",
+            command_template="{command} {args}",
+            parameters=[
+                ParameterTemplate(
+                    name="command",
+                    type="string",
+                    description="The command to execute",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="args",
+                    type="string",
+                    description="Command arguments",
+                    default="",
+                ),
+                ParameterTemplate(
+                    name="working_dir",
+                    type="string",
+                    description="Working directory for command execution",
+                    default=".",
+                ),
+            ],
+            usage_examples=[
+                "Basic command: {command: 'ls', args: '-la'}",
+                "With working directory: {command: 'git', args: 'status', working_dir: '/path/to/repo'}",
+            ],
+        ),
+        "python_function": UtilityTemplate(
+            name="Python Function Template",
+            category=UtilityCategory.AUTOMATION,
+            description="Template for creating Python function utilities",
+            execution_type="python",
+            python_function="async def execute_utility(context, **kwargs): pass",
+            parameters=[
+                ParameterTemplate(
+                    name="function_name",
+                    type="string",
+                    description="Name of the Python function to execute",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="module_path",
+                    type="string",
+                    description="Path to the Python module",
+                    required=True,
+                ),
+            ],
+            usage_examples=[
+                "Call function: {function_name: 'process_data', module_path: 'utils.data_processor'}"
+            ],
+        ),
+        "script_runner": UtilityTemplate(
+            name="Script Runner Template",
+            category=UtilityCategory.AUTOMATION,
+            description="Template for running custom scripts",
+            execution_type="script",
+            script_template="#!/bin/bash\n# Script template\necho 'Executing utility script'",
+            parameters=[
+                ParameterTemplate(
+                    name="script_path",
+                    type="string",
+                    description="Path to the script file",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="interpreter",
+                    type="string",
+                    description="Script interpreter",
+                    default="bash",
+                    choices=["bash", "python", "node", "ruby"],
+                ),
+            ],
+            usage_examples=[
+                "Bash script: {script_path: 'scripts/deploy.sh', interpreter: 'bash'}",
+                "Python script: {script_path: 'scripts/analyzer.py', interpreter: 'python'}",
+            ],
+        ),
+        "api_client": UtilityTemplate(
+            name="API Client Template",
+            category=UtilityCategory.INTEGRATION,
+            description="Template for creating API client utilities",
+            execution_type="python",
+            python_function="async def api_request(context, **kwargs): pass",
+            parameters=[
+                ParameterTemplate(
+                    name="base_url",
+                    type="string",
+                    description="Base URL for the API",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="endpoint",
+                    type="string",
+                    description="API endpoint path",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="method",
+                    type="string",
+                    description="HTTP method",
+                    default="GET",
+                    choices=["GET", "POST", "PUT", "DELETE", "PATCH"],
+                ),
+                ParameterTemplate(
+                    name="headers",
+                    type="dict",
+                    description="HTTP headers",
+                    default={},
+                ),
+                ParameterTemplate(
+                    name="auth_token",
+                    type="string",
+                    description="Authentication token",
+                    default="",
+                ),
+            ],
+            usage_examples=[
+                "GET request: {base_url: 'https://api.example.com', endpoint: '/users', method: 'GET'}",
+                "POST with auth: {base_url: 'https://api.example.com', endpoint: '/data', method: 'POST', auth_token: 'your-token'}",
+            ],
+        ),
+        "file_processor": UtilityTemplate(
+            name="File Processor Template",
+            category=UtilityCategory.DATA_PROCESSING,
+            description="Template for file processing utilities",
+            execution_type="python",
+            python_function="async def process_files(context, **kwargs): pass",
+            parameters=[
+                ParameterTemplate(
+                    name="input_pattern",
+                    type="string",
+                    description="Input file pattern (glob)",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="output_dir",
+                    type="string",
+                    description="Output directory",
+                    default="./output",
+                ),
+                ParameterTemplate(
+                    name="operation",
+                    type="string",
+                    description="Processing operation",
+                    choices=["copy", "move", "transform", "analyze"],
+                ),
+                ParameterTemplate(
+                    name="recursive",
+                    type="boolean",
+                    description="Process files recursively",
+                    default=False,
+                ),
+            ],
+            usage_examples=[
+                "Process all Python files: {input_pattern: '**/*.py', operation: 'analyze'}",
+                "Copy images: {input_pattern: '*.jpg', output_dir: '/backup', operation: 'copy'}",
+            ],
+        ),
+        "database_utility": UtilityTemplate(
+            name="Database Utility Template",
+            category=UtilityCategory.DATA_PROCESSING,
+            description="Template for database operation utilities",
+            execution_type="python",
+            python_function="async def database_operation(context, **kwargs): pass",
+            parameters=[
+                ParameterTemplate(
+                    name="connection_string",
+                    type="string",
+                    description="Database connection string",
+                    required=True,
+                ),
+                ParameterTemplate(
+                    name="operation",
+                    type="string",
+                    description="Database operation",
+                    choices=["query", "insert", "update", "delete", "migrate"],
+                ),
+                ParameterTemplate(
+                    name="query",
+                    type="string",
+                    description="SQL query to execute",
+                    default="",
+                ),
+                ParameterTemplate(
+                    name="table",
+                    type="string",
+                    description="Target table name",
+                    default="",
+                ),
+            ],
+            usage_examples=[
+                "Run query: {connection_string: 'sqlite:///db.sqlite', operation: 'query', query: 'SELECT * FROM users'}",
+                "Insert data: {operation: 'insert', table: 'users', data: {...}}",
+            ],
+        ),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_summaries() -> Tuple[Dict[str, Any], ...]:
+    """Summarize the built-in templates once, for template listings."""
+    return tuple(
+        {
+            "id": template_id,
+            "name": template.name,
+            "category": template.category.value,
+            "description": template.description,
+            "execution_type": template.execution_type,
+            "author": template.author or "APEX",
+            "version": template.version,
+            "builtin": True,
+        }
+        for template_id, template in _builtin_templates().items()
+    )
+
+
 class UtilityTemplateManager:
     """Manages custom utility templates."""
 
@@ -75,228 +347,21 @@ class UtilityTemplateManager:
         self.builtin_templates: Dict[str, UtilityTemplate] = {}
         self._initialize_builtin_templates()
 
+        # Custom templates last loaded from memory, and the keys they came from
+        self._custom_templates: Optional[Dict[str, UtilityTemplate]] = None
+        self._custom_template_keys: Tuple[str, ...] = ()
+        self._custom_template_writes = 0
+
     def _initialize_builtin_templates(self) -> None:
         """Initialize built-in utility templates."""
-        self.builtin_templates = {
-            "command_utility": UtilityTemplate(
-                name="Command Utility Template",
-                category=UtilityCategory.AUTOMATION,
-                description="Template for creating command-line utilities",
-                execution_type="command",
-                command_template="{command} {args}",
-                parameters=[
-                    ParameterTemplate(
-                        name="command",
-                        type="string",
-                        description="The command to execute",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="args",
-                        type="string",
-                        description="Command arguments",
-                        default="",
-                    ),
-                    ParameterTemplate(
-                        name="working_dir",
-                        type="string",
-                        description="Working directory for command execution",
-                        default=".",
-                    ),
-                ],
-                usage_examples=[
-                    "Basic command: {command: 'ls', args: '-la'}",
-                    "With working directory: {command: 'git', args: 'status', working_dir: '/path/to/repo'}",
-                ],
-            ),
-            "python_function": UtilityTemplate(
-                name="Python Function Template",
-                category=UtilityCategory.AUTOMATION,
-                description="Template for creating Python function utilities",
-                execution_type="python",
-                python_function="async def execute_utility(context, **kwargs): pass",
-                parameters=[
-                    ParameterTemplate(
-                        name="function_name",
-                        type="string",
-                        description="Name of the Python function to execute",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="module_path",
-                        type="string",
-                        description="Path to the Python module",
-                        required=True,
-                    ),
-                ],
-                usage_examples=[
-                    "Call function: {function_name: 'process_data', module_path: 'utils.data_processor'}"
-                ],
-            ),
-            "script_runner": UtilityTemplate(
-                name="Script Runner Template",
-                category=UtilityCategory.AUTOMATION,
-                description="Template for running custom scripts",
-                execution_type="script",
-                script_template="#!/bin/bash\n# Script template\necho 'Executing utility script'",
-                parameters=[
-                    ParameterTemplate(
-                        name="script_path",
-                        type="string",
-                        description="Path to the script file",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="interpreter",
-                        type="string",
-                        description="Script interpreter",
-                        default="bash",
-                        choices=["bash", "python", "node", "ruby"],
-                    ),
-                ],
-                usage_examples=[
-                    "Bash script: {script_path: 'scripts/deploy.sh', interpreter: 'bash'}",
-                    "Python script: {script_path: 'scripts/analyzer.py', interpreter: 'python'}",
-                ],
-            ),
-            "api_client": UtilityTemplate(
-                name="API Client Template",
-                category=UtilityCategory.INTEGRATION,
-                description="Template for creating API client utilities",
-                execution_type="python",
-                python_function="async def api_request(context, **kwargs): pass",
-                parameters=[
-                    ParameterTemplate(
-                        name="base_url",
-                        type="string",
-                        description="Base URL for the API",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="endpoint",
-                        type="string",
-                        description="API endpoint path",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="method",
-                        type="string",
-                        description="HTTP method",
-                        default="GET",
-                        choices=["GET", "POST", "PUT", "DELETE", "PATCH"],
-                    ),
-                    ParameterTemplate(
-                        name="headers",
-                        type="dict",
-                        description="HTTP headers",
-                        default={},
-                    ),
-                    ParameterTemplate(
-                        name="auth_token",
-                        type="string",
-                        description="Authentication token",
-                        default="",
-                    ),
-                ],
-                usage_examples=[
-                    "GET request: {base_url: 'https://api.example.com', endpoint: '/users', method: 'GET'}",
-                    "POST with auth: {base_url: 'https://api.example.com', endpoint: '/data', method: 'POST', auth_token: 'your-token'}",
-                ],
-            ),
-            "file_processor": UtilityTemplate(
-                name="File Processor Template",
-                category=UtilityCategory.DATA_PROCESSING,
-                description="Template for file processing utilities",
-                execution_type="python",
-                python_function="async def process_files(context, **kwargs): pass",
-                parameters=[
-                    ParameterTemplate(
-                        name="input_pattern",
-                        type="string",
-                        description="Input file pattern (glob)",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="output_dir",
-                        type="string",
-                        description="Output directory",
-                        default="./output",
-                    ),
-                    ParameterTemplate(
-                        name="operation",
-                        type="string",
-                        description="Processing operation",
-                        choices=["copy", "move", "transform", "analyze"],
-                    ),
-                    ParameterTemplate(
-                        name="recursive",
-                        type="boolean",
-                        description="Process files recursively",
-                        default=False,
-                    ),
-                ],
-                usage_examples=[
-                    "Process all Python files: {input_pattern: '**/*.py', operation: 'analyze'}",
-                    "Copy images: {input_pattern: '*.jpg', output_dir: '/backup', operation: 'copy'}",
-                ],
-            ),
-            "database_utility": UtilityTemplate(
-                name="Database Utility Template",
-                category=UtilityCategory.DATA_PROCESSING,
-                description="Template for database operation utilities",
-                execution_type="python",
-                python_function="async def database_operation(context, **kwargs): pass",
-                parameters=[
-                    ParameterTemplate(
-                        name="connection_string",
-                        type="string",
-                        description="Database connection string",
-                        required=True,
-                    ),
-                    ParameterTemplate(
-                        name="operation",
-                        type="string",
-                        description="Database operation",
-                        choices=["query", "insert", "update", "delete", "migrate"],
-                    ),
-                    ParameterTemplate(
-                        name="query",
-                        type="string",
-                        description="SQL query to execute",
-                        default="",
-                    ),
-                    ParameterTemplate(
-                        name="table",
-                        type="string",
-                        description="Target table name",
-                        default="",
-                    ),
-                ],
-                usage_examples=[
-                    "Run query: {connection_string: 'sqlite:///db.sqlite', operation: 'query', query: 'SELECT * FROM users'}",
-                    "Insert data: {operation: 'insert', table: 'users', data: {...}}",
-                ],
-            ),
-        }
+        self.builtin_templates = dict(_builtin_templates())
 
     async def list_templates(self) -> List[Dict[str, Any]]:
         """List all available utility templates."""
         templates = []
 
         # Add built-in templates
-        for template_id, template in self.builtin_templates.items():
-            templates.append(
-                {
-                    "id": template_id,
-                    "name": template.name,
-                    "category": template.category.value,
-                    "description": template.description,
-                    "execution_type": template.execution_type,
-                    "author": template.author or "APEX",
-                    "version": template.version,
-                    "builtin": True,
-                }
-            )
+        templates.extend(dict(summary) for summary in _builtin_summaries())
 
         # Add custom templates from memory
         try:
@@ -377,6 +442,7 @@ class UtilityTemplateManager:
             # Store in memory
             template_key = f"/utilities/templates/custom/{template_id}"
             await self.memory.mcp.write(template_key, template.model_dump_json())
+            self._invalidate_custom_templates()
 
             self.logger.info(
                 f"Saved custom template '{template.name}' with ID '{template_id}'"
@@ -395,6 +461,7 @@ class UtilityTemplateManager:
 
             template_key = f"/utilities/templates/custom/{template_id}"
             result = await self.memory.mcp.delete(template_key)
+            self._invalidate_custom_templates()
 
             if result:
                 self.logger.info(f"Deleted custom template '{template_id}'")
@@ -412,15 +479,8 @@ class UtilityTemplateManager:
             if not template:
                 raise ValueError(f"Template {template_id} not found")
 
-            export_data = {
-                "template_id": template_id,
-                "template": template.model_dump(),
-                "exported_by": "APEX Utility Template Manager",
-                "export_version": "1.0",
-            }
-
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2)
+                f.write(_dumps_export(template_id, template))
 
             self.logger.info(f"Exported template '{template_id}' to '{file_path}'")
             return True
@@ -457,16 +517,22 @@ class UtilityTemplateManager:
         """Validate parameters against template definition."""
         errors = []
 
-        # Check required parameters
-        for param_template in template.parameters:
-            if param_template.required and param_template.name not in parameters:
-                errors.append(f"Required parameter '{param_template.name}' is missing")
+        # Check required parameters, reporting any missing in template order
+        required = {p.name for p in template.parameters if p.required}
+        missing = required - parameters.keys()
+        if missing:
+            errors.extend(
+                f"Required parameter '{p.name}' is missing"
+                for p in template.parameters
+                if p.required and p.name in missing
+            )
+
+        # Index parameter templates by name, keeping the first of any duplicates
+        param_index = {p.name: p for p in reversed(template.parameters)}
 
         # Validate parameter types and values
         for param_name, param_value in parameters.items():
-            param_template = next(
-                (p for p in template.parameters if p.name == param_name), None
-            )
+            param_template = param_index.get(param_name)
 
             if param_template:
                 # Type validation
@@ -493,16 +559,11 @@ class UtilityTemplateManager:
 
     def _validate_parameter_type(self, value: Any, expected_type: str) -> bool:
         """Validate parameter type."""
-        type_map = {
-            "string": str,
-            "integer": int,
-            "boolean": bool,
-            "list": list,
-            "dict": dict,
-        }
-
-        expected_python_type = type_map.get(expected_type)
+        expected_python_type = _PARAMETER_TYPES.get(expected_type)
         if expected_python_type:
+            # bool subclasses int, but booleans are not valid integers
+            if expected_python_type is int and isinstance(value, bool):
+                return False
             return isinstance(value, expected_python_type)
 
         return True  # Unknown type, assume valid
@@ -520,9 +581,7 @@ class UtilityTemplateManager:
                 return f"Must be at most {validation['max_length']} characters"
 
         if "pattern" in validation and isinstance(value, str):
-            import re
-
-            if not re.match(validation["pattern"], value):
+            if not _compile_pattern(validation["pattern"]).match(value):
                 return f"Must match pattern: {validation['pattern']}"
 
         if "min_value" in validation and isinstance(value, (int, float)):
@@ -539,19 +598,11 @@ class UtilityTemplateManager:
         self, template: UtilityTemplate, utility_name: str, parameters: Dict[str, Any]
     ) -> UtilityConfig:
         """Generate utility configuration from template and parameters."""
-        # Merge template defaults with provided parameters
-        final_parameters = {}
-
-        for param_template in template.parameters:
-            if param_template.name in parameters:
-                final_parameters[param_template.name] = parameters[param_template.name]
-            elif param_template.default is not None:
-                final_parameters[param_template.name] = param_template.default
-
-        # Add any additional parameters not in template
-        for key, value in parameters.items():
-            if key not in final_parameters:
-                final_parameters[key] = value
+        # Merge template defaults with provided parameters, which take precedence
+        defaults = {
+            p.name: p.default for p in template.parameters if p.default is not None
+        }
+        final_parameters = defaults | parameters
 
         # Add execution-specific parameters
         if template.execution_type == "command" and template.command_template:
@@ -572,20 +623,39 @@ class UtilityTemplateManager:
         )
 
     async def _load_custom_templates(self) -> Dict[str, UtilityTemplate]:
-        """Load custom templates from memory."""
+        """Load custom templates from memory.
+
+        Templates are reused from the last load while the stored keys are
+        unchanged; saving or deleting a template forces a reload.
+        """
         templates = {}
+        writes = self._custom_template_writes
 
         try:
-            template_keys = await self.memory.mcp.list_keys(
-                "/utilities/templates/custom/"
+            template_keys = tuple(
+                await self.memory.mcp.list_keys("/utilities/templates/custom/")
+            )
+
+            if (
+                self._custom_templates is not None
+                and template_keys == self._custom_template_keys
+            ):
+                return dict(self._custom_templates)
+
+            # Read all templates concurrently
+            templates_json = await asyncio.gather(
+                *(self.memory.mcp.read(key) for key in template_keys),
+                return_exceptions=True,
             )
 
-            for key in template_keys:
+            complete = True
+            for key, template_json in zip(template_keys, templates_json, strict=True):
                 try:
-                    template_json = await self.memory.mcp.read(key)
+                    if isinstance(template_json, Exception):
+                        raise template_json
                     if template_json:
                         template_data = json.loads(template_json)
-                        template = UtilityTemplate(**template_data)
+                        template = _construct_template(template_data)
 
                         # Extract template ID from key
                         template_id = key.split("/")[-1]
@@ -593,13 +663,25 @@ class UtilityTemplateManager:
 
                 except Exception as e:
                     self.logger.warning(f"Failed to load template from {key}: {e}")
+                    complete = False
                     continue
 
+            # Only reuse a load in which every template was read and that no
+            # save or delete overlapped
+            if complete and writes == self._custom_template_writes:
+                self._custom_templates = dict(templates)
+                self._custom_template_keys = template_keys
+
         except Exception as e:
             self.logger.error(f"Failed to list custom templates: {e}")
 
         return templates
 
+    def _invalidate_custom_templates(self) -> None:
+        """Drop loaded custom templates after a save or delete."""
+        self._custom_templates = None
+        self._custom_template_writes += 1
+
     async def generate_template_from_existing_utility(
         self, utility_name: str
     ) -> Optional[UtilityTemplate]:
@@ -0,0 +1,191 @@
+"""Tests for ArchivistUtility."""
+
+import os
+
+import pytest
+
+from apex.utilities.base import UtilityCategory
+from apex.utilities.builtin import ArchivistUtility
+
+
+def make_utility(**parameters):
+    """Create an Archivist utility with overridden parameters."""
+    config = ArchivistUtility.get_default_config(
+        "archivist", UtilityCategory.DOCUMENTATION
+    )
+    config.parameters.update(parameters)
+    return ArchivistUtility(config)
+
+
+def write_files(root, *paths):
+    """Create files with placeholder content under root."""
+    for path in paths:
+        file_path = root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"# {path}\n")
+
+
+def found_paths(utility, root):
+    """Relative paths of the files the utility would summarize."""
+    return {
+        os.path.relpath(entry.path, root)
+        for entry in utility._find_project_files(str(root))
+    }
+
+
+class TestFindProjectFiles:
+    """File discovery with the default include and exclude patterns."""
+
+    def test_default_excludes(self, tmp_path):
+        """Default excludes skip any name containing an excluded name."""
+        write_files(
+            tmp_path,
+            "src/app.py",
+            "docs/guide.md",
+            ".venv/lib/site.py",
+            "venv/lib/site.py",
+            "my_venv_tools/tool.py",
+            ".envrc.py",
+            "conf.env.yml",
+            "node_modules/pkg/package.json",
+            "src/__pycache__/app.py",
+            ".git/hooks/hook.py",
+        )
+
+        assert found_paths(make_utility(), tmp_path) == {
+            os.path.join("src", "app.py"),
+            os.path.join("docs", "guide.md"),
+        }
+
+    @pytest.mark.parametrize(
+        ("pattern", "excluded"),
+        [("*.md", "docs/guide.md"), ("gen_*", "src/gen_api.py")],
+    )
+    def test_glob_excludes_match_whole_names(self, tmp_path, pattern, excluded):
+        """Glob excludes only skip names they match in full."""
+        write_files(tmp_path, "src/app.py", "docs/guide.md", "src/gen_api.py")
+        utility = make_utility(exclude_patterns=[pattern])
+
+        paths = found_paths(utility, tmp_path)
+
+        assert os.path.normpath(excluded) not in paths
+        assert os.path.join("src", "app.py") in paths
+
+
+class TestSummaryReuse:
+    """Reuse of stored summaries for unchanged project content."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a small project to summarize."""
+        write_files(tmp_path, "src/app.py", "README.md")
+        return tmp_path
+
+    @staticmethod
+    def fake_generation(utility, monkeypatch):
+        """Replace summary generation with a call recorder."""
+        calls = []
+
+        async def fake_generate(content_chunks, summary_types):
+            calls.append(list(summary_types))
+            return [f"{summary_type} #{len(calls)}" for summary_type in summary_types]
+
+        monkeypatch.setattr(utility, "_generate_summaries", fake_generate)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_reuses_stored_summaries(
+        self, project, monkeypatch
+    ):
+        """A second run over the same files generates nothing."""
+        utility = make_utility(summary_types=["code_overview", "api_docs"])
+        calls = self.fake_generation(utility, monkeypatch)
+        context = {"project_dir": str(project)}
+
+        first = await utility.execute(context)
+        second = await utility.execute(context)
+
+        assert calls == [["code_overview", "api_docs"]]
+        assert second.metadata["reused_summaries"] == 2
+        assert second.output["summaries"] == first.output["summaries"]
+
+    @pytest.mark.asyncio
+    async def test_changed_content_regenerates(self, project, monkeypatch):
+        """Changing a summarized file invalidates the stored summaries."""
+        utility = make_utility()
+        calls = self.fake_generation(utility, monkeypatch)
+        context = {"project_dir": str(project)}
+
+        await utility.execute(context)
+        (project / "src" / "app.py").write_text("# app\nprint('changed')\n")
+        result = await utility.execute(context)
+
+        assert len(calls) == 2
+        assert result.metadata["reused_summaries"] == 0
+        assert all(
+            summary.endswith("#2") for summary in result.output["summaries"].values()
+        )
+
+    @pytest.mark.asyncio
+    async def test_changed_model_regenerates(self, project, monkeypatch):
+        """Summaries stored for another model are not reused."""
+        utility = make_utility()
+        calls = self.fake_generation(utility, monkeypatch)
+        context = {"project_dir": str(project)}
+
+        await utility.execute(context)
+        utility.config.parameters["model"] = "another-model"
+        await utility.execute(context)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_reuse_can_be_disabled(self, project, monkeypatch):
+        """reuse_summaries=False always generates fresh summaries."""
+        utility = make_utility(reuse_summaries=False)
+        calls = self.fake_generation(utility, monkeypatch)
+        context = {"project_dir": str(project)}
+
+        await utility.execute(context)
+        result = await utility.execute(context)
+
+        assert len(calls) == 2
+        assert result.metadata["reused_summaries"] == 0
+
+
+class TestContentSizes:
+    """File sizes, totals and the chunk budget are all counted in bytes."""
+
+    @pytest.mark.asyncio
+    async def test_sizes_are_bytes_on_every_path(self, tmp_path):
+        """Small, non-ASCII, CRLF and oversized files all report st_size."""
+        (tmp_path / "ascii.py").write_bytes(b"print('hi')\n")
+        (tmp_path / "unicode.py").write_bytes("print('héllo ✓')\n".encode())
+        (tmp_path / "crlf.py").write_bytes(b"a = 1\r\nb = 2\r\n")
+        (tmp_path / "big.py").write_bytes(b"x = 1\n" * 200)
+        utility = make_utility(chunk_size=1000)
+
+        content = await utility._collect_project_content(str(tmp_path))
+
+        files = content["files"]
+        for name, file_info in files.items():
+            assert file_info["size"] == (tmp_path / name).stat().st_size
+        assert "digest" not in files["big.py"]
+        assert content["metadata"]["total_size"] == sum(
+            path.stat().st_size for path in tmp_path.iterdir()
+        )
+
+    @pytest.mark.asyncio
+    async def test_chunks_split_on_byte_budget(self, tmp_path):
+        """Files that together exceed chunk_size bytes go to separate chunks."""
+        # 300 characters but 599 bytes each
+        (tmp_path / "a.py").write_text("é" * 299 + "\n", encoding="utf-8")
+        (tmp_path / "b.py").write_text("ü" * 299 + "\n", encoding="utf-8")
+        utility = make_utility(chunk_size=1000)
+
+        content = await utility._collect_project_content(str(tmp_path))
+        chunks = utility._format_content_chunks(content)
+
+        assert len(chunks) == 2
+        assert "Total Size: 1198 bytes" in chunks[0]
+        assert all(len(chunk.encode("utf-8")) <= 1000 for chunk in chunks)
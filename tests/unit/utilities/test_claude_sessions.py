@@ -0,0 +1,103 @@
+"""Tests for Claude CLI session pooling."""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from apex.utilities.base import UtilityCategory
+from apex.utilities.builtin import (
+    ArchivistUtility,
+    _ask_claude_once,
+    _ClaudeSessionPool,
+)
+
+# Answers every turn with the whole conversation it has seen so far
+FAKE_CLAUDE = textwrap.dedent("""
+    import json
+    import sys
+
+    history = []
+    for line in sys.stdin:
+        message = json.loads(line)["message"]
+        history.append("".join(part["text"] for part in message["content"]))
+        reply = "\\n=== TURN ===\\n".join(history)
+        print(json.dumps({"type": "result", "subtype": "success", "result": reply}))
+        sys.stdout.flush()
+    """)
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Put a fake ``claude`` CLI that echoes its conversation on PATH."""
+    script = tmp_path / "claude"
+    script.write_text(f"#!{sys.executable}{FAKE_CLAUDE}")
+    script.chmod(0o755)
+
+    monkeypatch.setenv("PATH", str(tmp_path), prepend=os.pathsep)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+
+@pytest.fixture
+def archivist():
+    """Create an Archivist utility with default configuration."""
+    config = ArchivistUtility.get_default_config(
+        "archivist", UtilityCategory.DOCUMENTATION
+    )
+    return ArchivistUtility(config)
+
+
+class TestClaudeSessionPool:
+    """Conversations never mix prompts about different content."""
+
+    @pytest.mark.asyncio
+    async def test_each_prompt_sees_only_its_own_context(self, fake_claude, archivist):
+        """Summaries and merges only see the content they were asked about."""
+        async with _ClaudeSessionPool("test-model") as claude:
+            first_a = await archivist._generate_summary(
+                "CHUNK-A", "code_overview", claude
+            )
+            first_b = await archivist._generate_summary(
+                "CHUNK-B", "code_overview", claude
+            )
+            second_a = await archivist._generate_summary(
+                "CHUNK-A", "architecture", claude
+            )
+            merged = await archivist._merge_summaries(
+                ["PART-ONE", "PART-TWO"], "code_overview", claude
+            )
+
+        assert "CHUNK-A" in first_a and "CHUNK-B" not in first_a
+        assert "CHUNK-B" in first_b and "CHUNK-A" not in first_b
+        assert "CHUNK-B" not in second_a
+        assert "CHUNK-" not in merged and "PART-ONE" in merged
+
+        # The session holding CHUNK-A is reused, sending only the instruction
+        turns = second_a.split("=== TURN ===")
+        assert len(turns) == 2
+        assert "CHUNK-A" in turns[0] and "CHUNK-A" not in turns[1]
+
+    @pytest.mark.asyncio
+    async def test_sessions_without_context_start_fresh(self, fake_claude):
+        """Prompts checked out without a context never share a conversation."""
+        async with _ClaudeSessionPool("test-model") as claude:
+            async with claude.session() as session:
+                await session.ask("FIRST PROMPT")
+            async with claude.session() as session:
+                reply = await session.ask("SECOND PROMPT")
+
+        assert "FIRST PROMPT" not in reply
+
+
+class TestAskClaudeOnce:
+    """One-off prompts run in their own conversation."""
+
+    @pytest.mark.asyncio
+    async def test_prompts_do_not_share_a_conversation(self, fake_claude):
+        """Each call starts and closes its own CLI session."""
+        first = await _ask_claude_once("test-model", "FIRST PROMPT")
+        second = await _ask_claude_once("test-model", "SECOND ", "PROMPT")
+
+        assert first == "FIRST PROMPT"
+        assert second == "SECOND PROMPT"
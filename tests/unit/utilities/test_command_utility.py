@@ -0,0 +1,78 @@
+"""Tests for CommandUtility and BuildUtility."""
+
+import shlex
+import sys
+
+import pytest
+
+from apex.utilities.base import CommandUtility, UtilityCategory, UtilityConfig
+from apex.utilities.builtin import BuildUtility
+
+PYTHON = shlex.quote(sys.executable)
+
+
+def make_config(**parameters):
+    """Create a command utility config with the given parameters."""
+    return UtilityConfig(
+        name="command", category=UtilityCategory.MAINTENANCE, parameters=parameters
+    )
+
+
+class TestCommandUtility:
+    """Command splitting and environment handling."""
+
+    @pytest.mark.asyncio
+    async def test_quoted_arguments_are_kept_together(self):
+        """Exec'd commands are split like a shell would split them."""
+        utility = CommandUtility(
+            make_config(), f"{PYTHON} -c \"print('a  b')\"", shell=False
+        )
+
+        result = await utility.execute({})
+
+        assert result.errors == []
+        assert result.output["stdout"] == "a  b\n"
+
+    @pytest.mark.asyncio
+    async def test_parent_environment_is_inherited(self, monkeypatch):
+        """Parent variables reach the command; context and config override."""
+        monkeypatch.setenv("UV_NO_SYNC", "1")
+        monkeypatch.setenv("APEX_TEST_VAR", "parent")
+        config = make_config()
+        config.environment_variables["APEX_TEST_VAR"] = "configured"
+        script = (
+            "import os; print(os.environ.get('UV_NO_SYNC'), "
+            "os.environ.get('APEX_TEST_VAR'), os.environ.get('APEX_CONTEXT_VAR'))"
+        )
+        utility = CommandUtility(config, f"{PYTHON} -c {shlex.quote(script)}")
+
+        result = await utility.execute({"env": {"APEX_CONTEXT_VAR": "context"}})
+
+        assert result.output["stdout"] == "1 configured context\n"
+
+
+class TestBuildUtility:
+    """Choosing between the shell and direct execution."""
+
+    @pytest.mark.asyncio
+    async def test_plain_command_is_execd(self):
+        """A command without shell syntax runs without a shell."""
+        utility = BuildUtility(make_config(command=f"{PYTHON} --version"))
+
+        assert utility.shell is None
+        result = await utility.execute({})
+
+        assert result.errors == []
+        assert result.output["stdout"].startswith("Python ")
+
+    @pytest.mark.asyncio
+    async def test_shell_syntax_from_parameters_uses_shell(self):
+        """Shell syntax substituted into the template still gets a shell."""
+        utility = BuildUtility(
+            make_config(command="{python} -c {code}", python=PYTHON, code="'print(2)'")
+        )
+
+        result = await utility.execute({})
+
+        assert result.errors == []
+        assert result.output["stdout"] == "2\n"
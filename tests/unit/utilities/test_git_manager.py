@@ -0,0 +1,234 @@
+"""Tests for GitManagerUtility."""
+
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from apex.utilities import builtin
+from apex.utilities.base import UtilityCategory, UtilityStatus
+from apex.utilities.builtin import GitManagerUtility
+
+
+def _git(repo, *args):
+    """Run a git command in the repository and return its output."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture(params=["pygit2", "cli"])
+def git_repo(request, tmp_path, monkeypatch):
+    """Create a Git repository with one commit, on the pygit2 or CLI path."""
+    if request.param == "cli":
+        monkeypatch.setattr(builtin, "pygit2", None)
+    elif builtin.pygit2 is None:
+        pytest.skip("pygit2 is not installed")
+
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    (tmp_path / "README.md").write_text("# Project\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Initial commit")
+    return tmp_path
+
+
+def make_utility(**parameters):
+    """Create a Git manager utility with overridden parameters."""
+    config = GitManagerUtility.get_default_config(
+        "git_manager", UtilityCategory.MAINTENANCE
+    )
+    config.parameters.update(parameters)
+    return GitManagerUtility(config)
+
+
+class TestStagedDiff:
+    """Staged diff reading and committing of large change sets."""
+
+    @pytest.mark.asyncio
+    async def test_summary_is_complete_when_patch_is_capped(self, git_repo):
+        """Numstat and stat cover every file even when the patch is cut."""
+        for i in range(300):
+            (git_repo / f"file_{i}.txt").write_text(f"line {i}\n")
+        _git(git_repo, "add", ".")
+
+        utility = make_utility()
+        numstat, stat, patch, truncated = await utility._get_staged_diff(
+            str(git_repo), 2000
+        )
+
+        assert truncated is True
+        assert len(patch) == 2000
+        assert len(numstat.splitlines()) == 300
+        assert "300 files changed" in stat
+
+    @pytest.mark.asyncio
+    async def test_commits_staged_set_larger_than_max_diff_size(
+        self, git_repo, monkeypatch
+    ):
+        """A staged set beyond max_diff_size is committed, not skipped."""
+        for i in range(300):
+            (git_repo / f"file_{i}.txt").write_text(f"line {i}\n")
+
+        utility = make_utility(max_diff_size=2000, cache_messages=False)
+        prompts = []
+
+        async def fake_generate(diff_output, status_output, cache=None):
+            prompts.append(diff_output)
+            return "Add generated files"
+
+        monkeypatch.setattr(utility, "_generate_commit_message", fake_generate)
+
+        result = await utility.execute(
+            {"project_dir": str(git_repo), "operation": "commit"}
+        )
+
+        assert result.status == UtilityStatus.COMPLETED
+        assert "No staged changes to commit" not in result.warnings
+        assert "300 files changed" in prompts[0]
+        assert prompts[0].endswith("[... diff truncated ...]")
+        assert _git(git_repo, "log", "-1", "--format=%s").strip() == (
+            "Add generated files"
+        )
+        assert _git(git_repo, "status", "--porcelain") == ""
+
+
+class TestCommitMessage:
+    """Commit message generation through the Anthropic API."""
+
+    @pytest.mark.asyncio
+    async def test_api_request_is_short_and_low_temperature(self, monkeypatch):
+        """The commit message request keeps max_tokens=200, temperature=0.1."""
+        requests = []
+
+        class FakeMessages:
+            async def create(self, **kwargs):
+                requests.append(kwargs)
+                block = SimpleNamespace(type="text", text="fix: handle empty input")
+                return SimpleNamespace(content=[block])
+
+        client = SimpleNamespace(messages=FakeMessages())
+        monkeypatch.setattr(builtin, "_api_client", lambda: client)
+
+        utility = make_utility()
+        message = await utility._generate_commit_message("diff", "M file.py\n")
+
+        assert message == "fix: handle empty input"
+        assert requests[0]["max_tokens"] == 200
+        assert requests[0]["temperature"] == 0.1
+
+
+class TestTrivialCommitMessage:
+    """Local commit messages for small changes."""
+
+    @pytest.mark.parametrize(
+        "numstat, expected",
+        [
+            ("2\t1\tdocs/guide.md\n", "docs: update guide.md"),
+            ("1\t0\ttests/test_app.py\n", "test: update test_app.py"),
+            ("3\t0\tsrc/app.py\n", "chore: update app.py"),
+            ("1\t1\tsrc/a.py\n1\t1\tsrc/b.py\n", "chore: update 2 files"),
+            ("-\t-\tassets/logo.png\n", "chore: update logo.png"),
+        ],
+    )
+    def test_small_change_gets_template_message(self, numstat, expected):
+        """Changes below the threshold are described without the LLM."""
+        assert make_utility()._generate_trivial_commit_message(numstat) == expected
+
+    @pytest.mark.parametrize(
+        "numstat",
+        [
+            "200\t40\tdocs/guide.md\n",
+            "120\t0\ttests/test_app.py\n",
+            "8\t2\tsrc/app.py\n",
+            "5\t0\tsrc/a.py\n5\t0\tsrc/b.py\n",
+        ],
+    )
+    def test_large_change_needs_llm(self, numstat):
+        """Changes at or above the threshold are left to the LLM, any category."""
+        assert make_utility()._generate_trivial_commit_message(numstat) is None
+
+    def test_threshold_zero_disables_templates(self):
+        """trivial_change_lines=0 always defers to the LLM."""
+        utility = make_utility(trivial_change_lines=0)
+
+        assert utility._generate_trivial_commit_message("1\t0\tREADME.md\n") is None
+
+
+class TestPorcelainFromV2:
+    """Conversion of porcelain v2 status records to porcelain v1 lines."""
+
+    def test_record_kinds(self):
+        """Ordinary, renamed, unmerged and untracked records are converted."""
+        oid = "0" * 40
+        records = [
+            f"1 .M N... 100644 100644 100644 {oid} {oid} src/app.py",
+            f"1 A. N... 000000 100644 100644 {oid} {oid} new file.py",
+            f"2 R. N... 100644 100644 100644 {oid} {oid} R100 new.py",
+            "old.py",
+            f"u UU N... 100644 100644 100644 100644 {oid} {oid} {oid} c.py",
+            "? notes/",
+        ]
+        data = "".join(f"{record}\0" for record in records).encode()
+
+        assert builtin._porcelain_from_v2(data) == (
+            " M src/app.py\n"
+            "A  new file.py\n"
+            "R  old.py -> new.py\n"
+            "UU c.py\n"
+            "?? notes/\n"
+        )
+
+    def test_empty_status(self):
+        """A clean tree has no status lines."""
+        assert builtin._porcelain_from_v2(b"") == ""
+
+
+class TestGetStatus:
+    """Working tree status from pygit2 and from the git CLI."""
+
+    @pytest.fixture
+    def dirty_repo(self, git_repo):
+        """Add staged, modified, deleted and untracked changes to the repo."""
+        (git_repo / "old name.txt").write_text("old\n")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "Add file")
+
+        (git_repo / "README.md").write_text("# Project\n\nMore.\n")
+        (git_repo / "new.py").write_text("print('new')\n")
+        _git(git_repo, "add", "new.py")
+        _git(git_repo, "rm", "-q", "old name.txt")
+        (git_repo / "with space.txt").write_text("untracked\n")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.txt").write_text("untracked\n")
+        return git_repo
+
+    @pytest.mark.asyncio
+    async def test_porcelain_lines(self, dirty_repo):
+        """Both backends report the same unquoted porcelain lines."""
+        status = await make_utility()._get_status(str(dirty_repo))
+
+        assert sorted(status.splitlines()) == [
+            " M README.md",
+            "?? build/",
+            "?? with space.txt",
+            "A  new.py",
+            "D  old name.txt",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_untracked_files_can_be_skipped(self, dirty_repo):
+        """untracked=False leaves untracked entries out."""
+        status = await make_utility()._get_status(str(dirty_repo), untracked=False)
+
+        assert sorted(status.splitlines()) == [
+            " M README.md",
+            "A  new.py",
+            "D  old name.txt",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_clean_tree(self, git_repo):
+        """A clean working tree has an empty status."""
+        assert await make_utility()._get_status(str(git_repo)) == ""
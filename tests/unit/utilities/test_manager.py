@@ -0,0 +1,91 @@
+"""Tests for UtilityManager plan execution."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from apex.utilities.base import UtilityResult, UtilityStatus
+from apex.utilities.manager import UtilityExecutionPlan, UtilityManager
+
+
+def make_result(utility_name, status):
+    """Create a finished result with the given status."""
+    return UtilityResult(
+        utility_id=utility_name,
+        status=status,
+        started_at=datetime.now().isoformat(),
+    )
+
+
+@pytest.fixture
+def manager():
+    """Create a utility manager with mocked memory."""
+    memory = MagicMock()
+    memory.mcp.write = AsyncMock()
+    return UtilityManager(memory)
+
+
+class TestExecutePlan:
+    """Online scheduling and failure handling of execution plans."""
+
+    @pytest.mark.asyncio
+    async def test_dependent_starts_before_slow_sibling_finishes(self, manager):
+        """A utility starts once its own dependencies finish."""
+        dependent_started = asyncio.Event()
+        started = []
+
+        async def fake_execute(utility_name, context, async_execution=False):
+            started.append(utility_name)
+            if utility_name == "slow":
+                # Only finishes once the dependent of its sibling has started
+                await asyncio.wait_for(dependent_started.wait(), timeout=5)
+            elif utility_name == "dependent":
+                dependent_started.set()
+            return make_result(utility_name, UtilityStatus.COMPLETED)
+
+        manager.execute_utility = fake_execute
+        plan = UtilityExecutionPlan("plan-online")
+        plan.add_utility("fast")
+        plan.add_utility("slow")
+        plan.add_utility("dependent", ["fast"])
+
+        results = await manager.execute_plan(plan, {})
+
+        assert started.index("dependent") > started.index("fast")
+        assert {name: result.status for name, result in results.items()} == {
+            "fast": UtilityStatus.COMPLETED,
+            "slow": UtilityStatus.COMPLETED,
+            "dependent": UtilityStatus.COMPLETED,
+        }
+        manager.memory.mcp.write.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stop_on_failure_reports_cancelled_siblings(self, manager):
+        """Running siblings of a failed utility are reported as cancelled."""
+        cancelled = []
+
+        async def fake_execute(utility_name, context, async_execution=False):
+            if utility_name == "failing":
+                return make_result(utility_name, UtilityStatus.FAILED)
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(utility_name)
+                raise
+            return make_result(utility_name, UtilityStatus.COMPLETED)
+
+        manager.execute_utility = fake_execute
+        plan = UtilityExecutionPlan("plan-stop")
+        plan.add_utility("failing")
+        plan.add_utility("slow")
+        plan.add_utility("after_slow", ["slow"])
+
+        results = await manager.execute_plan(plan, {}, stop_on_failure=True)
+
+        assert cancelled == ["slow"]
+        assert set(results) == {"failing", "slow"}
+        assert results["failing"].status == UtilityStatus.FAILED
+        assert results["slow"].status == UtilityStatus.CANCELLED
+        assert results["slow"].errors == ["Cancelled after failing failed"]
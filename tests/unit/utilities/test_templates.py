@@ -0,0 +1,127 @@
+"""Tests for UtilityTemplateManager custom templates."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from apex.utilities import templates
+from apex.utilities.base import UtilityCategory
+from apex.utilities.templates import (
+    ParameterTemplate,
+    UtilityTemplate,
+    UtilityTemplateManager,
+)
+
+PREFIX = "/utilities/templates/custom/"
+
+
+def make_template(name):
+    """Create a minimal command template."""
+    return UtilityTemplate(
+        name=name,
+        category=UtilityCategory.MAINTENANCE,
+        description=f"{name} template",
+        execution_type="command",
+        command_template="echo {name}",
+    )
+
+
+@pytest.fixture
+def store():
+    """Create stored template JSON by key."""
+    return {
+        f"{PREFIX}custom_lint": make_template("Lint").model_dump_json(),
+        f"{PREFIX}custom_format": make_template("Format").model_dump_json(),
+    }
+
+
+@pytest.fixture
+def manager(store, monkeypatch):
+    """Create a template manager over an in-memory template store."""
+    # Only custom templates are under test here
+    monkeypatch.setattr(templates, "_builtin_templates", dict)
+
+    memory = MagicMock()
+    memory.mcp.list_keys = AsyncMock(side_effect=lambda prefix: list(store))
+    memory.mcp.read = AsyncMock(side_effect=lambda key: store.get(key))
+    memory.mcp.write = AsyncMock(side_effect=store.__setitem__)
+    return UtilityTemplateManager(memory)
+
+
+class TestCustomTemplateCache:
+    """Reuse of loaded custom templates while the stored keys are unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_keys_reuse_loaded_templates(self, manager):
+        """A second load lists keys but reads no templates."""
+        first = await manager._load_custom_templates()
+        second = await manager._load_custom_templates()
+
+        assert set(first) == {"custom_lint", "custom_format"}
+        assert second == first
+        assert manager.memory.mcp.read.await_count == 2
+        assert manager.memory.mcp.list_keys.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_new_key_reloads(self, manager, store):
+        """A template stored by another writer is picked up."""
+        await manager._load_custom_templates()
+        store[f"{PREFIX}custom_test"] = make_template("Test").model_dump_json()
+
+        loaded = await manager._load_custom_templates()
+
+        assert set(loaded) == {"custom_lint", "custom_format", "custom_test"}
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates(self, manager):
+        """Overwriting a template under an existing key is picked up."""
+        await manager._load_custom_templates()
+        changed = make_template("Lint")
+        changed.description = "changed"
+
+        await manager.save_custom_template(changed)
+        loaded = await manager._load_custom_templates()
+
+        assert loaded["custom_lint"].description == "changed"
+
+    @pytest.mark.asyncio
+    async def test_failed_read_is_not_cached(self, manager, store):
+        """A load with an unreadable template is retried next time."""
+        store[f"{PREFIX}custom_broken"] = "{not json"
+        await manager._load_custom_templates()
+        store[f"{PREFIX}custom_broken"] = make_template("Broken").model_dump_json()
+
+        loaded = await manager._load_custom_templates()
+
+        assert "custom_broken" in loaded
+
+
+class TestExportImport:
+    """Exporting templates to files and importing them back."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, manager, store, tmp_path):
+        """An exported template imports back unchanged."""
+        template = make_template("Release")
+        template.parameters = [
+            ParameterTemplate(
+                name="tag",
+                type="string",
+                description='Tag such as "v1.0"\nor "latest"',
+                required=True,
+                validation={"pattern": r"^v\d+"},
+            )
+        ]
+        template.environment_variables = {"UV_NO_SYNC": "1"}
+        template_id = await manager.save_custom_template(template)
+        export_path = tmp_path / "release.json"
+
+        assert await manager.export_template(template_id, str(export_path))
+        exported = json.loads(export_path.read_text(encoding="utf-8"))
+        del store[f"{PREFIX}{template_id}"]
+
+        assert exported["template_id"] == template_id
+        assert exported["export_version"] == "1.0"
+        assert await manager.import_template(str(export_path)) == template_id
+        assert await manager.get_template(template_id) == template